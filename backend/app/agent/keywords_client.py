@@ -8,11 +8,20 @@ Key design changes:
 - Detection output is optional context, not the primary input
 """
 
+import io
 import time
 import base64
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
+import itertools
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import Executor
+from typing import AsyncIterator, Dict, List, Literal, Optional, Any, Tuple, Union
 import httpx
+import orjson
+from PIL import Image
 
 from app.config import get_settings
 from app.models import Detection, TrackedObject
@@ -20,6 +29,158 @@ from app.models import Detection, TrackedObject
 model_name = "anthropic/claude-3-5-haiku-latest"
 logger = logging.getLogger(__name__)
 
+# Stop sequences that cut off rambling past the requested format
+STOP_SEQUENCES = ["\n\nExample", "\n\nDISALLOWED"]
+
+# Tight budget so the rule-based fallback kicks in within ~9s on tail latency
+REALTIME_TIMEOUT = httpx.Timeout(connect=2.0, read=8.0, write=4.0, pool=2.0)
+# Escalated budget for callers that would rather wait than fall back
+RELAXED_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+Urgency = Literal["realtime", "relaxed"]
+
+# How long a rate-limited (HTTP 429) API key is skipped when no Retry-After is given
+RATE_LIMIT_COOLDOWN_SECONDS = 5.0
+
+# Streamed descriptions are flushed early after this many deltas even
+# without a sentence break
+STREAM_EARLY_CHUNKS = 20
+
+# Distinct object groups included in a prompt; duplicates are counted, not repeated
+MAX_CONTEXT_LABELS = 8
+
+# Lookup tables for the spatial buckets used in detection context
+POSITIONS = ("left", "center", "right")
+DISTANCES = ("close", "nearby", "distant")
+
+
+def _bucket(cx: float, area: float) -> tuple[int, int]:
+    """Map a box center and area to (POSITIONS, DISTANCES) indices."""
+    pos_idx = 0 if cx < 0.35 else (2 if cx > 0.65 else 1)
+    dist_idx = 0 if area > 0.15 else (1 if area > 0.05 else 2)
+    return pos_idx, dist_idx
+
+
+# Frames larger than this (longest edge, px) are downscaled before upload
+MAX_IMAGE_EDGE = 1024
+JPEG_QUALITY = 78
+# Recently prepared frames, keyed by a digest of the raw input
+IMAGE_CACHE_SIZE = 32
+
+_image_cache: "OrderedDict[bytes, Tuple[str, int]]" = OrderedDict()
+_image_cache_lock = threading.Lock()
+
+
+def _dhash(img: Image.Image) -> int:
+    """64-bit difference hash; near-identical frames differ in only a few bits."""
+    pixels = list(img.convert("L").resize((9, 8), Image.BILINEAR).getdata())
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            bits = (bits << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return bits
+
+
+def _to_image_url(image_base64: str) -> str:
+    """Wrap plain base64 in a JPEG data URL; data URLs are returned as-is."""
+    if image_base64.startswith("data:"):
+        return image_base64
+    return f"data:image/jpeg;base64,{image_base64}"
+
+
+def _prepare_image(image: Union[bytes, str]) -> Tuple[str, int]:
+    """
+    Turn raw image bytes or base64 into a compact JPEG data URL.
+    
+    JPEGs already within MAX_IMAGE_EDGE are passed through untouched; anything
+    else (PNG, oversized frames) is downscaled with LANCZOS and re-encoded,
+    which cuts upload size and therefore request latency.
+    
+    Returns:
+        Tuple of (data_url, perceptual_hash)
+    """
+    raw = image.encode("ascii") if isinstance(image, str) else image
+    key = hashlib.blake2b(raw, digest_size=16).digest()
+    with _image_cache_lock:
+        cached = _image_cache.get(key)
+        if cached is not None:
+            _image_cache.move_to_end(key)
+            return cached
+    
+    if isinstance(image, str):
+        payload = image.partition(",")[2] if image.startswith("data:") else image
+        image_bytes = base64.b64decode(payload)
+    else:
+        image_bytes = image
+    
+    img = Image.open(io.BytesIO(image_bytes))
+    if img.format == "JPEG" and max(img.size) <= MAX_IMAGE_EDGE:
+        # Already compact: reuse the caller's base64 rather than encoding again
+        if isinstance(image, str):
+            image_url = _to_image_url(image)
+        else:
+            image_url = _to_image_url(base64.b64encode(image_bytes).decode("ascii"))
+        # Only the hash needs pixels; let the JPEG decoder skip most of them
+        img.draft("L", (64, 64))
+        image_hash = _dhash(img)
+    else:
+        img.thumbnail((MAX_IMAGE_EDGE, MAX_IMAGE_EDGE), Image.LANCZOS)
+        if img.mode in ("RGBA", "LA", "P"):
+            # Flatten transparency onto white rather than JPEG's default black
+            img = img.convert("RGBA")
+            background = Image.new("RGB", img.size, (255, 255, 255))
+            background.paste(img, mask=img.getchannel("A"))
+            img = background
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+        buf = io.BytesIO()
+        img.save(buf, "JPEG", quality=JPEG_QUALITY, optimize=True)
+        image_url = _to_image_url(base64.b64encode(buf.getvalue()).decode("ascii"))
+        image_hash = _dhash(img)
+    
+    prepared = (image_url, image_hash)
+    with _image_cache_lock:
+        _image_cache[key] = prepared
+        if len(_image_cache) > IMAGE_CACHE_SIZE:
+            _image_cache.popitem(last=False)
+    return prepared
+
+
+class SceneCache:
+    """
+    LRU of LLM responses keyed by perceptual image hash plus request context.
+    
+    Consecutive video frames are near-identical, so a lookup also accepts an
+    entry whose hash is within max_distance bits of the new frame.
+    """
+    
+    def __init__(self, maxsize: int = 64, max_distance: int = 4):
+        self.maxsize = maxsize
+        self.max_distance = max_distance
+        self._entries: "OrderedDict[Tuple[Any, int], str]" = OrderedDict()
+    
+    def get(self, context: Tuple, image_hash: int) -> Optional[str]:
+        key = (context, image_hash)
+        if key not in self._entries:
+            # Near-duplicate scan; the cache is small so a linear pass is cheap
+            key = next(
+                (
+                    (ctx, h) for ctx, h in reversed(self._entries)
+                    if ctx == context and (h ^ image_hash).bit_count() <= self.max_distance
+                ),
+                None
+            )
+            if key is None:
+                return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+    
+    def put(self, context: Tuple, image_hash: int, description: str) -> None:
+        self._entries[(context, image_hash)] = description
+        self._entries.move_to_end((context, image_hash))
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
 
 # System prompt for navigation and scene understanding
 SCENE_NARRATOR_PROMPT = """
@@ -53,6 +214,14 @@ BAD EXAMPLES (NEVER DO THIS):
 Remember: You are a COMMANDER. Give an ORDER.
 """
 
+# Fields shared by every chat completion request; per-call payloads extend it
+_BASE_PAYLOAD: Dict[str, Any] = {
+    "model": model_name,
+    # Keywords AI specific fields
+    "customer_identifier": "aeye-demo",
+}
+_SCENE_SYSTEM_MESSAGE = {"role": "system", "content": SCENE_NARRATOR_PROMPT}
+
 class KeywordsAIClient:
     """
     Client for Keywords AI API with multimodal vision support.
@@ -68,75 +237,172 @@ class KeywordsAIClient:
         self.base_url = self.settings.keywords_ai_base_url
         self.api_key = self.settings.keywords_ai_api_key
         
-        # HTTP client with connection pooling
-        self.client = httpx.AsyncClient(
+        # Bounds concurrent LLM calls to respect Keywords AI rate limits
+        self._semaphore = asyncio.Semaphore(self.settings.max_concurrent_llm)
+        
+        # One pooled client per API key; calls round-robin across them so
+        # throughput scales with the number of keys (each key is throttled separately)
+        self.clients = [
+            self._build_client(api_key)
+            for api_key in self.settings.keywords_ai_api_keys_list
+        ]
+        self._next_index = itertools.cycle(range(len(self.clients)))
+        self._cooldown_until = [0.0] * len(self.clients)
+        
+        # Reuses answers for repeated frames instead of paying for another LLM call
+        self.scene_cache = SceneCache()
+        
+        # Pool for frame downscaling/re-encoding; None uses the loop's default executor
+        self.executor: Optional[Executor] = None
+    
+    def _build_client(self, api_key: str) -> httpx.AsyncClient:
+        """Create an HTTP client with connection pooling and HTTP/2 multiplexing."""
+        # Pool settings live on the transport since it replaces the default one
+        return httpx.AsyncClient(
             base_url=self.base_url,
             headers={
-                "Authorization": f"Bearer {self.api_key}",
+                "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json"
             },
-            timeout=60.0  # Increased for vision models
+            timeout=REALTIME_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=256,
+                    max_keepalive_connections=128,
+                    # Outlive the gaps between live narrations so they
+                    # don't pay a fresh TLS handshake
+                    keepalive_expiry=60.0
+                )
+            )
         )
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP clients."""
+        for client in self.clients:
+            await client.aclose()
+    
+    async def warmup(self) -> None:
+        """Open a pooled connection up front so the first narration skips the TLS handshake."""
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*[
+                client.head("/", timeout=REALTIME_TIMEOUT) for client in self.clients
+            ])
+            logger.info(f"Keywords AI connection warmed up in {(time.perf_counter() - start) * 1000:.1f}ms")
+        except Exception as e:
+            logger.warning(f"Keywords AI warmup failed: {e!r}")
+    
+    def _timeout_for(self, urgency: Urgency) -> httpx.Timeout:
+        """Pick the request timeout for the given urgency."""
+        return RELAXED_TIMEOUT if urgency == "relaxed" else REALTIME_TIMEOUT
+    
+    def _next_client_index(self) -> int:
+        """Round-robin over clients, skipping keys cooling down after a 429."""
+        now = time.monotonic()
+        for _ in range(len(self.clients)):
+            index = next(self._next_index)
+            if self._cooldown_until[index] <= now:
+                return index
+        # Every key is rate limited; use the next one anyway
+        return next(self._next_index)
+    
+    async def _post(self, payload: Dict[str, Any], urgency: Urgency) -> Dict[str, Any]:
+        """POST a chat completion, bounded by the in-flight request limit."""
+        # orjson encodes the multi-MB image payload much faster than stdlib json;
+        # the client already sends Content-Type: application/json
+        body = orjson.dumps(payload)
+        index = self._next_client_index()
+        async with self._semaphore:
+            response = await self.clients[index].post(
+                "/chat/completions",
+                content=body,
+                timeout=self._timeout_for(urgency)
+            )
+        if response.status_code == 429:
+            self._start_cooldown(index, response)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    def _start_cooldown(self, index: int, response: httpx.Response) -> None:
+        """Skip a rate-limited key for its Retry-After seconds (or the default cooldown)."""
+        try:
+            cooldown = float(response.headers.get("Retry-After", RATE_LIMIT_COOLDOWN_SECONDS))
+        except ValueError:
+            cooldown = RATE_LIMIT_COOLDOWN_SECONDS
+        self._cooldown_until[index] = time.monotonic() + cooldown
+        logger.warning(f"Keywords AI key #{index} rate limited, cooling down")
+    
+    async def _resolve_image(
+        self,
+        image_base64: Optional[str],
+        image_bytes: Optional[bytes],
+        image_url: Optional[str]
+    ) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Resolve the image inputs of a generate_* call to (url, perceptual_hash).
+        
+        A hosted image_url is referenced directly and has no hash. Inline
+        frames are downscaled/re-encoded off the event loop. With no image
+        at all (text-only narration) both are None.
+        """
+        if image_url is not None:
+            return image_url, None
+        if image_bytes is None and image_base64 is None:
+            return None, None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            _prepare_image,
+            image_bytes if image_bytes is not None else image_base64
+        )
     
     def _format_detections_context(self, objects: List[TrackedObject]) -> str:
         """Format tracked objects as optional context (not primary input)."""
         if not objects:
             return ""
         
+        # Collapse repeats ("chair x3") to save prompt tokens in crowded scenes
+        groups: Counter = Counter()
+        for obj in objects:
+            pos_idx, dist_idx = _bucket(obj.bbox.center_x, obj.bbox.area)
+            groups[(obj.label, dist_idx, pos_idx)] += 1
+        
         lines = ["Detected objects for context:"]
-        for obj in objects[:10]:  # Limit to top 10
-            cx = obj.bbox.center_x
-            position = "left" if cx < 0.35 else ("right" if cx > 0.65 else "center")
-            area = obj.bbox.area
-            distance = "close" if area > 0.15 else ("nearby" if area > 0.05 else "distant")
-            lines.append(f"- {obj.label}: {distance}, {position}")
+        # Closest groups first; sort is stable so ties keep detection order
+        for label, dist_idx, pos_idx in sorted(groups, key=lambda g: g[1])[:MAX_CONTEXT_LABELS]:
+            count = groups[(label, dist_idx, pos_idx)]
+            name = f"{label} x{count}" if count > 1 else label
+            lines.append(f"- {name}: {DISTANCES[dist_idx]}, {POSITIONS[pos_idx]}")
         
         return "\n".join(lines)
     
-    async def generate_scene_description(
+    def _build_scene_payload(
         self,
-        image_base64: str,
-        objects: Optional[List[TrackedObject]] = None,
-        ocr_text: Optional[str] = None
-    ) -> tuple[str, float, Dict[str, Any]]:
+        image_url: Optional[str],
+        objects: Optional[List[TrackedObject]],
+        ocr_text: Optional[str]
+    ) -> Dict[str, Any]:
         """
-        Generate a rich scene description using multimodal vision.
+        Build the chat completion payload for a navigation scene description.
         
-        Args:
-            image_base64: Base64 encoded image (with or without data URL prefix)
-            objects: Optional list of detected objects for context
-            ocr_text: Optional OCR text found in scene
-            
-        Returns:
-            Tuple of (description, inference_time_ms, trace)
+        Without an image_url the description is written from the detections
+        alone, which makes for a much smaller, faster request.
         """
-        start = time.time()
-        
-        # Prepare image in OpenAI format (Keywords AI expects OpenAI format)
-        if "," in image_base64:
-            # Already has data URL prefix
-            if not image_base64.startswith("data:"):
-                # Malformed, extract just the base64 part
-                image_base64 = image_base64.split(",")[1]
-                image_url = f"data:image/jpeg;base64,{image_base64}"
-            else:
-                image_url = image_base64
-        else:
-            # Plain base64, add data URL prefix
-            image_url = f"data:image/jpeg;base64,{image_base64}"
-        
         # Build the user message in OpenAI format
         # Start with text prompt
-        text_parts = ["Describe this scene for a blind user. Provide rich spatial context and environmental understanding."]
+        if image_url is None:
+            text_parts = ["Describe this scene for a blind user from the detected objects below. Provide spatial context without inventing details."]
+        else:
+            text_parts = ["Describe this scene for a blind user. Provide rich spatial context and environmental understanding."]
         
         # Add detection context if available (but it doesn't dominate)
         if objects:
             context = self._format_detections_context(objects)
-            if context:
+            if context and image_url is None:
+                text_parts.append(f"\n\n{context}")
+            elif context:
                 text_parts.append(f"\n\n{context}\n\nUse these detections as supplementary context only. Focus on what you SEE in the image.")
         
         if ocr_text:
@@ -147,66 +413,120 @@ class KeywordsAIClient:
             {
                 "type": "text",
                 "text": "\n".join(text_parts)
-            },
-            {
+            }
+        ]
+        if image_url is not None:
+            user_content.append({
                 "type": "image_url",
                 "image_url": {
                     "url": image_url
                 }
-            }
-        ]
+            })
         
         # Keywords AI request payload with Claude Haiku for fast vision
         payload = {
-            "model": model_name,
+            **_BASE_PAYLOAD,
             "messages": [
-                {"role": "system", "content": SCENE_NARRATOR_PROMPT},
+                _SCENE_SYSTEM_MESSAGE,
                 {"role": "user", "content": user_content}
             ],
-            "max_tokens": 300,
+            "max_tokens": 160,
             "temperature": 0.4,
-            # Keywords AI specific fields
-            "customer_identifier": "aeye-demo",
+            "stop": STOP_SEQUENCES,
             "metadata": {
                 "feature": "multimodal_scene_description",
                 "has_objects": objects is not None,
                 "has_ocr": ocr_text is not None
             }
         }
+        return payload
+    
+    async def generate_scene_description(
+        self,
+        image_base64: Optional[str] = None,
+        objects: Optional[List[TrackedObject]] = None,
+        ocr_text: Optional[str] = None,
+        image_bytes: Optional[bytes] = None,
+        image_url: Optional[str] = None,
+        urgency: Urgency = "realtime"
+    ) -> tuple[str, float, Dict[str, Any]]:
+        """
+        Generate a rich scene description using multimodal vision.
         
-        trace = {
-            "request": {
-                "model": payload["model"],
-                "object_count": len(objects) if objects else 0,
-                "has_ocr": ocr_text is not None,
-                "has_image": True
-            }
-        }
+        Args:
+            image_base64: Base64 encoded image (with or without data URL prefix)
+            objects: Optional list of detected objects for context
+            ocr_text: Optional OCR text found in scene
+            image_bytes: Raw JPEG bytes; used instead of image_base64 when given
+            image_url: HTTPS URL of an already-hosted frame; takes precedence over inline data
+            urgency: "relaxed" waits up to 60s instead of failing fast to the fallback
+            
+        Returns:
+            Tuple of (description, inference_time_ms, trace)
+        """
+        start = time.perf_counter()
+        labels = tuple(sorted(obj.label for obj in objects)) if objects else ()
+        cache_context = (model_name, "multimodal_scene_description", ocr_text, labels)
+        trace: Dict[str, Any] = {}
         
         try:
-            response = await self.client.post(
-                "/chat/completions",
-                json=payload
-            )
-            response.raise_for_status()
+            # Prepare image in OpenAI format (Keywords AI expects OpenAI format);
+            # an undecodable upload takes the same fallback as an API error
+            image_url, image_hash = await self._resolve_image(image_base64, image_bytes, image_url)
+            if image_url is None and not objects:
+                return "", 0.0, {"skipped": "no image or objects"}
             
-            result = response.json()
+            if image_hash is not None:
+                cached = self.scene_cache.get(cache_context, image_hash)
+                if cached is not None:
+                    return cached, 0.0, {"cache": "hit"}
+            
+            payload = self._build_scene_payload(image_url, objects, ocr_text)
+            
+            trace = {
+                "request": {
+                    "model": payload["model"],
+                    "object_count": len(objects) if objects else 0,
+                    "has_ocr": ocr_text is not None,
+                    "has_image": image_url is not None
+                }
+            }
+            
+            result = await self._post(payload, urgency)
             
             description = result["choices"][0]["message"]["content"]
             
-            inference_time = (time.time() - start) * 1000
+            inference_time = (time.perf_counter() - start) * 1000
             
+            usage = result.get("usage", {})
             trace["response"] = {
                 "success": True,
-                "tokens_used": result.get("usage", {}),
+                "tokens_used": usage,
+                "completion_tokens": usage.get("completion_tokens"),
                 "inference_ms": inference_time
             }
             
-            logger.info(f"Multimodal scene description generated in {inference_time:.1f}ms")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Multimodal scene description generated in {inference_time:.1f}ms")
+            if image_hash is not None:
+                self.scene_cache.put(cache_context, image_hash, description.strip())
             return description.strip(), inference_time, trace
             
+        except httpx.TimeoutException as e:
+            inference_time = (time.perf_counter() - start) * 1000
+            logger.warning(f"Keywords AI timed out after {inference_time:.1f}ms: {e!r}")
+            trace["response"] = {
+                "success": False,
+                "timeout": True,
+                "error": repr(e),
+                "inference_ms": inference_time
+            }
+            
+            fallback = self._fallback_description(objects)
+            return fallback, inference_time, trace
+            
         except Exception as e:
-            inference_time = (time.time() - start) * 1000
+            inference_time = (time.perf_counter() - start) * 1000
             logger.error(f"Keywords AI error: {e}")
             trace["response"] = {
                 "success": False,
@@ -218,10 +538,135 @@ class KeywordsAIClient:
             fallback = self._fallback_description(objects)
             return fallback, inference_time, trace
     
+    async def generate_scene_descriptions_batch(
+        self,
+        items: List[Tuple[str, Optional[List[TrackedObject]], Optional[str]]]
+    ) -> List[tuple[str, float, Dict[str, Any]]]:
+        """
+        Generate scene descriptions for several frames concurrently.
+        
+        Args:
+            items: List of (image_base64, objects, ocr_text) tuples
+            
+        Returns:
+            List of (description, inference_time_ms, trace), in input order
+        """
+        return await asyncio.gather(*[
+            self.generate_scene_description(
+                image_base64=image_base64,
+                objects=objects,
+                ocr_text=ocr_text
+            )
+            for image_base64, objects, ocr_text in items
+        ])
+    
+    async def _stream(
+        self,
+        payload: Dict[str, Any],
+        urgency: Urgency
+    ) -> AsyncIterator[str]:
+        """POST a streaming chat completion and yield content deltas as they arrive."""
+        body = orjson.dumps({**payload, "stream": True})
+        index = self._next_client_index()
+        async with self._semaphore:
+            async with self.clients[index].stream(
+                "POST",
+                "/chat/completions",
+                content=body,
+                timeout=self._timeout_for(urgency)
+            ) as response:
+                if response.status_code == 429:
+                    self._start_cooldown(index, response)
+                response.raise_for_status()
+                
+                # Server-sent events: one "data: {json}" line per chunk
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    choices = orjson.loads(data).get("choices") or []
+                    if choices:
+                        delta = choices[0].get("delta", {}).get("content")
+                        if delta:
+                            yield delta
+    
+    async def stream_scene_description(
+        self,
+        image_base64: Optional[str] = None,
+        objects: Optional[List[TrackedObject]] = None,
+        ocr_text: Optional[str] = None,
+        image_bytes: Optional[bytes] = None,
+        image_url: Optional[str] = None,
+        urgency: Urgency = "realtime"
+    ) -> AsyncIterator[Tuple[str, bool]]:
+        """
+        Stream a scene description, yielding the first sentence as soon as it lands.
+        
+        Lets the speech pipeline start talking before the full completion
+        arrives. Takes the same arguments as generate_scene_description.
+        
+        Yields:
+            (text, is_final) tuples: at most one early partial (the first
+            sentence, or the first STREAM_EARLY_CHUNKS deltas), then the
+            complete description with is_final=True. Only a stream that
+            finished cleanly is cached.
+        """
+        start = time.perf_counter()
+        try:
+            image_url, image_hash = await self._resolve_image(image_base64, image_bytes, image_url)
+        except Exception as e:
+            logger.error(f"Could not prepare image for streaming: {e!r}")
+            yield self._fallback_description(objects), True
+            return
+        if image_url is None and not objects:
+            yield "", True
+            return
+        
+        labels = tuple(sorted(obj.label for obj in objects)) if objects else ()
+        cache_context = (model_name, "multimodal_scene_description", ocr_text, labels)
+        if image_hash is not None:
+            cached = self.scene_cache.get(cache_context, image_hash)
+            if cached is not None:
+                yield cached, True
+                return
+        
+        payload = self._build_scene_payload(image_url, objects, ocr_text)
+        
+        parts: List[str] = []
+        sent_partial = False
+        try:
+            async for delta in self._stream(payload, urgency):
+                parts.append(delta)
+                if sent_partial:
+                    continue
+                text = "".join(parts)
+                end = min((i for i in (text.find(m) for m in ".?!") if i != -1), default=-1)
+                if end != -1 or len(parts) >= STREAM_EARLY_CHUNKS:
+                    sent_partial = True
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"First sentence streamed in {(time.perf_counter() - start) * 1000:.1f}ms")
+                    yield (text[:end + 1] if end != -1 else text).strip(), False
+        except Exception as e:
+            # A cut-off stream is never cached; say what arrived, else fall back
+            logger.error(f"Keywords AI streaming error: {e!r}")
+            description = "".join(parts).strip()
+            yield description or self._fallback_description(objects), True
+            return
+        
+        description = "".join(parts).strip()
+        if image_hash is not None and description:
+            self.scene_cache.put(cache_context, image_hash, description)
+        yield description, True
+    
     async def generate_text_narration(
         self,
-        image_base64: str,
-        ocr_text: str
+        image_base64: Optional[str] = None,
+        ocr_text: str = "",
+        image_bytes: Optional[bytes] = None,
+        image_url: Optional[str] = None,
+        urgency: Urgency = "realtime"
     ) -> tuple[str, float, Dict[str, Any]]:
         """
         Generate a narration for detected text, using vision to provide context.
@@ -229,65 +674,82 @@ class KeywordsAIClient:
         Args:
             image_base64: Base64 encoded image
             ocr_text: Raw OCR text detected
+            image_bytes: Raw JPEG bytes; used instead of image_base64 when given
+            image_url: HTTPS URL of an already-hosted frame; takes precedence over inline data
+            urgency: "relaxed" waits up to 60s instead of failing fast to the fallback
             
         Returns:
             Tuple of (narration, inference_time_ms, trace)
         """
-        start = time.time()
-        
-        # Prepare image in OpenAI format
-        if "," in image_base64:
-            if not image_base64.startswith("data:"):
-                image_base64 = image_base64.split(",")[1]
-                image_url = f"data:image/jpeg;base64,{image_base64}"
-            else:
-                image_url = image_base64
-        else:
-            image_url = f"data:image/jpeg;base64,{image_base64}"
+        start = time.perf_counter()
+        cache_context = (model_name, "text_narration", ocr_text)
         
         text_prompt = f"""The following text was detected in this image:
 "{ocr_text}"
 
 Read this text naturally for a blind user. If it's a sign, menu, or label, explain what it says and what it might be (e.g., "This appears to be a menu board listing..." or "This sign says...").
 Keep it natural and informative, as if you're reading aloud to someone."""
-        
-        payload = {
-            "model": model_name,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": text_prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": image_url
-                            }
-                        }
-                    ]
-                }
-            ],
-            "max_tokens": 200,
-            "temperature": 0.3,
-            "customer_identifier": "aeye-demo",
-            "metadata": {"feature": "text_narration"}
-        }
-        
-        trace = {"request": {"model": payload["model"], "has_image": True}}
+        trace: Dict[str, Any] = {}
         
         try:
-            response = await self.client.post("/chat/completions", json=payload)
-            response.raise_for_status()
-            result = response.json()
+            # Prepare image in OpenAI format; an undecodable upload takes the
+            # same fallback as an API error
+            image_url, image_hash = await self._resolve_image(image_base64, image_bytes, image_url)
+            
+            if image_hash is not None:
+                cached = self.scene_cache.get(cache_context, image_hash)
+                if cached is not None:
+                    return cached, 0.0, {"cache": "hit"}
+            
+            # Without an image the model reads the OCR text alone
+            user_content = [{"type": "text", "text": text_prompt}]
+            if image_url is not None:
+                user_content.append({
+                    "type": "image_url",
+                    "image_url": {
+                        "url": image_url
+                    }
+                })
+            
+            payload = {
+                **_BASE_PAYLOAD,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": user_content
+                    }
+                ],
+                "max_tokens": 120,
+                "temperature": 0.3,
+                "stop": STOP_SEQUENCES,
+                "metadata": {"feature": "text_narration"}
+            }
+            
+            trace = {"request": {"model": payload["model"], "has_image": image_url is not None}}
+            
+            result = await self._post(payload, urgency)
             
             narration = result["choices"][0]["message"]["content"]
-            inference_time = (time.time() - start) * 1000
+            inference_time = (time.perf_counter() - start) * 1000
             
-            trace["response"] = {"success": True, "inference_ms": inference_time}
+            trace["response"] = {
+                "success": True,
+                "completion_tokens": result.get("usage", {}).get("completion_tokens"),
+                "inference_ms": inference_time
+            }
+            if image_hash is not None:
+                self.scene_cache.put(cache_context, image_hash, narration.strip())
             return narration.strip(), inference_time, trace
             
+        except httpx.TimeoutException as e:
+            inference_time = (time.perf_counter() - start) * 1000
+            logger.warning(f"Text narration timed out after {inference_time:.1f}ms: {e!r}")
+            trace["response"] = {"success": False, "timeout": True, "error": repr(e)}
+            
+            return f"The text reads: {ocr_text}", inference_time, trace
+            
         except Exception as e:
-            inference_time = (time.time() - start) * 1000
+            inference_time = (time.perf_counter() - start) * 1000
             logger.error(f"Text narration error: {e}")
             trace["response"] = {"success": False, "error": str(e)}
             
@@ -296,9 +758,12 @@ Keep it natural and informative, as if you're reading aloud to someone."""
     
     async def generate_detailed_scene_description(
         self,
-        image_base64: str,
+        image_base64: Optional[str] = None,
         ocr_text: Optional[str] = None,
-        objects: Optional[List[TrackedObject]] = None
+        objects: Optional[List[TrackedObject]] = None,
+        image_bytes: Optional[bytes] = None,
+        image_url: Optional[str] = None,
+        urgency: Urgency = "realtime"
     ) -> tuple[str, float, Dict[str, Any]]:
         """
         Generate a comprehensive, detailed scene description with OCR text.
@@ -314,21 +779,17 @@ Keep it natural and informative, as if you're reading aloud to someone."""
             image_base64: Base64 encoded image
             ocr_text: Optional OCR text detected from the scene
             objects: Optional list of detected objects
+            image_bytes: Raw JPEG bytes; used instead of image_base64 when given
+            image_url: HTTPS URL of an already-hosted frame; takes precedence over inline data
+            urgency: "relaxed" waits up to 60s instead of failing fast to the fallback
             
         Returns:
             Tuple of (detailed_description, inference_time_ms, trace)
         """
-        start = time.time()
+        start = time.perf_counter()
         
-        # Prepare image in OpenAI format
-        if "," in image_base64:
-            if not image_base64.startswith("data:"):
-                image_base64 = image_base64.split(",")[1]
-                image_url = f"data:image/jpeg;base64,{image_base64}"
-            else:
-                image_url = image_base64
-        else:
-            image_url = f"data:image/jpeg;base64,{image_base64}"
+        labels = tuple(sorted(obj.label for obj in objects)) if objects else ()
+        cache_context = (model_name, "detailed_scene_description", ocr_text, labels)
         
         # Build detailed prompt - concise but comprehensive
         prompt_parts = [
@@ -354,7 +815,16 @@ Keep it natural and informative, as if you're reading aloud to someone."""
             ])
         
         if objects and len(objects) > 0:
-            obj_summary = ", ".join([f"{obj.label}" for obj in objects[:10]])
+            # Count repeats and list the nearest (largest) labels first
+            counts = Counter(obj.label for obj in objects)
+            nearest: Dict[str, float] = {}
+            for obj in objects:
+                nearest[obj.label] = max(nearest.get(obj.label, 0.0), obj.bbox.area)
+            top_labels = sorted(counts, key=lambda label: -nearest[label])[:MAX_CONTEXT_LABELS]
+            obj_summary = ", ".join(
+                f"{label}({counts[label]})" if counts[label] > 1 else label
+                for label in top_labels
+            )
             prompt_parts.extend([
                 "",
                 f"DETECTED: {obj_summary}",
@@ -366,54 +836,59 @@ Keep it natural and informative, as if you're reading aloud to someone."""
         
         detailed_prompt = "\n".join(prompt_parts)
         
-        user_content = [
-            {"type": "text", "text": detailed_prompt},
-            {
-                "type": "image_url",
-                "image_url": {
-                    "url": image_url
-                }
-            }
-        ]
+        trace: Dict[str, Any] = {}
         
-        # Keywords AI request payload
-        payload = {
-            "model": model_name,
-            "messages": [
-                {"role": "user", "content": user_content}
-            ],
-            "max_tokens": 200,  # Shorter response for concise descriptions
-            "temperature": 0.4,
-            "customer_identifier": "aeye-demo",
-            "metadata": {
-                "feature": "detailed_scene_description",
-                "has_objects": objects is not None,
-                "has_ocr": ocr_text is not None
+        try:
+            # Prepare image in OpenAI format; an undecodable upload takes the
+            # same fallback as an API error
+            image_url, image_hash = await self._resolve_image(image_base64, image_bytes, image_url)
+            if image_url is None and not objects and not ocr_text:
+                return "", 0.0, {"skipped": "no image, objects or text"}
+            
+            if image_hash is not None:
+                cached = self.scene_cache.get(cache_context, image_hash)
+                if cached is not None:
+                    return cached, 0.0, {"cache": "hit"}
+            
+            user_content = [{"type": "text", "text": detailed_prompt}]
+            if image_url is not None:
+                user_content.append({
+                    "type": "image_url",
+                    "image_url": {
+                        "url": image_url
+                    }
+                })
+            
+            # Keywords AI request payload
+            payload = {
+                **_BASE_PAYLOAD,
+                "messages": [
+                    {"role": "user", "content": user_content}
+                ],
+                "max_tokens": 200,  # Shorter response for concise descriptions
+                "temperature": 0.4,
+                "metadata": {
+                    "feature": "detailed_scene_description",
+                    "has_objects": objects is not None,
+                    "has_ocr": ocr_text is not None
+                }
             }
-        }
-        
-        trace = {
-            "request": {
-                "model": payload["model"],
-                "object_count": len(objects) if objects else 0,
-                "has_ocr": ocr_text is not None,
-                "has_image": True,
-                "max_tokens": 200
+            
+            trace = {
+                "request": {
+                    "model": payload["model"],
+                    "object_count": len(objects) if objects else 0,
+                    "has_ocr": ocr_text is not None,
+                    "has_image": image_url is not None,
+                    "max_tokens": 200
+                }
             }
-        }
-        
-        try:
-            response = await self.client.post(
-                "/chat/completions",
-                json=payload
-            )
-            response.raise_for_status()
             
-            result = response.json()
+            result = await self._post(payload, urgency)
             
             description = result["choices"][0]["message"]["content"]
             
-            inference_time = (time.time() - start) * 1000
+            inference_time = (time.perf_counter() - start) * 1000
             
             trace["response"] = {
                 "success": True,
@@ -421,11 +896,27 @@ Keep it natural and informative, as if you're reading aloud to someone."""
                 "inference_ms": inference_time
             }
             
-            logger.info(f"Detailed scene description generated in {inference_time:.1f}ms")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Detailed scene description generated in {inference_time:.1f}ms")
+            if image_hash is not None:
+                self.scene_cache.put(cache_context, image_hash, description.strip())
             return description.strip(), inference_time, trace
             
+        except httpx.TimeoutException as e:
+            inference_time = (time.perf_counter() - start) * 1000
+            logger.warning(f"Keywords AI detailed description timed out after {inference_time:.1f}ms: {e!r}")
+            trace["response"] = {
+                "success": False,
+                "timeout": True,
+                "error": repr(e),
+                "inference_ms": inference_time
+            }
+            
+            fallback = self._fallback_detailed_description(objects, ocr_text)
+            return fallback, inference_time, trace
+            
         except Exception as e:
-            inference_time = (time.time() - start) * 1000
+            inference_time = (time.perf_counter() - start) * 1000
             logger.error(f"Keywords AI detailed description error: {e}")
             trace["response"] = {
                 "success": False,
@@ -4,20 +4,32 @@ Handles prioritization, novelty detection, cooldowns, and speech gating.
 """
 
 import time
+import asyncio
 import logging
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
+import numpy as np
 
 from app.config import get_settings
 from app.models import (
     Detection, TrackedObject, AgentAction, AgentStepRequest, 
-    AgentStepResponse, AgentTrace, GateDecision, ScoredObject, AgentMode
+    AgentStepResponse, AgentTrace, GateDecision, ScoredObject, AgentMode, ReasonFlag
 )
-from app.perception.tracker import ObjectTracker, get_tracker
+from app.perception.tracker import ObjectTracker, TrackArrays, get_tracker
 
 
 logger = logging.getLogger(__name__)
 
+# Numba is optional: it JIT-compiles the scoring kernel, otherwise NumPy is used
+NUMBA_AVAILABLE = False
+njit = None
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    logger.info("Numba not available, using NumPy object scoring")
+
 
 # Class weights for priority scoring
 CLASS_WEIGHTS = {
@@ -30,6 +42,32 @@ CLASS_WEIGHTS = {
     "stairs": 0.9,
 }
 
+# Integer ids for the weighted classes; anything else maps to the trailing
+# default slot (weight 0.5)
+LABEL_TO_IDX: Dict[str, int] = {label: i for i, label in enumerate(CLASS_WEIGHTS)}
+DEFAULT_LABEL_IDX = len(LABEL_TO_IDX)
+CLASS_WEIGHT_LUT = np.full(DEFAULT_LABEL_IDX + 1, 0.5)
+CLASS_WEIGHT_LUT[:DEFAULT_LABEL_IDX] = list(CLASS_WEIGHTS.values())
+
+# Reason bits as plain ints so the (optionally JIT-compiled) kernel can use them
+R_IN_PATH = int(ReasonFlag.IN_PATH)
+R_VERY_CLOSE = int(ReasonFlag.VERY_CLOSE)
+R_CLOSE = int(ReasonFlag.CLOSE)
+R_NEARBY = int(ReasonFlag.NEARBY)
+R_APPROACHING = int(ReasonFlag.APPROACHING)
+R_MOVING = int(ReasonFlag.MOVING)
+R_NEW = int(ReasonFlag.NEW)
+
+# How often (in frames) stale cooldown/novelty entries are swept
+PRUNE_INTERVAL_FRAMES = 300
+
+# Pending telemetry events; when full, new events are dropped rather than
+# slowing down step()
+TELEMETRY_QUEUE_SIZE = 256
+
+# Number of scored objects the agent looks at (trace shows the top 5)
+TOP_K = 5
+
 # Position templates for speech
 POSITION_TEMPLATES = {
     "left": ["on your left", "to the left"],
@@ -38,7 +76,100 @@ POSITION_TEMPLATES = {
 }
 
 
-@dataclass
+def _score_loop(label_idx, cx, area, vx, vy, approaching, is_new, class_weight_lut):
+    """
+    Score objects and build reason bitmasks (compiled with Numba when available).
+    
+    Returns:
+        Tuple of (scores float64[N], reasons_mask int64[N])
+    """
+    n = label_idx.shape[0]
+    scores = np.empty(n, dtype=np.float64)
+    masks = np.zeros(n, dtype=np.int64)
+    for i in range(n):
+        # Class weight
+        score = class_weight_lut[label_idx[i]]
+        mask = 0
+        
+        # In-path weight (center of view is priority)
+        if 0.35 <= cx[i] <= 0.65:
+            score += 1.0
+            mask |= R_IN_PATH
+        
+        # Proximity (larger bbox = closer)
+        if area[i] > 0.30:
+            score += 2.0
+            mask |= R_VERY_CLOSE
+        elif area[i] > 0.15:
+            score += 1.5
+            mask |= R_CLOSE
+        elif area[i] > 0.05:
+            score += 0.5
+            mask |= R_NEARBY
+        
+        # Approaching
+        if approaching[i]:
+            score += 1.5
+            mask |= R_APPROACHING
+        
+        # Motion
+        if abs(vx[i]) > 0.03 or abs(vy[i]) > 0.03:
+            score += 0.5
+            mask |= R_MOVING
+        
+        # Novelty bonus (newly seen)
+        if is_new[i]:
+            score += 0.5
+            mask |= R_NEW
+        
+        scores[i] = score
+        masks[i] = mask
+    return scores, masks
+
+
+def _score_numpy(label_idx, cx, area, vx, vy, approaching, is_new, class_weight_lut):
+    """Vectorized NumPy equivalent of _score_loop, used when Numba is missing."""
+    in_path = (cx >= 0.35) & (cx <= 0.65)
+    very_close = area > 0.30
+    close = ~very_close & (area > 0.15)
+    nearby = ~very_close & ~close & (area > 0.05)
+    moving = (np.abs(vx) > 0.03) | (np.abs(vy) > 0.03)
+    
+    scores = class_weight_lut[label_idx]
+    scores += np.where(in_path, 1.0, 0.0)
+    scores += np.select([very_close, close, nearby], [2.0, 1.5, 0.5], 0.0)
+    scores += np.where(approaching, 1.5, 0.0)
+    scores += np.where(moving, 0.5, 0.0)
+    scores += np.where(is_new, 0.5, 0.0)
+    
+    masks = (
+        in_path * R_IN_PATH
+        | very_close * R_VERY_CLOSE
+        | close * R_CLOSE
+        | nearby * R_NEARBY
+        | approaching * R_APPROACHING
+        | moving * R_MOVING
+        | is_new * R_NEW
+    ).astype(np.int64)
+    return scores, masks
+
+
+_score_kernel = njit(cache=True)(_score_loop) if NUMBA_AVAILABLE else _score_numpy
+
+
+def warmup_scoring_kernel() -> None:
+    """Compile _score_kernel with the per-frame dtypes so frame 1 skips the JIT."""
+    if not NUMBA_AVAILABLE:
+        return
+    floats = np.empty(0, dtype=np.float64)
+    flags = np.empty(0, dtype=bool)
+    _score_kernel(
+        np.empty(0, dtype=np.intp), floats, floats, floats, floats,
+        flags, flags, CLASS_WEIGHT_LUT
+    )
+
+
+@dataclass(slots=True)
 class AgentState:
     """Persistent state for the agent across frames."""
     
@@ -55,8 +186,14 @@ class AgentState:
     # Object memory for novelty detection
     seen_objects: Dict[int, float] = field(default_factory=dict)  # id -> first_seen
     
+    # Tracked objects from the latest frame, by track id
+    objects_by_id: Dict[int, TrackedObject] = field(default_factory=dict)
+    
     # Speech history
     speech_count: int = 0
+    
+    # Frames processed, used to schedule state pruning
+    frame_count: int = 0
 
 
 class AssistiveAgent:
@@ -84,6 +221,11 @@ class AssistiveAgent:
         self.cooldown_seconds = self.settings.agent_cooldown_seconds
         self.global_rate_limit = self.settings.agent_global_rate_limit_seconds
         self.proximity_override = self.settings.agent_proximity_override_threshold
+        
+        # Off-critical-path work (state pruning, decision logging) handled by
+        # run_telemetry_worker(); done inline when no worker is running
+        self._telemetry: asyncio.Queue = asyncio.Queue(maxsize=TELEMETRY_QUEUE_SIZE)
+        self._telemetry_running = False
     
     def reset(self) -> None:
         """Reset agent state."""
@@ -100,13 +242,15 @@ class AssistiveAgent:
         
         # Update tracker with new detections
         tracked_objects = self.tracker.update(request.detections, timestamp)
+        objects_by_id = {obj.id: obj for obj in tracked_objects}
+        self.state.objects_by_id = objects_by_id
         
         # Score all objects
-        scored = self._score_objects(tracked_objects, timestamp)
+        scored = self._score_objects(tracked_objects, timestamp, self.tracker.arrays)
         
         # Apply gating logic
         action, text, gates, reason = self._apply_gates(
-            scored, tracked_objects, timestamp, request.mode
+            scored, objects_by_id, timestamp, request.mode
         )
         
         # Build trace for transparency
@@ -118,27 +262,124 @@ class AssistiveAgent:
         
         # Update state if speaking
         if action == AgentAction.SPEAK and text:
-            self.state.last_speech_time = timestamp
-            self.state.last_speech_text = text
-            self.state.speech_count += 1
-            
-            # Mark objects as spoken
-            for obj in scored[:3]:  # Top 3 objects
-                self.state.object_cooldowns[obj.id] = timestamp
-                if obj.label not in self.state.class_cooldowns:
-                    self.state.class_cooldowns[obj.label] = timestamp
-        
-        return AgentStepResponse(
+            self._record_speech(text, scored, timestamp)
+        
+        self._count_frame(timestamp)
+        
+        response = AgentStepResponse(
             timestamp=timestamp,
             action=action,
             text=text,
             trace=trace
         )
+        if self._telemetry_running and logger.isEnabledFor(logging.DEBUG):
+            self._emit(("decision", response))
+        return response
+    
+    def should_call_llm(
+        self,
+        tracked_objects: List[TrackedObject],
+        timestamp: float,
+        mode: AgentMode = AgentMode.LIVE_ASSIST
+    ) -> bool:
+        """
+        Check whether the gates would let this frame speak, without changing state.
+        
+        Lets callers skip the (slow, paid) narration LLM call on frames the
+        agent would stay silent on anyway. Scores this frame's objects, not
+        the shared tracker arrays, which a concurrent request may have moved on.
+        """
+        scored = self._score_objects(tracked_objects, timestamp, update_state=False)
+        objects_by_id = {obj.id: obj for obj in tracked_objects}
+        action, _, _, _ = self._apply_gates(scored, objects_by_id, timestamp, mode)
+        return action == AgentAction.SPEAK
+    
+    def record_narration(
+        self,
+        tracked_objects: List[TrackedObject],
+        timestamp: float,
+        text: Optional[str]
+    ) -> None:
+        """
+        Record a frame narrated outside step() (e.g. by the LLM in /live).
+        
+        Updates novelty and, when text was spoken, the speech cooldowns, so
+        later should_call_llm() checks see the same state step() would leave.
+        Runs after the narration await, so it scores the frame's own objects
+        rather than the tracker arrays, which may belong to a newer frame.
+        """
+        scored = self._score_objects(tracked_objects, timestamp)
+        if text:
+            self._record_speech(text, scored, timestamp)
+        self._count_frame(timestamp)
+    
+    def _record_speech(self, text: str, scored: List[ScoredObject], timestamp: float) -> None:
+        """Update speech history and cooldowns after speaking."""
+        self.state.last_speech_time = timestamp
+        self.state.last_speech_text = text
+        self.state.speech_count += 1
+        
+        # Mark objects as spoken
+        for obj in scored[:3]:  # Top 3 objects
+            self.state.object_cooldowns[obj.id] = timestamp
+            if obj.label not in self.state.class_cooldowns:
+                self.state.class_cooldowns[obj.label] = timestamp
+    
+    def _count_frame(self, timestamp: float) -> None:
+        """Advance the frame counter and prune stale state periodically."""
+        self.state.frame_count += 1
+        if self.state.frame_count % PRUNE_INTERVAL_FRAMES == 0:
+            if self._telemetry_running:
+                self._emit(("prune", timestamp))
+            else:
+                self._prune_state(timestamp)
+    
+    def _emit(self, event: Tuple) -> None:
+        """Queue a telemetry event without blocking; drops it if the worker is behind."""
+        try:
+            self._telemetry.put_nowait(event)
+        except asyncio.QueueFull:
+            pass
+    
+    async def run_telemetry_worker(self) -> None:
+        """
+        Drain telemetry events until cancelled.
+        
+        Runs as a background task so step() returns as soon as the decision
+        is made; pruning and trace logging happen between requests.
+        """
+        self._telemetry_running = True
+        try:
+            while True:
+                kind, payload = await self._telemetry.get()
+                if kind == "prune":
+                    self._prune_state(payload)
+                elif kind == "decision":
+                    logger.debug(f"Agent decision: {payload.model_dump_json()}")
+        finally:
+            self._telemetry_running = False
+    
+    def _prune_state(self, timestamp: float) -> None:
+        """Drop cooldown and novelty entries that can no longer affect a decision."""
+        cutoff = timestamp - max(self.cooldown_seconds * 4, 60.0)
+        self.state.object_cooldowns = {
+            k: v for k, v in self.state.object_cooldowns.items() if v >= cutoff
+        }
+        self.state.class_cooldowns = {
+            k: v for k, v in self.state.class_cooldowns.items() if v >= cutoff
+        }
+        # Track ids are never reused, so ids the tracker has dropped are gone for good
+        active = self.tracker.tracks
+        self.state.seen_objects = {
+            k: v for k, v in self.state.seen_objects.items() if k in active
+        }
     
     def _score_objects(
         self,
         objects: List[TrackedObject],
-        timestamp: float
+        timestamp: float,
+        arrays: Optional[TrackArrays] = None,
+        update_state: bool = True
     ) -> List[ScoredObject]:
         """
         Score objects by priority.
@@ -149,66 +390,61 @@ class AssistiveAgent:
         3. Proximity (closer = higher)
         4. Approaching (moving toward camera)
         5. Motion (moving objects more important)
+        
+        Scores and reason bitmasks are computed for all objects at once by
+        _score_kernel over the tracker's structure-of-arrays view; only the
+        TOP_K highest are selected (no full sort) and turned into
+        ScoredObjects, which is all the caller uses. With update_state=False newly seen
+        objects are not recorded.
         """
-        scored = []
-        
-        for obj in objects:
-            score = 0.0
-            reasons = []
-            
-            # Class weight
-            class_weight = CLASS_WEIGHTS.get(obj.label, 0.5)
-            score += class_weight
-            
-            # In-path weight (center of view is priority)
-            cx = obj.bbox.center_x
-            if 0.35 <= cx <= 0.65:
-                score += 1.0
-                reasons.append("in_path")
-            
-            # Proximity (larger bbox = closer)
-            area = obj.bbox.area
-            if area > 0.30:
-                score += 2.0
-                reasons.append("very_close")
-            elif area > 0.15:
-                score += 1.5
-                reasons.append("close")
-            elif area > 0.05:
-                score += 0.5
-                reasons.append("nearby")
-            
-            # Approaching
-            if obj.is_approaching:
-                score += 1.5
-                reasons.append("approaching")
-            
-            # Motion
-            if abs(obj.velocity_x) > 0.03 or abs(obj.velocity_y) > 0.03:
-                score += 0.5
-                reasons.append("moving")
-            
-            # Novelty bonus (newly seen)
-            if obj.id not in self.state.seen_objects:
-                self.state.seen_objects[obj.id] = timestamp
-                score += 0.5
-                reasons.append("new")
-            
-            scored.append(ScoredObject(
-                id=obj.id,
-                label=obj.label,
-                score=score,
-                reasons=reasons
-            ))
-        
-        # Sort by score descending
-        scored.sort(key=lambda x: x.score, reverse=True)
-        return scored
+        if not objects:
+            return []
+        # Only reuse the arrays if they describe exactly these tracks
+        if arrays is None or not np.array_equal(arrays.ids, [o.id for o in objects]):
+            arrays = TrackArrays.from_objects(objects)
+        
+        label_idx = np.fromiter(
+            (LABEL_TO_IDX.get(label, DEFAULT_LABEL_IDX) for label in arrays.labels),
+            dtype=np.intp,
+            count=len(arrays.labels)
+        )
+        
+        # Novelty needs the seen-set, so it is resolved before the kernel
+        seen = self.state.seen_objects
+        is_new = np.array([int(tid) not in seen for tid in arrays.ids], dtype=bool)
+        if update_state:
+            for tid in arrays.ids[is_new]:
+                seen[int(tid)] = timestamp
+        
+        score, reasons_mask = _score_kernel(
+            label_idx, arrays.cx, arrays.area, arrays.vx, arrays.vy,
+            arrays.approaching, is_new, CLASS_WEIGHT_LUT
+        )
+        
+        # Top-K by score descending; ties keep tracker order. Partition first
+        # so only the candidates (including any ties at the cut) get sorted.
+        neg = -score
+        if len(neg) > TOP_K:
+            cut = np.partition(neg, TOP_K - 1)[TOP_K - 1]
+            candidates = np.flatnonzero(neg <= cut)
+        else:
+            candidates = np.arange(len(neg))
+        order = candidates[np.argsort(neg[candidates], kind="stable")[:TOP_K]]
+        
+        return [
+            ScoredObject(
+                id=int(arrays.ids[i]),
+                label=arrays.labels[i],
+                score=float(score[i]),
+                reasons_mask=int(reasons_mask[i])
+            )
+            for i in order
+        ]
     
     def _apply_gates(
         self,
         scored: List[ScoredObject],
-        objects: List[TrackedObject],
+        objects_by_id: Dict[int, TrackedObject],
         timestamp: float,
         mode: AgentMode
     ) -> Tuple[AgentAction, Optional[str], GateDecision, str]:
@@ -227,7 +463,7 @@ class AssistiveAgent:
             return AgentAction.SILENT, None, gates, "no_objects"
         
         top_object = scored[0]
-        obj = next((o for o in objects if o.id == top_object.id), None)
+        obj = objects_by_id.get(top_object.id)
         
         if not obj:
             return AgentAction.SILENT, None, gates, "object_not_found"
@@ -246,7 +482,7 @@ class AssistiveAgent:
         gates.global_rate_ok = global_ok
         
         # Check proximity override
-        proximity_override = obj.bbox.area > 0.25 and "approaching" in top_object.reasons
+        proximity_override = obj.bbox.area > 0.25 and bool(top_object.reasons_mask & R_APPROACHING)
         gates.proximity_override = proximity_override
         
         # Decision logic
@@ -275,25 +511,19 @@ class AssistiveAgent:
         timestamp: float
     ) -> bool:
         """Check if this is novel information worth speaking."""
-        # New object
-        if "new" in scored.reasons:
-            return True
+        mask = scored.reasons_mask
         
-        # Approaching
-        if "approaching" in scored.reasons:
+        # New object, approaching, or entered center path
+        if mask & (R_NEW | R_APPROACHING | R_IN_PATH):
             return True
         
         # Changed from far to close
-        if "close" in scored.reasons or "very_close" in scored.reasons:
+        if mask & (R_CLOSE | R_VERY_CLOSE):
             # Check if we've mentioned this proximity before
             last_spoken = self.state.object_cooldowns.get(obj.id, 0)
             if timestamp - last_spoken > self.cooldown_seconds * 2:
                 return True
         
-        # Entered center path
-        if "in_path" in scored.reasons:
-            return True
-        
         return False
     
     def _check_cooldown(self, scored: ScoredObject, timestamp: float) -> bool:
@@ -320,13 +550,13 @@ class AssistiveAgent:
             position = "ahead"
         
         # Determine distance/urgency
-        if urgent or "very_close" in scored.reasons:
+        if urgent or scored.reasons_mask & R_VERY_CLOSE:
             prefix = "Careful! "
             distance = "very close"
-        elif "close" in scored.reasons:
+        elif scored.reasons_mask & R_CLOSE:
             prefix = ""
             distance = "close"
-        elif "approaching" in scored.reasons:
+        elif scored.reasons_mask & R_APPROACHING:
             prefix = ""
             distance = "approaching"
         else:
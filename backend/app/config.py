@@ -5,8 +5,8 @@ All secrets and settings are loaded from environment variables.
 
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from functools import lru_cache
-from typing import List
+from functools import cached_property, lru_cache
+from typing import List, Literal
 
 
 class Settings(BaseSettings):
@@ -18,16 +18,40 @@ class Settings(BaseSettings):
         default="https://api.keywordsai.co/api",
         description="Keywords AI base URL"
     )
+    keywords_ai_api_keys: str = Field(
+        default="",
+        description="Optional comma-separated extra API keys to load-balance across"
+    )
     
     # Model Configuration
     yolo_model: str = Field(default="yolov8n.pt", description="YOLO model file")
     yolo_confidence_threshold: float = Field(default=0.5, ge=0.0, le=1.0)
     ocr_languages: str = Field(default="en", description="Comma-separated OCR languages")
+    inference_workers: int = Field(
+        default=2, ge=1, le=16,
+        description="Threads running detection/OCR off the event loop"
+    )
+    torch_threads: int = Field(
+        default=0, ge=0, le=64,
+        description="PyTorch intra-op threads per worker process (0 = CPU cores / workers)"
+    )
     
     # Agent Configuration
     agent_cooldown_seconds: float = Field(default=4.0, ge=1.0, le=30.0)
     agent_global_rate_limit_seconds: float = Field(default=1.5, ge=0.5, le=10.0)
     agent_proximity_override_threshold: float = Field(default=0.15, ge=0.0, le=1.0)
+    max_concurrent_llm: int = Field(default=16, ge=1, le=256, description="Max in-flight LLM requests")
+    agent_gate_live_llm: bool = Field(
+        default=True,
+        description="Skip the /live narration LLM call on frames the agent would stay silent on"
+    )
+    narration_mode: Literal["hybrid", "vision_only", "text_only"] = Field(
+        default="hybrid",
+        description=(
+            "What /describe and /live narrate from: image plus detections, the image "
+            "alone (skips local detection), or detections alone (no image upload)"
+        )
+    )
     
     # IP Webcam Configuration (optional)
     ip_webcam_url: str = Field(
@@ -38,18 +62,35 @@ class Settings(BaseSettings):
     # Server Configuration
     host: str = Field(default="0.0.0.0")
     port: int = Field(default=8000)
+    workers: int = Field(
+        default=1, ge=1, le=16,
+        description="Server processes; each keeps its own tracker and agent state"
+    )
     cors_origins: str = Field(default="http://localhost:3000")
     
     # Debug
     debug: bool = Field(default=False)
     log_level: str = Field(default="INFO")
     
-    @property
+    # The *_list views below are parsed once and cached on the (already
+    # process-wide) settings instance
+    
+    @cached_property
     def cors_origins_list(self) -> List[str]:
         """Parse CORS origins from comma-separated string."""
         return [origin.strip() for origin in self.cors_origins.split(",")]
     
-    @property
+    @cached_property
+    def keywords_ai_api_keys_list(self) -> List[str]:
+        """Primary API key followed by any extra keys, without duplicates."""
+        keys = [self.keywords_ai_api_key]
+        for key in self.keywords_ai_api_keys.split(","):
+            key = key.strip()
+            if key and key not in keys:
+                keys.append(key)
+        return keys
+    
+    @cached_property
     def ocr_languages_list(self) -> List[str]:
         """Parse OCR languages from comma-separated string."""
         return [lang.strip() for lang in self.ocr_languages.split(",")]
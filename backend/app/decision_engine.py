@@ -17,11 +17,13 @@ Responsibilities:
 5. Maintain anti-spam state and cooldown windows
 """
 
+import re
 import time
 import logging
-from typing import List, Optional, Dict, Tuple, Set
+from typing import Callable, List, Mapping, NamedTuple, Optional, Dict, Tuple, Set
 from enum import Enum
-from collections import defaultdict, deque
+from types import MappingProxyType
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 
 from app.models import Detection
@@ -47,19 +49,58 @@ class InferredMode(str, Enum):
     IDLE = "idle"                  # Safe, no threats, nothing immediate
 
 
+# Label sets used by the context detectors (compared against lowercased labels)
+NAV_OBJECTS = frozenset({
+    "person", "car", "bike", "motorcycle", "pole", "post",
+    "bench", "chair", "fire hydrant", "plant", "stop sign",
+})
+HAZARD_OBJECTS: Dict[str, Dict[str, object]] = {
+    "car": {"risk": "collision", "priority": 10},
+    "bicycle": {"risk": "collision", "priority": 8},
+    "motorcycle": {"risk": "collision", "priority": 9},
+    "person": {"risk": "collision", "priority": 5},
+    "knife": {"risk": "injury", "priority": 10},
+    "scissors": {"risk": "injury", "priority": 10},
+    "bus": {"risk": "large moving object", "priority": 9},
+    "truck": {"risk": "large moving object", "priority": 9},
+}
+# "step"/"stair" anywhere in the label (OCR can help); matches "stairs" too
+_STAIR_RE = re.compile(r"st(?:ep|air)", re.IGNORECASE)
+DOOR_OBJECTS = frozenset({"door", "entrance", "exit", "gate", "doorway"})
+# Labels preferred when picking what to announce in DOOR mode
+DOOR_TARGETS = frozenset({"door", "gate", "entrance", "exit"})
+TRANSPORT_LABELS = frozenset({"bus", "train", "subway", "platform"})
+TEXT_OBJECTS = frozenset({
+    "sign", "poster", "label", "book", "newspaper", "menu",
+    "screen", "display", "building number", "street sign",
+})
+
+
+def _lower_labels(detections: List[Detection]) -> List[str]:
+    """Lowercased labels, parallel to detections."""
+    return [d.label.lower() for d in detections]
+
+
 class ContextIndicators:
-    """Detect real-world context from detections to inform mode inference."""
+    """
+    Detect real-world context from detections to inform mode inference.
+    
+    Each detector optionally takes labels_lc, the detections' lowercased
+    labels, so a caller running several detectors lowercases only once.
+    """
     
     @staticmethod
-    def detect_navigation_context(detections: List[Detection]) -> Dict[str, bool]:
+    def detect_navigation_context(
+        detections: List[Detection],
+        labels_lc: Optional[List[str]] = None
+    ) -> Dict[str, bool]:
         """Detect if user is actively navigating."""
         if not detections:
             return {"is_navigating": False, "obstacles_count": 0}
+        labels_lc = labels_lc or _lower_labels(detections)
         
         # Count navigation-relevant objects
-        nav_objects = {"person", "car", "bike", "motorcycle", "pole", "post", 
-                       "bench", "chair", "fire hydrant", "plant", "stop sign"}
-        nav_count = sum(1 for d in detections if d.label.lower() in nav_objects)
+        nav_count = sum(1 for label in labels_lc if label in NAV_OBJECTS)
         
         return {
             "is_navigating": nav_count > 0,
@@ -68,32 +109,24 @@ class ContextIndicators:
         }
     
     @staticmethod
-    def detect_hazards(detections: List[Detection]) -> Dict[str, any]:
+    def detect_hazards(
+        detections: List[Detection],
+        labels_lc: Optional[List[str]] = None
+    ) -> Dict[str, any]:
         """Detect potential hazards (collision risk, sharp objects, etc)."""
-        hazard_objects = {
-            "car": {"risk": "collision", "priority": 10},
-            "bicycle": {"risk": "collision", "priority": 8},
-            "motorcycle": {"risk": "collision", "priority": 9},
-            "person": {"risk": "collision", "priority": 5},
-            "knife": {"risk": "injury", "priority": 10},
-            "scissors": {"risk": "injury", "priority": 10},
-            "bus": {"risk": "large moving object", "priority": 9},
-            "truck": {"risk": "large moving object", "priority": 9},
-        }
-        
+        labels_lc = labels_lc or _lower_labels(detections)
         hazards = []
-        for detection in detections:
-            if detection.label.lower() in hazard_objects:
-                distance_m = detection.distance_est_m or 999
-                # Only critical if close (< 2 meters)
-                if distance_m < 2.0:
-                    hazard_info = hazard_objects[detection.label.lower()].copy()
-                    hazard_info.update({
-                        "label": detection.label,
-                        "distance_m": distance_m,
-                        "zone": detection.zone,
-                    })
-                    hazards.append(hazard_info)
+        for detection, label in zip(detections, labels_lc):
+            meta = HAZARD_OBJECTS.get(label)
+            # Only critical if close (< 2 meters)
+            if meta is not None and (detection.distance_est_m or 999) < 2.0:
+                hazards.append({
+                    "risk": meta["risk"],
+                    "priority": meta["priority"],
+                    "label": detection.label,
+                    "distance_m": detection.distance_est_m,
+                    "zone": detection.zone,
+                })
         
         return {
             "has_hazard": len(hazards) > 0,
@@ -102,14 +135,15 @@ class ContextIndicators:
         }
     
     @staticmethod
-    def detect_stairs(detections: List[Detection]) -> Dict[str, any]:
+    def detect_stairs(
+        detections: List[Detection],
+        labels_lc: Optional[List[str]] = None
+    ) -> Dict[str, any]:
         """Detect stairs (currently no direct class, infer from geometry)."""
         # In practice: check for patterns, shadows, or use depth
-        # For now: simple heuristic
-        stair_keywords = ["step", "stair", "stairs", "stairs"]  # OCR can help
-        
+        # For now: simple heuristic (case-insensitive, so labels_lc isn't needed)
         for detection in detections:
-            if any(kw in detection.label.lower() for kw in stair_keywords):
+            if _STAIR_RE.search(detection.label):
                 return {
                     "has_stairs": True,
                     "type": detection.label,
@@ -119,11 +153,13 @@ class ContextIndicators:
         return {"has_stairs": False}
     
     @staticmethod
-    def detect_doors(detections: List[Detection]) -> Dict[str, any]:
+    def detect_doors(
+        detections: List[Detection],
+        labels_lc: Optional[List[str]] = None
+    ) -> Dict[str, any]:
         """Detect doors and entrances."""
-        door_objects = {"door", "entrance", "exit", "gate", "doorway"}
-        
-        doors = [d for d in detections if d.label.lower() in door_objects]
+        labels_lc = labels_lc or _lower_labels(detections)
+        doors = [d for d, label in zip(detections, labels_lc) if label in DOOR_OBJECTS]
         
         if doors:
             # Pick closest door
@@ -138,20 +174,26 @@ class ContextIndicators:
         return {"has_door": False}
     
     @staticmethod
-    def detect_traffic_light(detections: List[Detection]) -> Optional[Detection]:
+    def detect_traffic_light(
+        detections: List[Detection],
+        labels_lc: Optional[List[str]] = None
+    ) -> Optional[Detection]:
         """Detect traffic light for street crossing."""
-        for d in detections:
-            if d.label.lower() == "traffic light":
+        labels_lc = labels_lc or _lower_labels(detections)
+        for d, label in zip(detections, labels_lc):
+            if label == "traffic light":
                 return d
         return None
     
     @staticmethod
-    def detect_public_transport(detections: List[Detection]) -> Dict[str, any]:
+    def detect_public_transport(
+        detections: List[Detection],
+        labels_lc: Optional[List[str]] = None
+    ) -> Dict[str, any]:
         """Detect buses, trains, stations."""
-        transport_labels = {"bus", "train", "subway", "platform"}
-        
-        for detection in detections:
-            if detection.label.lower() in transport_labels:
+        labels_lc = labels_lc or _lower_labels(detections)
+        for detection, label in zip(detections, labels_lc):
+            if label in TRANSPORT_LABELS:
                 return {
                     "transport_type": detection.label,
                     "distance_m": detection.distance_est_m,
@@ -161,9 +203,13 @@ class ContextIndicators:
         return {}
     
     @staticmethod
-    def detect_queues(detections: List[Detection]) -> bool:
+    def detect_queues(
+        detections: List[Detection],
+        labels_lc: Optional[List[str]] = None
+    ) -> bool:
         """Detect if objects suggest a queue (multiple people in line pattern)."""
-        people = [d for d in detections if d.label.lower() == "person"]
+        labels_lc = labels_lc or _lower_labels(detections)
+        people = [d for d, label in zip(detections, labels_lc) if label == "person"]
         
         if len(people) >= 2:
             # Simple heuristic: people in similar zones = queue
@@ -174,12 +220,150 @@ class ContextIndicators:
         return False
     
     @staticmethod
-    def detect_text_context(detections: List[Detection]) -> bool:
+    def detect_text_context(
+        detections: List[Detection],
+        labels_lc: Optional[List[str]] = None
+    ) -> bool:
         """Check if signs or readable text likely present."""
-        text_objects = {"sign", "poster", "label", "book", "newspaper", "menu",
-                        "screen", "display", "building number", "street sign"}
-        
-        return any(d.label.lower() in text_objects for d in detections)
+        labels_lc = labels_lc or _lower_labels(detections)
+        return any(label in TEXT_OBJECTS for label in labels_lc)
+
+
+# Behavior hints per mode for get_mode_context
+_MODE_CONTEXT_HINTS: Dict[str, Dict[str, object]] = {
+    "navigation": {
+        "focus": "obstacle avoidance and collision prevention",
+        "urgency": "normal",
+        "allow_pauses": True,
+    },
+    "hazard": {
+        "focus": "immediate danger - prioritize urgent warning",
+        "urgency": "critical",
+        "allow_pauses": False,
+    },
+    "crossing": {
+        "focus": "safe street crossing - respect traffic signals",
+        "urgency": "critical",
+        "allow_pauses": False,
+    },
+    "stairs": {
+        "focus": "stairs navigation - safety and directional info",
+        "urgency": "high",
+        "allow_pauses": False,
+    },
+    "door": {
+        "focus": "door/entrance navigation",
+        "urgency": "normal",
+        "allow_pauses": True,
+    },
+    "reading": {
+        "focus": "text reading - offer support, let user decide",
+        "urgency": "low",
+        "allow_pauses": True,
+    },
+    "queue": {
+        "focus": "queue/line awareness",
+        "urgency": "low",
+        "allow_pauses": True,
+    },
+    "public_transport": {
+        "focus": "bus/train navigation",
+        "urgency": "high",
+        "allow_pauses": False,
+    },
+    "idle": {
+        "focus": "stay silent, let user focus",
+        "urgency": "none",
+        "allow_pauses": True,
+    },
+}
+
+# Frozen (read-only views) so no caller can change the shared table
+_MODE_CONTEXT: Mapping[str, Mapping[str, object]] = MappingProxyType({
+    mode: MappingProxyType(hints) for mode, hints in _MODE_CONTEXT_HINTS.items()
+})
+
+
+class FrameSummary(NamedTuple):
+    """
+    Per-detection values derived once per frame, parallel to detections.
+    
+    decide_speech builds this in one pass and hands it to the mode
+    inference and selection steps so they don't re-derive labels and
+    distances from the Detection objects.
+    """
+    detections: List[Detection]
+    labels: List[str]        # lowercased
+    distances: List[float]   # distance_est_m, or 999 when missing
+    
+    @classmethod
+    def build(cls, detections: List[Detection]) -> "FrameSummary":
+        """Summarize a frame in a single pass."""
+        labels: List[str] = []
+        distances: List[float] = []
+        for d in detections:
+            labels.append(d.label.lower())
+            distances.append(d.distance_est_m or 999)
+        return cls(list(detections), labels, distances)
+    
+    def subset(self, indices: List[int]) -> "FrameSummary":
+        """Summary of just the detections at the given indices."""
+        return FrameSummary(
+            [self.detections[i] for i in indices],
+            [self.labels[i] for i in indices],
+            [self.distances[i] for i in indices],
+        )
+
+
+# Cooldown windows measure elapsed time, so use a clock NTP can't step
+_now = time.monotonic
+
+
+# Max keys kept in each dedup/last-spoken table; oldest writes are evicted first
+DEDUP_MAX_ENTRIES = 512
+
+
+def _lru_set(table: "OrderedDict[str, float]", key: str, value: float) -> None:
+    """Set key as most recent and evict the oldest entry past DEDUP_MAX_ENTRIES."""
+    table[key] = value
+    table.move_to_end(key)
+    if len(table) > DEDUP_MAX_ENTRIES:
+        table.popitem(last=False)
+
+
+class RecentPhrases:
+    """
+    Last N spoken phrases with O(1) membership checks.
+    
+    A deque keeps the order for eviction and a count per phrase backs `in`,
+    so repeats of the same phrase are tracked correctly.
+    """
+    
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self._order: deque = deque()
+        self._counts: Dict[str, int] = {}
+    
+    def add(self, phrase: str) -> None:
+        """Remember a phrase, forgetting the oldest one past maxlen."""
+        if len(self._order) == self.maxlen:
+            oldest = self._order.popleft()
+            remaining = self._counts[oldest] - 1
+            if remaining:
+                self._counts[oldest] = remaining
+            else:
+                del self._counts[oldest]
+        self._order.append(phrase)
+        self._counts[phrase] = self._counts.get(phrase, 0) + 1
+    
+    def __contains__(self, phrase: object) -> bool:
+        return phrase in self._counts
+    
+    def __len__(self) -> int:
+        return len(self._order)
+    
+    def __iter__(self):
+        return iter(self._order)
 
 
 class DecisionEngine:
@@ -197,17 +381,32 @@ class DecisionEngine:
     
     def __init__(self):
         self.last_mode: Optional[InferredMode] = None
-        self.mode_change_time = time.time()
+        self.mode_change_time = _now()
         self.silence_until = 0  # Timestamp when to allow next speech
-        self.detection_dedup: Dict[str, float] = defaultdict(float)
-        self.recent_spoken_phrases: deque = deque(maxlen=15)
-        self.object_last_spoken: Dict[str, float] = defaultdict(float)
+        # Bounded LRUs so a long session doesn't accumulate every key ever seen
+        self.detection_dedup: "OrderedDict[str, float]" = OrderedDict()
+        self.recent_spoken_phrases = RecentPhrases(maxlen=15)
+        self.object_last_spoken: "OrderedDict[str, float]" = OrderedDict()
         self.context = ContextIndicators()
+        
+        # Mode -> phrase builder, called with (label, direction, distance_word)
+        self._phrase_dispatch: Dict[InferredMode, Callable[[str, str, str], str]] = {
+            InferredMode.HAZARD: self._phrase_hazard,
+            InferredMode.STAIRS: lambda label, direction, dw: self._phrase_stairs(label),
+            InferredMode.DOOR: lambda label, direction, dw: f"Door ahead, {self._direction_action(direction)}",
+            InferredMode.CROSSING: lambda label, direction, dw: self._phrase_crossing(label),
+            InferredMode.PUBLIC_TRANSPORT: lambda label, direction, dw: self._phrase_transport(label),
+            InferredMode.QUEUE: lambda label, direction, dw: "People in line ahead",
+            InferredMode.READING: lambda label, direction, dw: "Text found, want me to read?",
+            InferredMode.OBSTACLE: lambda label, direction, dw: self._phrase_obstacle(label, direction),
+            InferredMode.NAVIGATION: self._phrase_navigation,
+        }
     
     def infer_mode(
         self,
         detections: List[Detection],
-        context: Optional[Dict] = None
+        context: Optional[Dict] = None,
+        summary: Optional[FrameSummary] = None
     ) -> InferredMode:
         """
         Infer active mode from detections and context.
@@ -223,50 +422,57 @@ class DecisionEngine:
         8. OBSTACLE - minor obstacles in path
         9. NAVIGATION - general movement obstacles
         10. IDLE - nothing relevant
+        
+        summary, if given, must describe these detections (see FrameSummary).
         """
         context = context or {}
         
         if not detections:
             return InferredMode.IDLE
-        
-        # Check hazards first (highest priority)
-        hazard_info = self.context.detect_hazards(detections)
-        if hazard_info["has_hazard"]:
-            return InferredMode.HAZARD
-        
-        # Check stairs
-        stair_info = self.context.detect_stairs(detections)
-        if stair_info["has_stairs"]:
+        summary = summary or FrameSummary.build(detections)
+        
+        # Single pass over the frame: categorize every detection, then pick
+        # the highest-priority mode. Mirrors the ContextIndicators detectors.
+        has_stairs = has_traffic_light = has_door = has_transport = has_text = False
+        nav_count = 0
+        people_zones: List[Optional[str]] = []
+        
+        for detection, label, distance in zip(detections, summary.labels, summary.distances):
+            # Hazards are highest priority, so a close one decides immediately
+            if label in HAZARD_OBJECTS and distance < 2.0:
+                return InferredMode.HAZARD
+            if not has_stairs and _STAIR_RE.search(label):
+                has_stairs = True
+            if label == "traffic light":
+                has_traffic_light = True
+            elif label == "person":
+                people_zones.append(detection.zone)
+            if label in DOOR_OBJECTS:
+                has_door = True
+            if label in TRANSPORT_LABELS:
+                has_transport = True
+            if label in TEXT_OBJECTS:
+                has_text = True
+            if label in NAV_OBJECTS:
+                nav_count += 1
+        
+        if has_stairs:
             return InferredMode.STAIRS
-        
-        # Check traffic light (crossing context)
-        if self.context.detect_traffic_light(detections):
+        if has_traffic_light:
             return InferredMode.CROSSING
-        
-        # Check doors
-        if self.context.detect_doors(detections)["has_door"]:
+        if has_door:
             return InferredMode.DOOR
-        
-        # Check public transport
-        if self.context.detect_public_transport(detections):
+        if has_transport:
             return InferredMode.PUBLIC_TRANSPORT
-        
-        # Check queues
-        if self.context.detect_queues(detections):
+        # Queue: at least two people sharing the first person's zone
+        if len(people_zones) >= 2 and people_zones.count(people_zones[0]) >= 2:
             return InferredMode.QUEUE
-        
-        # Check for readable text
-        if self.context.detect_text_context(detections):
+        if has_text:
             return InferredMode.READING
-        
-        # Check navigation obstacles
-        nav_context = self.context.detect_navigation_context(detections)
-        if nav_context["is_navigating"] and nav_context["obstacles_count"] > 0:
+        # Navigation-relevant objects present means obstacles to navigate around
+        if nav_count > 0:
             return InferredMode.OBSTACLE
         
-        if nav_context["is_navigating"]:
-            return InferredMode.NAVIGATION
-        
         return InferredMode.IDLE
     
     def filter_redundant(
@@ -278,21 +484,29 @@ class DecisionEngine:
         Remove duplicate or near-duplicate detections within a time window.
         Prevents "car car car" spam.
         """
-        now = time.time()
-        filtered = []
+        return [detections[i] for i in self._fresh_indices(detections, dedup_window)]
+    
+    def _fresh_indices(
+        self,
+        detections: List[Detection],
+        dedup_window: float = 4.0
+    ) -> List[int]:
+        """Indices of detections not seen within dedup_window; records them."""
+        now = _now()
+        fresh = []
         
-        for detection in detections:
+        for i, detection in enumerate(detections):
             # Create dedup key from detection characteristics
             dedup_key = f"{detection.label}_{detection.zone}"
-            time_since = now - self.detection_dedup.get(dedup_key, 0)
+            time_since = now - self.detection_dedup.get(dedup_key, float("-inf"))
             
             if time_since > dedup_window:
-                filtered.append(detection)
-                self.detection_dedup[dedup_key] = now
+                fresh.append(i)
+                _lru_set(self.detection_dedup, dedup_key, now)
             else:
                 logger.debug(f"Filtered duplicate: {dedup_key}")
         
-        return filtered
+        return fresh
     
     def apply_post_speech_silence(
         self,
@@ -303,7 +517,7 @@ class DecisionEngine:
         After speaking, silence for N seconds to let user process/respond.
         Prevents overwhelming user with constant speech.
         """
-        now = time.time()
+        now = _now()
         
         if now < self.silence_until:
             logger.debug(f"In silence window (until {self.silence_until:.1f}s)")
@@ -320,8 +534,8 @@ class DecisionEngine:
         Determine if we should speak about this object again.
         Avoids: "person ahead" repeated every 500ms.
         """
-        now = time.time()
-        last_spoken = self.object_last_spoken.get(label, 0)
+        now = _now()
+        last_spoken = self.object_last_spoken.get(label, float("-inf"))
         time_since = now - last_spoken
         
         return time_since > last_spoken_threshold
@@ -339,31 +553,36 @@ class DecisionEngine:
             phrase_to_speak is None if should be silent.
         """
         context = context or {}
-        now = time.time()
+        now = _now()
+        
+        # Derive labels/distances once; every step below reads from this
+        summary = FrameSummary.build(detections)
         
         # 1. Filter redundant detections
-        filtered = self.filter_redundant(detections)
+        summary = summary.subset(self._fresh_indices(detections))
         
         # 2. Check silence window
-        filtered = self.apply_post_speech_silence(filtered)
+        filtered = self.apply_post_speech_silence(summary.detections)
+        if not filtered:
+            summary = summary.subset([])
         
         # 3. Infer mode
-        mode = self.infer_mode(filtered, context)
+        mode = self.infer_mode(filtered, context, summary)
         
         # 4. Select what to speak based on mode
         phrase = None
         
         if filtered:
             # Pick most relevant detection for this mode
-            detection = self._select_detection_for_mode(filtered, mode)
+            detection = self._select_detection_for_mode(filtered, mode, summary)
             
             if detection and self.should_speak_about_object(detection.label):
                 phrase = self._generate_phrase(detection, mode)
                 
                 # Record silence window for after speech
                 self.silence_until = now + 2.5
-                self.object_last_spoken[detection.label] = now
-                self.recent_spoken_phrases.append(phrase)
+                _lru_set(self.object_last_spoken, detection.label, now)
+                self.recent_spoken_phrases.add(phrase)
                 logger.info(f"Decision: SPEAK '{phrase}' (mode={mode})")
             else:
                 logger.debug(f"Decision: SILENT (object cooldown)")
@@ -376,35 +595,35 @@ class DecisionEngine:
     def _select_detection_for_mode(
         self,
         detections: List[Detection],
-        mode: InferredMode
+        mode: InferredMode,
+        summary: Optional[FrameSummary] = None
     ) -> Optional[Detection]:
         """Select most relevant detection for the current mode."""
         if not detections:
             return None
+        summary = summary or FrameSummary.build(detections)
+        labels, distances = summary.labels, summary.distances
         
-        # Sort by distance (closest first = most relevant)
-        sorted_dets = sorted(detections, key=lambda d: d.distance_est_m or 999)
+        # Closest first = most relevant; min() keeps the first of equal distances
+        key = distances.__getitem__
+        indices = range(len(detections))
         
-        if mode == InferredMode.HAZARD:
-            # For hazards, pick closest
-            return sorted_dets[0]
-        elif mode == InferredMode.STAIRS:
+        if mode == InferredMode.STAIRS:
             # Stairs - any stairs detection
-            stairs = [d for d in sorted_dets 
-                     if "stair" in d.label.lower()]
-            return stairs[0] if stairs else sorted_dets[0]
+            match = min((i for i in indices if "stair" in labels[i]), key=key, default=None)
         elif mode == InferredMode.DOOR:
             # Door - any door
-            doors = [d for d in sorted_dets 
-                    if d.label.lower() in {"door", "gate", "entrance", "exit"}]
-            return doors[0] if doors else sorted_dets[0]
+            match = min((i for i in indices if labels[i] in DOOR_TARGETS), key=key, default=None)
         elif mode == InferredMode.CROSSING:
             # Traffic light
-            lights = [d for d in sorted_dets if d.label.lower() == "traffic light"]
-            return lights[0] if lights else sorted_dets[0]
+            match = min((i for i in indices if labels[i] == "traffic light"), key=key, default=None)
         else:
-            # Default: closest, most relevant object
-            return sorted_dets[0]
+            # Hazards and default: closest, most relevant object
+            match = None
+        
+        if match is None:
+            match = min(indices, key=key)
+        return detections[match]
     
     def _generate_phrase(
         self,
@@ -426,26 +645,10 @@ class DecisionEngine:
         distance_word = self._distance_to_word(distance)
         
         # Mode-specific phrase generation
-        if mode == InferredMode.HAZARD:
-            return self._phrase_hazard(label, direction, distance_word)
-        elif mode == InferredMode.STAIRS:
-            return self._phrase_stairs(label)
-        elif mode == InferredMode.DOOR:
-            return f"Door ahead, {self._direction_action(direction)}"
-        elif mode == InferredMode.CROSSING:
-            return self._phrase_crossing(label)
-        elif mode == InferredMode.PUBLIC_TRANSPORT:
-            return self._phrase_transport(label)
-        elif mode == InferredMode.QUEUE:
-            return "People in line ahead"
-        elif mode == InferredMode.READING:
-            return "Text found, want me to read?"
-        elif mode == InferredMode.OBSTACLE:
-            return self._phrase_obstacle(label, direction)
-        elif mode == InferredMode.NAVIGATION:
-            return self._phrase_navigation(label, direction, distance_word)
-        else:
-            return f"{label.title()}, {direction}"
+        phrase_fn = self._phrase_dispatch.get(mode)
+        if phrase_fn is not None:
+            return phrase_fn(label, direction, distance_word)
+        return f"{label.title()}, {direction}"
     
     def _distance_to_word(self, distance_m: Optional[float]) -> str:
         """Convert distance to natural language word."""
@@ -515,57 +718,10 @@ class DecisionEngine:
         Return behavior hints based on active mode.
         Used by reasoning agent to adjust behavior.
         (This is internal; never exposed to user.)
+        
+        Returns a copy, so callers may modify it freely.
         """
-        return {
-            "navigation": {
-                "focus": "obstacle avoidance and collision prevention",
-                "urgency": "normal",
-                "allow_pauses": True,
-            },
-            "hazard": {
-                "focus": "immediate danger - prioritize urgent warning",
-                "urgency": "critical",
-                "allow_pauses": False,
-            },
-            "crossing": {
-                "focus": "safe street crossing - respect traffic signals",
-                "urgency": "critical",
-                "allow_pauses": False,
-            },
-            "stairs": {
-                "focus": "stairs navigation - safety and directional info",
-                "urgency": "high",
-                "allow_pauses": False,
-            },
-            "door": {
-                "focus": "door/entrance navigation",
-                "urgency": "normal",
-                "allow_pauses": True,
-            },
-            "reading": {
-                "focus": "text reading - offer support, let user decide",
-                "urgency": "low",
-                "allow_pauses": True,
-            },
-            "queue": {
-                "focus": "queue/line awareness",
-                "urgency": "low",
-                "allow_pauses": True,
-            },
-            "public_transport": {
-                "focus": "bus/train navigation",
-                "urgency": "high",
-                "allow_pauses": False,
-            },
-            "idle": {
-                "focus": "stay silent, let user focus",
-                "urgency": "none",
-                "allow_pauses": True,
-            },
-        }.get(mode.value, {})
-                "patience": "relaxed",
-            },
-        }.get(mode.value, {})
+        return dict(_MODE_CONTEXT.get(mode.value, {}))
 
 
 # Singleton
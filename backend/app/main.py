@@ -4,34 +4,73 @@ Real-time assistive vision system API.
 """
 
 import time
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+import orjson
+from pydantic import BaseModel
 
 from app import __version__
 from app.config import get_settings
 from app.models import (
-    DetectionRequest, DetectionResponse,
+    Detection, DetectionRequest, DetectionResponse, dump_detections, pack_detections,
     OCRRequest, OCRResponse,
     DescribeRequest, DescribeResponse,
     AgentStepRequest, AgentStepResponse,
-    HealthResponse
+    HealthResponse, TrackedObject
 )
-from app.perception import get_detector, get_ocr_engine, get_tracker
+from app.perception import BatchingDetector, get_detector, get_ocr_engine, get_tracker
+from app.perception.detector import configure_inference_threads
 from app.agent import get_agent, get_keywords_client
+from app.agent.reasoning import warmup_scoring_kernel
+from app.memory.summarizer import close_summarization_service
+from app.pipeline import FramePipeline
 from app.routes.memory import router as memory_router
 
 
-# Configure logging
+# Configure logging; LOG_LEVEL=WARNING drops the per-request timing lines
 logging.basicConfig(
-    level=logging.INFO,
+    level=get_settings().log_level.upper(),
     format="%(asctime)s | %(levelname)s | %(name)s | %(message)s"
 )
 logger = logging.getLogger(__name__)
 
 
+def _orjson_default(obj):
+    """Serialize the Pydantic models orjson doesn't know natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson (much faster than stdlib json).
+    
+    Handlers on the per-frame paths return it directly with Pydantic models
+    and NumPy arrays left in place, which skips FastAPI's jsonable_encoder
+    walk and any .tolist() copies.
+    """
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+async def load_ocr(ocr) -> None:
+    """Load the OCR model off the event loop, logging instead of raising."""
+    try:
+        await asyncio.to_thread(ocr.load)
+    except Exception as e:
+        logger.error(f"OCR model failed to load: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan - startup and shutdown."""
@@ -40,25 +79,64 @@ async def lifespan(app: FastAPI):
     # Load ML models on startup (warm up)
     settings = get_settings()
     
+    configure_inference_threads()
+    
     logger.info("Loading object detection model...")
     detector = get_detector()
     detector.load()
     
-    # OCR is loaded lazily on first use (slower to load)
-    logger.info("OCR will be loaded on first use")
+    # Compile the optional Numba scoring kernel now rather than on the first frame
+    warmup_scoring_kernel()
+    
+    # OCR takes seconds to load; do it in the background so startup and
+    # the detection endpoints aren't held up (/ocr answers 503 until ready,
+    # 500 if loading failed)
+    ocr = get_ocr_engine()
+    ocr_load_task = asyncio.create_task(load_ocr(ocr))
     
     # Initialize agent
     agent = get_agent()
+    telemetry_task = asyncio.create_task(agent.run_telemetry_worker())
     logger.info("Agent initialized")
     
+    # Pre-establish the LLM connection
+    keywords_client = get_keywords_client()
+    await keywords_client.warmup()
+    
+    # Detection/OCR block for ~100ms+; run them on a bounded pool so the
+    # event loop keeps serving other requests meanwhile
+    inference_pool = ThreadPoolExecutor(
+        max_workers=settings.inference_workers,
+        thread_name_prefix="inference"
+    )
+    
+    # Bind singletons once so handlers skip the per-request getter calls
+    app.state.inference_pool = inference_pool
+    # LLM frame re-encoding shares the same bound instead of the default executor
+    keywords_client.executor = inference_pool
+    
+    # Coalesce concurrent frames into batched YOLO passes
+    batcher = BatchingDetector(detector, inference_pool)
+    batcher.start()
+    app.state.detector = detector
+    app.state.tracker = get_tracker()
+    app.state.pipeline = FramePipeline(detector, app.state.tracker, batcher, inference_pool)
+    app.state.ocr = ocr
+    app.state.keywords = keywords_client
+    app.state.agent = agent
+    
     logger.info(f"Aeye backend v{__version__} ready!")
     
     yield
     
     # Shutdown
     logger.info("Shutting down Aeye backend...")
-    keywords_client = get_keywords_client()
+    telemetry_task.cancel()
+    ocr_load_task.cancel()
+    await batcher.stop()
+    inference_pool.shutdown(wait=False, cancel_futures=True)
     await keywords_client.close()
+    await close_summarization_service()
 
 
 # Create FastAPI app
@@ -66,7 +144,9 @@ app = FastAPI(
     title="Aeye - Assistive Vision API",
     description="Real-time camera-based assistive vision for blind and low-vision users",
     version=__version__,
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes the per-frame detection payloads much faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -83,6 +163,46 @@ app.add_middleware(
 app.include_router(memory_router)
 
 
+async def narration_inputs(
+    image: Union[str, bytes]
+) -> Tuple[List[Detection], List[TrackedObject], float, float, Dict[str, Any]]:
+    """
+    Detect and track a frame to narrate, as NARRATION_MODE asks.
+    
+    - hybrid: detections plus the image go to the LLM
+    - vision_only: skips local detection; the LLM sees just the image
+    - text_only: the LLM gets the tracked objects but no image upload
+    
+    Args:
+        image: Base64 encoded frame, or the raw JPEG/PNG bytes
+    
+    Returns:
+        (detections, tracked, detect time ms, timestamp, image kwargs for
+        the keywords client's generate_*/stream_* calls)
+    """
+    mode = settings.narration_mode
+    if mode == "text_only":
+        image_kwargs = {}
+    elif isinstance(image, bytes):
+        image_kwargs = {"image_bytes": image}
+    else:
+        image_kwargs = {"image_base64": image}
+    
+    if mode == "vision_only":
+        return [], [], 0.0, time.time(), image_kwargs
+    
+    _, detections, tracked, detect_time, timestamp = await app.state.pipeline.detect_and_track(image)
+    return detections, tracked, detect_time, timestamp, image_kwargs
+
+
+async def read_raw_frame(request: Request) -> bytes:
+    """Read a raw JPEG/PNG request body, rejecting an empty one."""
+    body = await request.body()
+    if not body:
+        raise HTTPException(status_code=400, detail="Empty image body")
+    return body
+
+
 # ============================================================================
 # Health Check
 # ============================================================================
@@ -90,7 +210,7 @@ app.include_router(memory_router)
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    detector = get_detector()
+    detector = app.state.detector
     return HealthResponse(
         status="ok",
         version=__version__,
@@ -105,7 +225,6 @@ async def health_check():
 @app.get("/config/ip-webcam")
 async def get_ip_webcam_config():
     """Get IP Webcam configuration for phone camera streaming."""
-    settings = get_settings()
     ip_webcam_url = settings.ip_webcam_url
     
     return {
@@ -120,7 +239,7 @@ async def get_ip_webcam_config():
 # Detection Endpoint
 # ============================================================================
 
-@app.post("/detect", response_model=DetectionResponse)
+@app.post("/detect", responses={200: {"model": DetectionResponse}})
 async def detect_objects(request: DetectionRequest):
     """
     Run object detection on a frame.
@@ -129,41 +248,59 @@ async def detect_objects(request: DetectionRequest):
     Target latency: <150ms
     """
     try:
-        detector = get_detector()
-        tracker = get_tracker()
-        
-        # Run detection
-        detections, inference_time = detector.detect_from_base64(
-            request.image_base64
+        # Detect and track for persistent IDs
+        result = await app.state.pipeline.detect_and_track(
+            request.image_base64, request.timestamp, assign_ids=True
         )
         
-        # Update tracker to get persistent IDs
-        tracked = tracker.update(detections, request.timestamp)
-        
-        # Update detections with track IDs
-        for i, det in enumerate(detections):
-            # Find matching tracked object
-            for t in tracked:
-                if t.label == det.label and abs(t.bbox.x1 - det.bbox.x1) < 0.1:
-                    det.track_id = t.id
-                    break
-        
-        return DetectionResponse(
-            timestamp=request.timestamp,
-            detections=detections,
-            inference_time_ms=inference_time
-        )
+        return ORJSONResponse({
+            "timestamp": request.timestamp,
+            "detections": dump_detections(result.detections),
+            "inference_time_ms": result.detect_time
+        })
         
     except Exception as e:
         logger.error(f"Detection error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/detect/raw", responses={200: {"model": DetectionResponse}})
+async def detect_objects_raw(
+    request: Request,
+    timestamp: float = Query(..., description="Frame timestamp in seconds")
+):
+    """
+    Run object detection on a raw encoded frame.
+    
+    Same as /detect, but the body is the JPEG/PNG bytes themselves
+    (application/octet-stream or image/jpeg), which avoids base64
+    encoding on the client and decoding here.
+    """
+    body = await read_raw_frame(request)
+    
+    try:
+        pipeline = app.state.pipeline
+        
+        frame = await pipeline.decode_bytes(body)
+        detections, inference_time = await pipeline.detect(frame)
+        pipeline.track(detections, timestamp, assign_ids=True)
+        
+        return ORJSONResponse({
+            "timestamp": timestamp,
+            "detections": dump_detections(detections),
+            "inference_time_ms": inference_time
+        })
+        
+    except Exception as e:
+        logger.error(f"Raw detection error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ============================================================================
 # OCR Endpoint (Enhanced with Vision Context)
 # ============================================================================
 
-@app.post("/ocr", response_model=OCRResponse)
+@app.post("/ocr", responses={200: {"model": OCRResponse}})
 async def read_text(request: OCRRequest):
     """
     Extract and narrate text from an image.
@@ -174,23 +311,36 @@ async def read_text(request: OCRRequest):
     
     Target latency: <1500ms
     """
+    ocr = app.state.ocr
+    if not ocr.ready:
+        if ocr.load_error is not None:
+            raise HTTPException(
+                status_code=500,
+                detail=f"OCR model failed to load: {ocr.load_error}"
+            )
+        raise HTTPException(
+            status_code=503,
+            detail="OCR model is still loading",
+            headers={"Retry-After": "5"}
+        )
+    
     try:
-        ocr = get_ocr_engine()
-        keywords = get_keywords_client()
+        keywords = app.state.keywords
         
-        start = time.time()
+        start = time.perf_counter()
         
         # Run OCR
-        raw_text, confidence, ocr_time = ocr.read_text_from_base64(
+        raw_text, confidence, ocr_time = await app.state.pipeline.run_inference(
+            partial(ocr.read_text_from_base64, prefilter=request.prefilter),
             request.image_base64
         )
         
         if not raw_text or raw_text.strip() == "":
-            return OCRResponse(
-                text="No text detected in the image.",
-                confidence=0.0,
-                inference_time_ms=(time.time() - start) * 1000
-            )
+            return ORJSONResponse({
+                "text": "No text detected in the image.",
+                "confidence": 0.0,
+                "inference_time_ms": (time.perf_counter() - start) * 1000
+            })
         
         # Use vision model to create natural narration of the text
         narration, llm_time, trace = await keywords.generate_text_narration(
@@ -198,15 +348,16 @@ async def read_text(request: OCRRequest):
             ocr_text=raw_text
         )
         
-        total_time = (time.time() - start) * 1000
+        total_time = (time.perf_counter() - start) * 1000
         
-        logger.info(f"Text narration in {total_time:.1f}ms (OCR: {ocr_time:.1f}ms, LLM: {llm_time:.1f}ms)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Text narration in {total_time:.1f}ms (OCR: {ocr_time:.1f}ms, LLM: {llm_time:.1f}ms)")
         
-        return OCRResponse(
-            text=narration,
-            confidence=confidence,
-            inference_time_ms=total_time
-        )
+        return ORJSONResponse({
+            "text": narration,
+            "confidence": confidence,
+            "inference_time_ms": total_time
+        })
         
     except Exception as e:
         logger.error(f"OCR error: {e}")
@@ -217,7 +368,7 @@ async def read_text(request: OCRRequest):
 # Scene Description Endpoint (Multimodal Vision)
 # ============================================================================
 
-@app.post("/describe", response_model=DescribeResponse)
+@app.post("/describe", responses={200: {"model": DescribeResponse}})
 async def describe_scene(request: DescribeRequest):
     """
     Generate a rich, contextual scene description using multimodal vision.
@@ -230,32 +381,29 @@ async def describe_scene(request: DescribeRequest):
     Target latency: <2000ms (vision model)
     """
     try:
-        detector = get_detector()
-        tracker = get_tracker()
-        keywords = get_keywords_client()
+        keywords = app.state.keywords
         
-        start = time.time()
+        start = time.perf_counter()
         
         # Run detection for visual overlays (but not for narration)
-        detections, detect_time = detector.detect_from_base64(request.image_base64)
-        timestamp = time.time()
-        tracked = tracker.update(detections, timestamp)
+        _, tracked, detect_time, _, image_kwargs = await narration_inputs(request.image_base64)
         
         # Generate multimodal scene description
         description, llm_time, trace = await keywords.generate_scene_description(
-            image_base64=request.image_base64,
+            **image_kwargs,
             objects=tracked,  # Optional context
             ocr_text=None
         )
         
-        total_time = (time.time() - start) * 1000
+        total_time = (time.perf_counter() - start) * 1000
         
-        logger.info(f"Multimodal scene description in {total_time:.1f}ms (detect: {detect_time:.1f}ms, llm: {llm_time:.1f}ms)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Multimodal scene description in {total_time:.1f}ms (detect: {detect_time:.1f}ms, llm: {llm_time:.1f}ms)")
         
-        return DescribeResponse(
-            description=description,
-            inference_time_ms=total_time
-        )
+        return ORJSONResponse({
+            "description": description,
+            "inference_time_ms": total_time
+        })
         
     except Exception as e:
         logger.error(f"Describe error: {e}")
@@ -280,22 +428,26 @@ async def describe_scene_detailed(request: DescribeRequest):
     Target latency: <3000ms (includes OCR + vision model)
     """
     try:
-        detector = get_detector()
-        tracker = get_tracker()
-        ocr = get_ocr_engine()
-        keywords = get_keywords_client()
-        
-        start = time.time()
-        
-        # Run detection for context
-        detections, detect_time = detector.detect_from_base64(request.image_base64)
-        timestamp = time.time()
-        tracked = tracker.update(detections, timestamp)
-        
-        # Run OCR to extract any visible text
-        raw_text, confidence, ocr_time = ocr.read_text_from_base64(
-            request.image_base64
-        )
+        pipeline = app.state.pipeline
+        ocr = app.state.ocr
+        keywords = app.state.keywords
+        
+        start = time.perf_counter()
+        
+        # Decode once, then run detection for context and OCR for visible
+        # text in parallel on the shared frame
+        frame = await pipeline.decode(request.image_base64)
+        if ocr.ready:
+            (detections, detect_time), (raw_text, confidence, ocr_time) = await asyncio.gather(
+                pipeline.detect(frame),
+                # Automatic OCR: skip the model on frames with no text-like edges
+                pipeline.run_inference(partial(ocr.read_text, prefilter=True), frame),
+            )
+        else:
+            # Don't hold the description up on the OCR model still loading
+            detections, detect_time = await pipeline.detect(frame)
+            raw_text, ocr_time = "", 0.0
+        tracked = pipeline.track(detections, time.time())
         
         # Generate comprehensive scene description with OCR context
         description, llm_time, trace = await keywords.generate_detailed_scene_description(
@@ -304,14 +456,15 @@ async def describe_scene_detailed(request: DescribeRequest):
             objects=tracked
         )
         
-        total_time = (time.time() - start) * 1000
+        total_time = (time.perf_counter() - start) * 1000
         
-        logger.info(f"Detailed scene description in {total_time:.1f}ms (detect: {detect_time:.1f}ms, ocr: {ocr_time:.1f}ms, llm: {llm_time:.1f}ms)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Detailed scene description in {total_time:.1f}ms (detect: {detect_time:.1f}ms, ocr: {ocr_time:.1f}ms, llm: {llm_time:.1f}ms)")
         
-        return {
+        return ORJSONResponse({
             "description": description,
             "ocr_text": raw_text if raw_text else None,
-            "detections": [d.model_dump() for d in detections],
+            "detections": dump_detections(detections),
             "inference_time_ms": total_time,
             "timing": {
                 "detection_ms": detect_time,
@@ -319,7 +472,7 @@ async def describe_scene_detailed(request: DescribeRequest):
                 "llm_ms": llm_time,
                 "total_ms": total_time
             }
-        }
+        })
         
     except Exception as e:
         logger.error(f"Detailed describe error: {e}")
@@ -330,7 +483,7 @@ async def describe_scene_detailed(request: DescribeRequest):
 # Agent Step Endpoint
 # ============================================================================
 
-@app.post("/agent/step", response_model=AgentStepResponse)
+@app.post("/agent/step", responses={200: {"model": AgentStepResponse}})
 async def agent_step(request: AgentStepRequest):
     """
     Process one frame through the agent reasoning layer.
@@ -344,9 +497,8 @@ async def agent_step(request: AgentStepRequest):
     Returns the action (SPEAK/SILENT) and trace for transparency.
     """
     try:
-        agent = get_agent()
-        response = agent.step(request)
-        return response
+        agent = app.state.agent
+        return ORJSONResponse(agent.step(request))
         
     except Exception as e:
         logger.error(f"Agent error: {e}")
@@ -360,14 +512,14 @@ async def agent_step(request: AgentStepRequest):
 @app.get("/agent/state")
 async def get_agent_state():
     """Get current agent state for debugging."""
-    agent = get_agent()
+    agent = app.state.agent
     return agent.get_state_summary()
 
 
 @app.post("/agent/reset")
 async def reset_agent():
     """Reset agent state."""
-    agent = get_agent()
+    agent = app.state.agent
     agent.reset()
     return {"status": "reset"}
 
@@ -376,8 +528,42 @@ async def reset_agent():
 # Combined Pipeline Endpoint (for detection + overlays only)
 # ============================================================================
 
+async def pipeline_response(
+    image: Union[str, bytes],
+    timestamp: float,
+    packed: bool
+) -> ORJSONResponse:
+    """Detect and track a frame for /pipeline and /pipeline/raw."""
+    try:
+        start = time.perf_counter()
+        
+        # Run detection and tracking for persistent IDs
+        result = await app.state.pipeline.detect_and_track(image, timestamp, assign_ids=True)
+        detections, detect_time = result.detections, result.detect_time
+        
+        total_time = (time.perf_counter() - start) * 1000
+        
+        body = {"timestamp": timestamp}
+        if packed:
+            body["packed"] = pack_detections(detections)
+        else:
+            body["detections"] = dump_detections(detections)
+        body["timing"] = {
+            "detection_ms": detect_time,
+            "total_ms": total_time
+        }
+        return ORJSONResponse(body)
+        
+    except Exception as e:
+        logger.error(f"Pipeline error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/pipeline")
-async def run_pipeline(request: DetectionRequest):
+async def run_pipeline(
+    request: DetectionRequest,
+    packed: bool = Query(False, description="Return detections as a packed float32 matrix")
+):
     """
     Run object detection for visual overlays.
     
@@ -386,49 +572,83 @@ async def run_pipeline(request: DetectionRequest):
     - Does NOT generate spoken narration
     - Used in parallel with /live for visual feedback
     
+    With ?packed=true, "detections" is replaced by "packed" (see
+    pack_detections) for clients decoding straight into a Float32Array.
+    
     Target latency: <200ms
     """
+    return await pipeline_response(request.image_base64, request.timestamp, packed)
+
+
+@app.post("/pipeline/raw")
+async def run_pipeline_raw(
+    request: Request,
+    timestamp: float = Query(..., description="Frame timestamp in seconds"),
+    packed: bool = Query(False, description="Return detections as a packed float32 matrix")
+):
+    """
+    Same as /pipeline, but the body is the JPEG/PNG bytes themselves
+    (e.g. a canvas.toBlob() upload), skipping base64 on both ends.
+    """
+    return await pipeline_response(await read_raw_frame(request), timestamp, packed)
+
+
+# ============================================================================
+# Live Assist Endpoint (Blocking Narrative Mode)
+# ============================================================================
+
+async def live_response(image: Union[str, bytes]) -> ORJSONResponse:
+    """Narrate a frame for /live and /live/raw."""
     try:
-        detector = get_detector()
-        tracker = get_tracker()
+        keywords = app.state.keywords
+        agent = app.state.agent
         
-        start = time.time()
+        start = time.perf_counter()
         
-        # Run detection
-        detections, detect_time = detector.detect_from_base64(
-            request.image_base64
-        )
-        
-        # Update tracker for persistent IDs
-        tracked = tracker.update(detections, request.timestamp)
+        # Run detection for context (not for narration)
+        detections, tracked, detect_time, timestamp, image_kwargs = await narration_inputs(image)
+        
+        # Only pay for an LLM call when the agent's gates would speak;
+        # silent frames get an empty narrative and gated=True, so clients
+        # can tell "nothing worth saying" from a failed narration.
+        # vision_only has no local detections for the gates to judge
+        gate_llm = settings.agent_gate_live_llm and settings.narration_mode != "vision_only"
+        gated = gate_llm and not agent.should_call_llm(tracked, timestamp)
+        if gated:
+            description, llm_time, trace = "", 0.0, {"gated": True}
+        else:
+            # Generate multimodal scene description
+            description, llm_time, trace = await keywords.generate_scene_description(
+                **image_kwargs,
+                objects=tracked,
+                ocr_text=None
+            )
+        if gate_llm:
+            agent.record_narration(tracked, timestamp, description)
         
-        # Update detections with track IDs
-        for det in detections:
-            for t in tracked:
-                if t.label == det.label and abs(t.bbox.x1 - det.bbox.x1) < 0.1:
-                    det.track_id = t.id
-                    break
+        total_time = (time.perf_counter() - start) * 1000
         
-        total_time = (time.time() - start) * 1000
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Live assist narrative in {total_time:.1f}ms")
         
-        return {
-            "timestamp": request.timestamp,
-            "detections": [d.model_dump() for d in detections],
+        return ORJSONResponse({
+            "timestamp": timestamp,
+            "narrative": description,
+            "gated": gated,
+            "detections": dump_detections(detections),
             "timing": {
                 "detection_ms": detect_time,
+                "llm_ms": llm_time,
                 "total_ms": total_time
-            }
-        }
+            },
+            "trace": trace
+        })
         
     except Exception as e:
-        logger.error(f"Pipeline error: {e}")
+        logger.error(f"Live assist error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# ============================================================================
-# Live Assist Endpoint (Blocking Narrative Mode)
-# ============================================================================
-
 @app.post("/live")
 async def live_assist(request: DescribeRequest):
     """
@@ -448,41 +668,106 @@ async def live_assist(request: DescribeRequest):
     
     Target latency: <2500ms
     """
+    return await live_response(request.image_base64)
+
+
+@app.post("/live/raw")
+async def live_assist_raw(request: Request):
+    """
+    Same as /live, but the body is the JPEG/PNG bytes themselves
+    (e.g. a canvas.toBlob() upload), skipping base64 on both ends.
+    """
+    return await live_response(await read_raw_frame(request))
+
+
+# ============================================================================
+# Live Assist Streaming Endpoint (Server-Sent Events)
+# ============================================================================
+
+def _sse(event: str, data) -> bytes:
+    """Encode one Server-Sent Event with a JSON payload."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(
+        data, default=_orjson_default, option=orjson.OPT_SERIALIZE_NUMPY
+    ) + b"\n\n"
+
+
+@app.post("/live/stream")
+async def live_assist_stream(request: DescribeRequest):
+    """
+    Live Assist mode, streamed as Server-Sent Events.
+    
+    Same pipeline as /live, but the frontend can start speaking the first
+    sentence while the rest of the narrative is still being generated.
+    
+    Events:
+    - partial: {"text"} - first sentence of the narrative
+    - done: same body as /live (narrative, gated, detections, timing, trace)
+    - error: {"detail"} - generation failed mid-stream
+    
+    Target time to first sentence: <1000ms
+    """
     try:
-        detector = get_detector()
-        tracker = get_tracker()
-        keywords = get_keywords_client()
+        keywords = app.state.keywords
+        agent = app.state.agent
         
-        start = time.time()
+        start = time.perf_counter()
         
         # Run detection for context (not for narration)
-        detections, detect_time = detector.detect_from_base64(request.image_base64)
-        timestamp = time.time()
-        tracked = tracker.update(detections, timestamp)
-        
-        # Generate multimodal scene description
-        description, llm_time, trace = await keywords.generate_scene_description(
-            image_base64=request.image_base64,
-            objects=tracked,
-            ocr_text=None
+        detections, tracked, detect_time, timestamp, image_kwargs = await narration_inputs(
+            request.image_base64
         )
         
-        total_time = (time.time() - start) * 1000
-        
-        logger.info(f"Live assist narrative in {total_time:.1f}ms")
+        # vision_only has no local detections for the gates to judge
+        gate_llm = settings.agent_gate_live_llm and settings.narration_mode != "vision_only"
+        gated = gate_llm and not agent.should_call_llm(tracked, timestamp)
         
-        return {
+    except Exception as e:
+        logger.error(f"Live stream error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    async def events():
+        description, trace = "", {"gated": True}
+        llm_start = time.perf_counter()
+        try:
+            if not gated:
+                trace = {}
+                async for text, is_final in keywords.stream_scene_description(
+                    **image_kwargs,
+                    objects=tracked,
+                    ocr_text=None
+                ):
+                    if is_final:
+                        description = text
+                    else:
+                        yield _sse("partial", {"text": text})
+            if gate_llm:
+                agent.record_narration(tracked, timestamp, description)
+        except Exception as e:
+            logger.error(f"Live stream error: {e}")
+            yield _sse("error", {"detail": str(e)})
+            return
+        
+        llm_time = 0.0 if gated else (time.perf_counter() - llm_start) * 1000
+        total_time = (time.perf_counter() - start) * 1000
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Live assist stream finished in {total_time:.1f}ms")
+        
+        yield _sse("done", {
             "timestamp": timestamp,
             "narrative": description,
-            "detections": [d.model_dump() for d in detections],
+            "gated": gated,
+            "detections": dump_detections(detections),
             "timing": {
                 "detection_ms": detect_time,
                 "llm_ms": llm_time,
                 "total_ms": total_time
             },
             "trace": trace
-        }
-        
-    except Exception as e:
-        logger.error(f"Live assist error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        })
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,89 @@
+"""
+Face Gallery Kernels
+Nearest-face scans over a contiguous gallery, compiled with Numba when available.
+"""
+
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Numba is optional: it compiles the scans to SIMD loops, otherwise NumPy is used
+NUMBA_AVAILABLE = False
+njit = None
+prange = range
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    logger.info("Numba not available, using NumPy gallery scans")
+
+
+# Below this many faces the compiled scan isn't worth its call overhead
+KERNEL_MIN_GALLERY_SIZE = 64
+
+
+def _best_match_loop(gallery, unknown):
+    """
+    Row with the smallest cosine distance to a unit query.
+    
+    Distances are computed in parallel; the argmin runs serially afterwards
+    so threads never race on the running best.
+    
+    Returns:
+        (row index, cosine distance)
+    """
+    n, dim = gallery.shape
+    distances = np.empty(n, dtype=np.float32)
+    for i in prange(n):
+        dot = np.float32(0.0)
+        for j in range(dim):
+            dot += gallery[i, j] * unknown[j]
+        distances[i] = 1.0 - dot
+    
+    best = 0
+    for i in range(1, n):
+        if distances[i] < distances[best]:
+            best = i
+    return best, distances[best]
+
+
+def _best_match_numpy(gallery, unknown):
+    """NumPy equivalent of _best_match_loop, used when Numba is missing."""
+    distances = 1.0 - gallery @ unknown
+    best = int(np.argmin(distances))
+    return best, distances[best]
+
+
+def _int8_dots_loop(codes, query):
+    """int8 row dot products accumulated in int32."""
+    n, dim = codes.shape
+    dots = np.empty(n, dtype=np.int32)
+    for i in prange(n):
+        acc = np.int32(0)
+        for j in range(dim):
+            acc += np.int32(codes[i, j]) * np.int32(query[j])
+        dots[i] = acc
+    return dots
+
+
+def _int8_dots_numpy(codes, query):
+    """NumPy equivalent of _int8_dots_loop, used when Numba is missing."""
+    return np.einsum("ij,j->i", codes, query.astype(np.int32), dtype=np.int32)
+
+
+if NUMBA_AVAILABLE:
+    best_match = njit(parallel=True, fastmath=True, cache=True)(_best_match_loop)
+    int8_dots = njit(parallel=True, cache=True)(_int8_dots_loop)
+else:
+    best_match = _best_match_numpy
+    int8_dots = _int8_dots_numpy
+
+
+def warmup_gallery_kernels() -> None:
+    """Compile the kernels with the gallery dtypes so the first match skips the JIT."""
+    if not NUMBA_AVAILABLE:
+        return
+    best_match(np.zeros((1, 1), dtype=np.float32), np.zeros(1, dtype=np.float32))
+    int8_dots(np.zeros((1, 1), dtype=np.int8), np.zeros(1, dtype=np.int8))
@@ -6,7 +6,7 @@ Uses SQLite for MVP.
 import os
 import logging
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
 
@@ -33,6 +33,31 @@ engine = create_engine(
     echo=False  # Set True for SQL debugging
 )
 
+
+# SQLite tuning applied to every pooled connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",        # readers don't block the writer
+    "PRAGMA synchronous=NORMAL",      # safe with WAL, far fewer fsyncs
+    "PRAGMA busy_timeout=5000",       # wait for a concurrent writer instead of failing
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",     # 256MB memory-mapped reads
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune each new SQLite connection.
+    
+    The engine keeps its default QueuePool, which already reuses
+    connections across requests; StaticPool would share one connection
+    between the threads serving concurrent requests.
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -41,6 +66,10 @@ def init_db():
     """Initialize database tables."""
     logger.info(f"Initializing database at {DB_PATH}")
     Base.metadata.create_all(bind=engine)
+    # create_all skips tables that already exist, so add indexes introduced later
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
     logger.info("Database initialized")
 
 
@@ -11,14 +11,65 @@ import logging
 import pickle
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, NamedTuple
 import numpy as np
 from PIL import Image
-import tempfile
-import os
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.memory._kernel import KERNEL_MIN_GALLERY_SIZE, best_match, int8_dots, warmup_gallery_kernels
+from app.memory.models import Person
 
 logger = logging.getLogger(__name__)
 
+# Facenet512 embedding size; stored encodings are this many raw float32s
+EMBEDDING_DIM = 512
+
+# Facenet512 input resolution (height, width)
+FACENET_INPUT_SIZE = (160, 160)
+
+# Frames are shrunk to this longest edge for detection only; faces wider
+# than ~40px at full size are still found
+FACE_DETECT_MAX_EDGE = 640
+
+# Shortcut embedding paths (batched crops, enroll's aligned crop) must match
+# represent() at least this closely (cosine similarity) or aren't used
+EMBED_MIN_SIMILARITY = 0.995
+
+# Reference photo encodings (format -> OpenCV extension) and their quality
+PHOTO_FORMATS = {"jpeg": ".jpg", "webp": ".webp"}
+PHOTO_QUALITY = 85
+
+# Galleries at least this large are prefiltered by sign-hash before the matmul
+LSH_MIN_GALLERY_SIZE = 2048
+
+# Random-hyperplane sign hash: each of the 64 bits differs between two vectors
+# with probability angle/pi. A match (cosine distance < 0.40, angle < ~53deg)
+# averages ~19 differing bits; 28 leaves margin so true matches survive.
+LSH_BITS = 64
+LSH_MAX_HAMMING = 28
+_LSH_PLANES = np.random.default_rng(0).standard_normal((LSH_BITS, EMBEDDING_DIM)).astype(np.float32)
+
+# Galleries at least this large are held as int8 codes with a per-row scale
+# instead of float32: a quarter of the memory, cosine error around 1e-3
+INT8_MIN_GALLERY_SIZE = 65536
+
+# OpenCV's libjpeg-turbo codecs are faster than PIL's; PIL stays as fallback
+CV2_AVAILABLE = False
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    pass
+
+# pybase64's SIMD decoder is ~10x faster than stdlib on webcam-sized JPEGs
+PYBASE64_AVAILABLE = False
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    pass
+
 # Try to import DeepFace, but provide fallback
 DEEPFACE_AVAILABLE = False
 DeepFace = None
@@ -33,6 +84,84 @@ except ImportError as e:
 except Exception as e:
     logger.warning(f"DeepFace failed to load: {e}. Face matching will be disabled.")
 
+# represent()'s own aspect-preserving resize, so batched crops reach the
+# model exactly as represent() would feed them
+deepface_resize_image = None
+if DEEPFACE_AVAILABLE:
+    try:
+        from deepface.modules.preprocessing import resize_image as deepface_resize_image
+    except ImportError:
+        pass
+
+# TensorFlow comes with DeepFace; used directly only for GPU placement
+TF_AVAILABLE = False
+try:
+    import tensorflow as tf
+    TF_AVAILABLE = True
+except ImportError:
+    pass
+
+
+def normalize_encoding(encoding) -> np.ndarray:
+    """L2-normalize a face embedding to a float32 unit vector."""
+    v = np.array(encoding, dtype=np.float32)
+    v /= np.linalg.norm(v) + 1e-12
+    return v
+
+
+def sign_hash(vectors: np.ndarray) -> np.ndarray:
+    """64-bit random-hyperplane signature per row of an (N, 512) array."""
+    bits = (np.atleast_2d(vectors) @ _LSH_PLANES.T) > 0
+    return np.packbits(bits, axis=1).view(np.uint64).ravel()
+
+
+def hamming_distances(signature: np.uint64, signatures: np.ndarray) -> np.ndarray:
+    """Number of differing bits between one signature and each of many."""
+    diff = np.bitwise_xor(signatures, signature)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(diff)
+    return np.unpackbits(diff.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
+
+
+def quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization: rows ~= codes * scales[:, None]."""
+    vectors = np.atleast_2d(vectors)
+    peak = np.abs(vectors).max(axis=1)
+    scales = np.where(peak > 0, peak / 127.0, 1.0).astype(np.float32)
+    codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return codes, scales
+
+
+class FaceGallery(NamedTuple):
+    """Known faces in matchable form, built from unit encodings."""
+    ids: List[str]
+    matrix: Optional[np.ndarray]  # (N, 512) float32, None once quantized
+    codes: Optional[np.ndarray]  # (N, 512) int8, large galleries only
+    scales: Optional[np.ndarray]  # (N,) float32 scale per code row
+    signatures: Optional[np.ndarray]  # sign hashes, large galleries only
+    
+    @classmethod
+    def build(cls, ids: List[str], matrix: np.ndarray) -> "FaceGallery":
+        """Gallery for (N, 512) unit rows, adding the LSH and int8 forms by size."""
+        signatures = sign_hash(matrix) if len(matrix) >= LSH_MIN_GALLERY_SIZE else None
+        if len(matrix) >= INT8_MIN_GALLERY_SIZE:
+            codes, scales = quantize_int8(matrix)
+            return cls(ids, None, codes, scales, signatures)
+        return cls(ids, matrix, None, None, signatures)
+    
+    def similarities(self, unknown: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Cosine similarity of a unit query to every row, or just `rows`."""
+        if self.codes is None:
+            matrix = self.matrix if rows is None else self.matrix[rows]
+            return matrix @ unknown
+        
+        codes = self.codes if rows is None else self.codes[rows]
+        scales = self.scales if rows is None else self.scales[rows]
+        query_codes, query_scale = quantize_int8(unknown)
+        # int8 x int8 accumulated in int32; 512 * 127^2 can't overflow
+        dots = int8_dots(codes, query_codes[0])
+        return dots * (scales * query_scale[0])
+
 
 class FaceService:
     """
@@ -46,77 +175,287 @@ class FaceService:
     MATCH_THRESHOLD = 0.40  # Lower = stricter matching
     MODEL_NAME = "Facenet512"  # Good balance of accuracy and speed
     DETECTOR_BACKEND = "opencv"  # Fast and reliable
+    MIN_FACE_CONFIDENCE = 0.5  # Detector confidence for a real face region
     
-    def __init__(self):
+    def __init__(self, warmup: bool = True):
+        """
+        Args:
+            warmup: Run a dummy image through detection and embedding at startup
+                so the first real request doesn't pay TensorFlow's graph setup
+        """
         self.available = DEEPFACE_AVAILABLE
         self._model_loaded = False
+        self._model = None
+        # Whether the batched crop path and enroll's aligned-crop path agree
+        # with represent(); each checked once
+        self._batch_ok: Optional[bool] = None
+        self._enroll_ok: Optional[bool] = None
+        
+        # Gallery of the last known_encodings list matched against, and the
+        # arrays it was built from, so repeat lookups skip re-stacking it
+        self._list_gallery: Optional[FaceGallery] = None
+        self._gallery_encodings: List[np.ndarray] = []
+        
+        # Gallery of every stored face for find_best_match_db, with the
+        # version it was loaded at; stale once the version moves on
+        self._gallery_version = 0
+        self._gallery_cache: Optional[Tuple[int, FaceGallery]] = None
         
         # Pre-load the model on first use
         if self.available:
             try:
                 # Warm up the model by building it
                 logger.info(f"Loading DeepFace model: {self.MODEL_NAME}...")
+                device = self._select_device()
                 # This will download and cache the model if needed
-                DeepFace.build_model(self.MODEL_NAME)
+                if device is not None:
+                    # The policy is process-global; only the Facenet build
+                    # should see fp16, not Keras models built later
+                    previous_policy = tf.keras.mixed_precision.global_policy()
+                    tf.keras.mixed_precision.set_global_policy("mixed_float16")
+                    try:
+                        with tf.device(device):
+                            self._model = DeepFace.build_model(self.MODEL_NAME)
+                    finally:
+                        tf.keras.mixed_precision.set_global_policy(previous_policy)
+                else:
+                    self._model = DeepFace.build_model(self.MODEL_NAME)
                 self._model_loaded = True
-                logger.info(f"DeepFace model {self.MODEL_NAME} loaded successfully")
+                logger.info(f"DeepFace model {self.MODEL_NAME} loaded successfully on {device or 'default device'}")
             except Exception as e:
                 logger.warning(f"Failed to preload DeepFace model: {e}")
                 self._model_loaded = False
+            
+            if warmup and self._model_loaded:
+                self._warmup()
+        
+        if warmup:
+            warmup_gallery_kernels()
+    
+    def _warmup(self) -> None:
+        """Trace the detector and embedding graphs once with a blank image."""
+        dummy = np.zeros((64, 64, 3), dtype=np.uint8)
+        try:
+            DeepFace.extract_faces(
+                img_path=dummy,
+                detector_backend=self.DETECTOR_BACKEND,
+                enforce_detection=False
+            )
+            DeepFace.represent(
+                img_path=dummy,
+                model_name=self.MODEL_NAME,
+                detector_backend="skip",
+                enforce_detection=False
+            )
+            self._batch_ok = self._check_batch_consistency()
+            self._enroll_ok = self._check_enroll_consistency()
+            logger.info("DeepFace warmup complete")
+        except Exception as e:
+            logger.warning(f"DeepFace warmup failed: {e}")
+    
+    def _select_device(self) -> Optional[str]:
+        """
+        Pick the GPU for the embedding model when TensorFlow sees one.
+        
+        On a GPU the caller builds the model under the mixed_float16 policy
+        so its matmuls run in fp16; on CPU the default float32 policy is kept.
+        
+        Returns:
+            TensorFlow device string, or None to leave placement to TF
+        """
+        if not TF_AVAILABLE:
+            return None
+        
+        try:
+            if not tf.config.list_physical_devices("GPU"):
+                logger.info("No GPU found, face embeddings run on CPU (float32)")
+                return None
+            logger.info("Face embeddings run on /GPU:0 with mixed_float16 policy")
+            return "/GPU:0"
+        except Exception as e:
+            logger.warning(f"GPU setup failed, using default device: {e}")
+            return None
     
     def decode_image(self, base64_str: str) -> np.ndarray:
         """Decode base64 image to numpy array (RGB)."""
-        if "," in base64_str:
-            base64_str = base64_str.split(",")[1]
+        # A data URL's comma sits in the short header; don't scan the payload
+        comma = base64_str.find(",", 0, 64)
+        if comma != -1:
+            base64_str = base64_str[comma + 1:]
+        
+        if PYBASE64_AVAILABLE:
+            image_data = pybase64.b64decode(base64_str, validate=False)
+        else:
+            image_data = base64.b64decode(base64_str)
+        if CV2_AVAILABLE:
+            image = cv2.imdecode(np.frombuffer(image_data, dtype=np.uint8), cv2.IMREAD_COLOR)
+            if image is None:
+                raise ValueError("Could not decode image bytes")
+            return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
         
-        image_data = base64.b64decode(base64_str)
         image = Image.open(BytesIO(image_data)).convert("RGB")
         return np.array(image)
     
-    def _save_temp_image(self, image: np.ndarray) -> str:
-        """Save image to temp file for DeepFace (it works better with file paths)."""
-        temp_file = tempfile.NamedTemporaryFile(suffix=".jpg", delete=False)
-        pil_image = Image.fromarray(image)
-        pil_image.save(temp_file.name, "JPEG", quality=95)
-        return temp_file.name
+    def _to_deepface_input(self, image: np.ndarray) -> np.ndarray:
+        """RGB array to the BGR layout DeepFace expects for in-memory images."""
+        # Contiguous, since OpenCV (DeepFace's detector) rejects negative strides
+        return np.ascontiguousarray(image[..., ::-1])
     
     def detect_faces(self, image: np.ndarray) -> List[Tuple[int, int, int, int]]:
         """
         Detect faces in an image.
         
+        Large frames are downscaled to FACE_DETECT_MAX_EDGE first, since the
+        detector's cost grows with pixel count; boxes are mapped back to the
+        full-resolution image.
+        
         Returns list of (top, right, bottom, left) tuples for compatibility.
         """
         if not self.available:
             return []
         
         try:
-            temp_path = self._save_temp_image(image)
-            try:
-                # Use DeepFace's extract_faces which detects and aligns faces
-                faces = DeepFace.extract_faces(
-                    img_path=temp_path,
-                    detector_backend=self.DETECTOR_BACKEND,
-                    enforce_detection=False
-                )
-                
-                locations = []
-                for face_data in faces:
-                    if face_data.get("confidence", 0) > 0.5:
-                        facial_area = face_data.get("facial_area", {})
-                        x = facial_area.get("x", 0)
-                        y = facial_area.get("y", 0)
-                        w = facial_area.get("w", 0)
-                        h = facial_area.get("h", 0)
-                        # Convert to (top, right, bottom, left) format
-                        locations.append((y, x + w, y + h, x))
-                
-                return locations
-            finally:
-                os.unlink(temp_path)
+            scale = min(1.0, FACE_DETECT_MAX_EDGE / max(image.shape[:2]))
+            small = image
+            if scale < 1.0:
+                if CV2_AVAILABLE:
+                    small = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+                else:
+                    size = (round(image.shape[1] * scale), round(image.shape[0] * scale))
+                    small = np.asarray(Image.fromarray(image).resize(size, Image.BILINEAR))
+            
+            # Use DeepFace's extract_faces which detects and aligns faces
+            faces = DeepFace.extract_faces(
+                img_path=self._to_deepface_input(small),
+                detector_backend=self.DETECTOR_BACKEND,
+                enforce_detection=False
+            )
+            
+            return [
+                self._facial_area_to_location(face_data.get("facial_area", {}), 1.0 / scale)
+                for face_data in faces
+                if face_data.get("confidence", 0) > self.MIN_FACE_CONFIDENCE
+            ]
         except Exception as e:
             logger.error(f"Face detection error: {e}")
             return []
     
+    def _facial_area_to_location(self, facial_area: dict, scale: float = 1.0) -> Tuple[int, int, int, int]:
+        """DeepFace facial_area (x, y, w, h) to (top, right, bottom, left), times scale."""
+        x = facial_area.get("x", 0)
+        y = facial_area.get("y", 0)
+        w = facial_area.get("w", 0)
+        h = facial_area.get("h", 0)
+        if scale != 1.0:
+            return (round(y * scale), round((x + w) * scale), round((y + h) * scale), round(x * scale))
+        return (y, x + w, y + h, x)
+    
+    def enroll(
+        self,
+        image: np.ndarray,
+        save_path: Optional[Path] = None
+    ) -> Tuple[Optional[np.ndarray], Optional[Tuple[int, int, int, int]]]:
+        """
+        Detect, embed and optionally save a face with a single detector pass.
+        
+        The aligned crop from extract_faces goes straight to represent with
+        detection skipped, and its facial area is reused for the saved photo,
+        instead of running detection once per step. If the one-time check
+        finds that crop embeds differently from represent() on the frame
+        (what the stored gallery was built with), the frame is embedded that
+        way instead.
+        
+        Args:
+            image: RGB image as numpy array
+            save_path: Where to save the reference photo; None to skip saving
+        
+        Returns:
+            Tuple of (encoding, face_location). The encoding is a 512-d unit
+            vector or None; face_location is (top, right, bottom, left), or None
+            if no face was detected confidently (the whole image was embedded).
+        """
+        if not self.available:
+            return None, None
+        
+        if self._enroll_ok is None:
+            self._enroll_ok = self._check_enroll_consistency()
+        
+        encoding = None
+        face_location = None
+        try:
+            faces = DeepFace.extract_faces(
+                img_path=self._to_deepface_input(image),
+                detector_backend=self.DETECTOR_BACKEND,
+                enforce_detection=False
+            )
+            
+            if faces:
+                face_data = max(faces, key=lambda f: f.get("confidence", 0))
+                if face_data.get("confidence", 0) > self.MIN_FACE_CONFIDENCE:
+                    face_location = self._facial_area_to_location(face_data.get("facial_area", {}))
+                
+                if self._enroll_ok:
+                    encoding = self._represent_aligned(face_data["face"])
+        except Exception as e:
+            logger.error(f"Face enrollment error: {e}")
+        
+        if not self._enroll_ok:
+            encoding = self.get_face_encoding(image)
+        
+        if save_path is not None:
+            self.extract_and_save_face(image, save_path, face_location, detect=False)
+        
+        return encoding, face_location
+    
+    def _represent_aligned(self, face: np.ndarray) -> Optional[np.ndarray]:
+        """Embed an aligned face from extract_faces (RGB in [0, 1]) with detection skipped."""
+        face = np.ascontiguousarray(face[..., ::-1] * 255).astype(np.uint8)
+        embeddings = DeepFace.represent(
+            img_path=face,
+            model_name=self.MODEL_NAME,
+            detector_backend="skip",
+            enforce_detection=False
+        )
+        if embeddings and embeddings[0].get("embedding"):
+            return normalize_encoding(embeddings[0]["embedding"])
+        return None
+    
+    def _check_enroll_consistency(self) -> bool:
+        """
+        Check that enroll's aligned-crop path embeds a frame like represent() does.
+        
+        Stored encodings came from represent() with the detector on the whole
+        frame. If extract_faces' output (channel order, scaling) drifts from
+        what represent() feeds the model, enrolled people would stop matching
+        and be re-created as unknown, so enroll uses represent() instead.
+        """
+        # Faceless and non-square, so both paths embed the whole frame and
+        # channel or scaling mix-ups show up
+        image = np.random.default_rng(1).integers(0, 256, (120, 96, 3), dtype=np.uint8)
+        try:
+            faces = DeepFace.extract_faces(
+                img_path=self._to_deepface_input(image),
+                detector_backend=self.DETECTOR_BACKEND,
+                enforce_detection=False
+            )
+            aligned = self._represent_aligned(faces[0]["face"]) if faces else None
+        except Exception as e:
+            logger.warning(f"Enrollment embedding check failed: {e}")
+            return False
+        baseline = self.get_face_encoding(image)
+        
+        if aligned is None or baseline is None:
+            similarity = -1.0
+        else:
+            similarity = float(aligned @ baseline)
+        if similarity < EMBED_MIN_SIMILARITY:
+            logger.warning(
+                f"Aligned-crop face embeddings differ from DeepFace.represent "
+                f"(cosine {similarity:.4f}), enrolling with represent on the full frame"
+            )
+            return False
+        return True
+    
     def get_face_encoding(self, image: np.ndarray, face_location: Optional[Tuple] = None) -> Optional[np.ndarray]:
         """
         Get face embedding from image using DeepFace.
@@ -124,40 +463,133 @@ class FaceService:
         Args:
             image: RGB image as numpy array
             face_location: Optional (top, right, bottom, left) tuple. If provided, crops to that region.
-            
+        
         Returns:
-            512-dimensional numpy array (for Facenet512) or None if no face found.
+            512-dimensional float32 unit vector (for Facenet512) or None if no face found.
+            Encodings are L2-normalized here so matching is a plain dot product.
         """
         if not self.available:
             return None
         
+        # A known face region skips detection and goes through the batched path
+        if face_location:
+            encodings = self.get_face_encodings_batch(image, [face_location])
+            return encodings[0] if encodings else None
+        
         try:
-            # If face location provided, crop the image
-            if face_location:
-                top, right, bottom, left = face_location
-                image = image[top:bottom, left:right]
+            # Get embedding using DeepFace
+            embeddings = DeepFace.represent(
+                img_path=self._to_deepface_input(image),
+                model_name=self.MODEL_NAME,
+                detector_backend=self.DETECTOR_BACKEND,
+                enforce_detection=False
+            )
             
-            temp_path = self._save_temp_image(image)
-            try:
-                # Get embedding using DeepFace
-                embeddings = DeepFace.represent(
-                    img_path=temp_path,
-                    model_name=self.MODEL_NAME,
-                    detector_backend=self.DETECTOR_BACKEND,
-                    enforce_detection=False
-                )
-                
-                if embeddings and len(embeddings) > 0:
-                    embedding = embeddings[0].get("embedding", [])
-                    if embedding:
-                        return np.array(embedding)
-                return None
-            finally:
-                os.unlink(temp_path)
+            if embeddings and len(embeddings) > 0:
+                embedding = embeddings[0].get("embedding", [])
+                if embedding:
+                    return normalize_encoding(embedding)
+            return None
         except Exception as e:
             logger.error(f"Face encoding error: {e}")
             return None
     
+    def get_face_encodings_batch(
+        self,
+        image: np.ndarray,
+        face_locations: List[Tuple[int, int, int, int]]
+    ) -> List[np.ndarray]:
+        """
+        Embed several face crops of one image in a single forward pass.
+        
+        Crops are preprocessed with DeepFace's own resize (aspect-preserving
+        pad), so the embeddings live in the same space as the represent()
+        gallery. If that helper is missing or the one-time consistency check
+        failed, each crop goes through represent() instead.
+        
+        Args:
+            image: RGB image as numpy array
+            face_locations: (top, right, bottom, left) tuples, e.g. from detect_faces
+        
+        Returns:
+            One 512-d float32 unit vector per location, in the same order;
+            an empty list if embedding failed.
+        """
+        if not self.available or not face_locations:
+            return []
+        
+        crops = [image[top:bottom, left:right] for top, right, bottom, left in face_locations]
+        if self._batch_ok is None:
+            self._batch_ok = self._check_batch_consistency()
+        
+        try:
+            if self._batch_ok:
+                return self._embed_crops(crops)
+            encodings = [self._represent_crop(crop) for crop in crops]
+            return encodings if all(e is not None for e in encodings) else []
+        except Exception as e:
+            logger.error(f"Batched face encoding error: {e}")
+            return []
+    
+    def _embed_crops(self, crops: List[np.ndarray]) -> List[np.ndarray]:
+        """Embed RGB face crops in one forward pass, preprocessed like represent()."""
+        height, width = FACENET_INPUT_SIZE
+        # resize_image pads to the input size, scales to [0, 1] and adds the batch axis
+        batch = np.concatenate([
+            deepface_resize_image(self._to_deepface_input(crop), (height, width))
+            for crop in crops
+        ]).astype(np.float32, copy=False)
+        
+        # Reuse the preloaded model so GPU placement and fp16 policy apply
+        model = self._model or DeepFace.build_model(self.MODEL_NAME)
+        # deepface>=0.0.80 wraps the keras model; older versions return it directly
+        keras_model = getattr(model, "model", model)
+        embeddings = keras_model.predict(batch, batch_size=len(batch), verbose=0)
+        
+        return [normalize_encoding(embedding) for embedding in embeddings]
+    
+    def _represent_crop(self, crop: np.ndarray) -> Optional[np.ndarray]:
+        """Embed one RGB face crop through represent() with detection skipped."""
+        embeddings = DeepFace.represent(
+            img_path=self._to_deepface_input(crop),
+            model_name=self.MODEL_NAME,
+            detector_backend="skip",
+            enforce_detection=False
+        )
+        if embeddings and embeddings[0].get("embedding"):
+            return normalize_encoding(embeddings[0]["embedding"])
+        return None
+    
+    def _check_batch_consistency(self) -> bool:
+        """
+        Check that the batched path embeds a crop like represent() does.
+        
+        DeepFace's preprocessing (padding, channel order, scaling) has changed
+        between releases; a mismatch would quietly put batched embeddings in a
+        different space than the stored gallery, so it disables batching.
+        """
+        if deepface_resize_image is None:
+            logger.info("DeepFace resize helper not found, embedding face crops one at a time")
+            return False
+        
+        # Non-square and asymmetric, so padding or channel mix-ups show up
+        crop = np.random.default_rng(0).integers(0, 256, (96, 72, 3), dtype=np.uint8)
+        try:
+            batched = self._embed_crops([crop])[0]
+            single = self._represent_crop(crop)
+        except Exception as e:
+            logger.warning(f"Batched face embedding check failed: {e}")
+            return False
+        
+        similarity = float(batched @ single) if single is not None else -1.0
+        if similarity < EMBED_MIN_SIMILARITY:
+            logger.warning(
+                f"Batched face embeddings differ from DeepFace.represent "
+                f"(cosine {similarity:.4f}), embedding face crops one at a time"
+            )
+            return False
+        return True
+    
     def get_face_encoding_from_base64(self, base64_str: str) -> Optional[np.ndarray]:
         """Get face encoding from base64 image."""
         image = self.decode_image(base64_str)
@@ -171,28 +603,33 @@ class FaceService:
         """
         Compare two face encodings using cosine distance.
         
+        Both encodings must be unit vectors (as returned by get_face_encoding
+        and deserialize_encoding), so the distance is just 1 - dot.
+        
         Returns:
             Tuple of (is_match, confidence) where higher confidence = better match (0 to 1)
         """
         if not self.available:
             return False, 0.0
         
-        try:
-            # Compute cosine distance
-            known_norm = known_encoding / np.linalg.norm(known_encoding)
-            unknown_norm = unknown_encoding / np.linalg.norm(unknown_encoding)
-            cosine_distance = 1 - np.dot(known_norm, unknown_norm)
-            
-            is_match = cosine_distance < self.MATCH_THRESHOLD
-            # Convert distance to confidence (0 = no match, 1 = perfect match)
-            confidence = max(0.0, 1.0 - (cosine_distance / self.MATCH_THRESHOLD))
-            
-            logger.debug(f"Face comparison: distance={cosine_distance:.3f}, threshold={self.MATCH_THRESHOLD}, match={is_match}")
-            
-            return is_match, confidence
-        except Exception as e:
-            logger.error(f"Face comparison error: {e}")
-            return False, 0.0
+        # One dot product; no norms or normalized copies on the hot path
+        cosine_distance = 1.0 - float(known_encoding @ unknown_encoding)
+        threshold = self.MATCH_THRESHOLD
+        # Convert distance to confidence (0 = no match, 1 = perfect match)
+        return cosine_distance < threshold, max(0.0, 1.0 - cosine_distance / threshold)
+    
+    def compare_faces_unnormalized(
+        self,
+        known_encoding: np.ndarray,
+        unknown_encoding: np.ndarray
+    ) -> Tuple[bool, float]:
+        """
+        Compare two face encodings of any norm (e.g. raw DeepFace output).
+        
+        Returns:
+            Same as compare_faces
+        """
+        return self.compare_faces(normalize_encoding(known_encoding), normalize_encoding(unknown_encoding))
     
     def find_best_match(
         self,
@@ -202,53 +639,203 @@ class FaceService:
         """
         Find the best matching person from a list of known encodings.
         
+        Galleries of LSH_MIN_GALLERY_SIZE or more are first narrowed to the
+        rows whose sign hash is close to the query's, so the full dot product
+        only runs on likely matches. This is approximate: a true match can,
+        rarely, be pruned. Galleries of INT8_MIN_GALLERY_SIZE or more are
+        scored on int8 codes, so their distances carry ~1e-3 quantization error.
+        
         Args:
-            unknown_encoding: Face encoding to match
-            known_encodings: List of (person_id, encoding) tuples
-            
+            unknown_encoding: Face encoding to match (unit vector)
+            known_encodings: List of (person_id, encoding) tuples (unit vectors)
+        
         Returns:
             Tuple of (person_id, confidence) or None if no match
         """
         if not self.available or not known_encodings:
             return None
         
-        best_match = None
-        best_confidence = 0.0
+        try:
+            gallery = self._get_list_gallery(known_encodings)
+        except Exception as e:
+            logger.error(f"Face matching error: {e}")
+            return None
+        return self._match_gallery(unknown_encoding, gallery)
+    
+    def find_best_match_db(
+        self,
+        session: Session,
+        unknown_encoding: np.ndarray
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Find the best matching person among everyone with a stored face.
+        
+        The gallery matrix is loaded from the database once and cached until
+        a Person face_embedding changes (see invalidate_gallery), so repeat
+        lookups skip the query and per-row deserialization.
+        
+        Args:
+            session: Database session used to load the gallery on a cache miss
+            unknown_encoding: Face encoding to match (unit vector)
+        
+        Returns:
+            Tuple of (person_id, confidence) or None if no match
+        """
+        if not self.available:
+            return None
+        
+        try:
+            gallery = self._get_db_gallery(session)
+        except Exception as e:
+            logger.error(f"Face gallery load error: {e}")
+            return None
+        if not gallery.ids:
+            return None
+        return self._match_gallery(unknown_encoding, gallery)
+    
+    def invalidate_gallery(self) -> None:
+        """Drop the cached DB gallery; the next find_best_match_db reloads it."""
+        self._gallery_version += 1
+    
+    def _get_db_gallery(self, session: Session) -> FaceGallery:
+        """Cached gallery of all stored faces, loading it if stale."""
+        cache = self._gallery_cache
+        version = self._gallery_version
+        if cache is not None and cache[0] == version:
+            return cache[1]
         
-        for person_id, known_encoding in known_encodings:
-            is_match, confidence = self.compare_faces(known_encoding, unknown_encoding)
-            logger.debug(f"Comparing with person {person_id}: match={is_match}, confidence={confidence:.3f}")
-            if is_match and confidence > best_confidence:
-                best_match = person_id
-                best_confidence = confidence
+        rows = (
+            session.query(Person.id, Person.face_embedding)
+            .filter(Person.face_embedding.isnot(None))
+            .all()
+        )
+        ids: List[str] = []
+        matrix = np.empty((len(rows), EMBEDDING_DIM), dtype=np.float32)
+        for person_id, data in rows:
+            try:
+                # Raw rows are a view over the blob, copied once into the matrix
+                matrix[len(ids)] = self.deserialize_encoding(data)
+                ids.append(person_id)
+            except Exception as e:
+                logger.error(f"Failed to load face for {person_id}: {e}")
+        gallery = FaceGallery.build(ids, matrix[:len(ids)])
         
-        if best_match:
-            logger.info(f"Found match: person_id={best_match}, confidence={best_confidence:.3f}")
-            return best_match, best_confidence
+        # Stored under the version read before the query, so an invalidation
+        # that races with the load forces another reload
+        self._gallery_cache = (version, gallery)
+        logger.info(f"Loaded face gallery: {len(ids)} people")
+        return gallery
+    
+    def _match_gallery(
+        self,
+        unknown_encoding: np.ndarray,
+        gallery: FaceGallery
+    ) -> Optional[Tuple[str, float]]:
+        """Closest gallery row to the encoding, if within MATCH_THRESHOLD."""
+        ids = gallery.ids
+        try:
+            unknown = np.asarray(unknown_encoding, dtype=np.float32)
+            
+            if gallery.signatures is not None:
+                hamming = hamming_distances(sign_hash(unknown)[0], gallery.signatures)
+                candidates = np.flatnonzero(hamming <= LSH_MAX_HAMMING)
+                if candidates.size == 0:
+                    logger.info("No matching face found among known people")
+                    return None
+                # Cosine distance to the surviving candidates only
+                distances = 1.0 - gallery.similarities(unknown, candidates)
+                best = int(np.argmin(distances))
+                idx = int(candidates[best])
+                cosine_distance = float(distances[best])
+            elif gallery.matrix is not None and len(ids) > KERNEL_MIN_GALLERY_SIZE:
+                # Fused distance + argmin scan (compiled when Numba is present)
+                idx, cosine_distance = best_match(gallery.matrix, unknown)
+                idx = int(idx)
+                cosine_distance = float(cosine_distance)
+            else:
+                # Cosine distance to every known face in one matmul
+                distances = 1.0 - gallery.similarities(unknown)
+                idx = int(np.argmin(distances))
+                cosine_distance = float(distances[idx])
+        except Exception as e:
+            logger.error(f"Face matching error: {e}")
+            return None
+        
+        # Rounding (float32, or int8 codes) can put an identical face just below 0
+        cosine_distance = max(cosine_distance, 0.0)
+        
+        logger.debug(f"Closest of {len(ids)} faces: person {ids[idx]}, distance={cosine_distance:.3f}")
+        
+        if cosine_distance < self.MATCH_THRESHOLD:
+            person_id = ids[idx]
+            confidence = max(0.0, 1.0 - (cosine_distance / self.MATCH_THRESHOLD))
+            logger.info(f"Found match: person_id={person_id}, confidence={confidence:.3f}")
+            return person_id, confidence
         
         logger.info("No matching face found among known people")
         return None
     
+    def _get_list_gallery(self, known_encodings: List[Tuple[str, np.ndarray]]) -> FaceGallery:
+        """
+        Gallery stacked from the given encodings.
+        
+        Reuses the cached gallery while the same ids and encoding arrays are
+        passed in; any change to the list rebuilds it.
+        """
+        ids = [person_id for person_id, _ in known_encodings]
+        encodings = [encoding for _, encoding in known_encodings]
+        
+        gallery = self._list_gallery
+        if (
+            gallery is not None
+            and ids == gallery.ids
+            and all(a is b for a, b in zip(encodings, self._gallery_encodings))
+        ):
+            return gallery
+        
+        gallery = FaceGallery.build(ids, np.stack(encodings).astype(np.float32, copy=False))
+        self._list_gallery = gallery
+        self._gallery_encodings = encodings
+        return gallery
+    
     def serialize_encoding(self, encoding: np.ndarray) -> bytes:
-        """Serialize face encoding to bytes for database storage."""
-        return pickle.dumps(encoding)
+        """Serialize face encoding to raw float32 bytes for database storage."""
+        data = np.ascontiguousarray(encoding, dtype=np.float32)
+        assert data.shape == (EMBEDDING_DIM,), f"Expected a ({EMBEDDING_DIM},) encoding, got {data.shape}"
+        return data.tobytes()
     
     def deserialize_encoding(self, data: bytes) -> np.ndarray:
-        """Deserialize face encoding from database."""
-        return pickle.loads(data)
+        """
+        Deserialize face encoding from database.
+        
+        Raw rows come back as a read-only view over the blob (no copy);
+        copy it before modifying in place.
+        """
+        if len(data) == EMBEDDING_DIM * 4:
+            return np.frombuffer(data, dtype=np.float32)
+        # Rows written before the raw format hold pickled, unnormalized arrays
+        return normalize_encoding(pickle.loads(data))
     
     def extract_and_save_face(
         self, 
         image: np.ndarray, 
         save_path: Path,
-        face_location: Optional[Tuple] = None
+        face_location: Optional[Tuple] = None,
+        detect: bool = True,
+        format: str = "jpeg"
     ) -> bool:
         """
         Extract face from image and save as reference photo.
         If DeepFace is not available or no face detected, saves the full image.
+        
+        Pass detect=False when detection already ran (e.g. in enroll) so a
+        missing face_location saves the full image without detecting again.
+        
+        format is "jpeg" or "webp" (~30% smaller at the same quality); the
+        file is written to save_path as given, so pick a matching suffix.
         """
         try:
-            if face_location is None and self.available:
+            if face_location is None and detect and self.available:
                 locations = self.detect_faces(image)
                 if locations:
                     face_location = locations[0]
@@ -270,8 +857,23 @@ class FaceService:
                 logger.info("No face detected, saving full image as reference")
                 face_image = image
             
-            pil_image = Image.fromarray(face_image)
-            pil_image.save(save_path, "JPEG", quality=85)
+            if format not in PHOTO_FORMATS:
+                raise ValueError(f"Unsupported photo format: {format}")
+            
+            if CV2_AVAILABLE:
+                bgr = cv2.cvtColor(face_image, cv2.COLOR_RGB2BGR)
+                if format == "webp":
+                    params = [int(cv2.IMWRITE_WEBP_QUALITY), PHOTO_QUALITY]
+                else:
+                    params = [int(cv2.IMWRITE_JPEG_QUALITY), PHOTO_QUALITY, int(cv2.IMWRITE_JPEG_OPTIMIZE), 1]
+                # imwrite would pick the codec from the path's suffix; imencode takes it explicitly
+                ok, encoded = cv2.imencode(PHOTO_FORMATS[format], bgr, params)
+                if not ok:
+                    raise ValueError(f"Could not encode {save_path}")
+                Path(save_path).write_bytes(encoded.tobytes())
+            else:
+                pil_image = Image.fromarray(face_image)
+                pil_image.save(save_path, format.upper(), quality=PHOTO_QUALITY)
             logger.info(f"Saved face image to {save_path}")
             return True
         except Exception as e:
@@ -289,3 +891,47 @@ def get_face_service() -> FaceService:
     if _face_service is None:
         _face_service = FaceService()
     return _face_service
+
+
+# Gallery invalidation: flushes that touch a stored face mark the session,
+# and the cache is dropped once that session commits
+_GALLERY_DIRTY_KEY = "face_gallery_dirty"
+
+
+def _mark_gallery_dirty(mapper, connection, target: Person) -> None:
+    """Flag the flushing session as having changed a stored face."""
+    session = inspect(target).session
+    if session is not None:
+        session.info[_GALLERY_DIRTY_KEY] = True
+
+
+@event.listens_for(Person, "after_insert")
+def _person_face_inserted(mapper, connection, target: Person) -> None:
+    """A new person only changes the gallery if they have a face."""
+    if target.face_embedding is not None:
+        _mark_gallery_dirty(mapper, connection, target)
+
+
+@event.listens_for(Person, "after_update")
+def _person_face_updated(mapper, connection, target: Person) -> None:
+    """Updates matter only when face_embedding itself changed."""
+    if inspect(target).attrs.face_embedding.history.has_changes():
+        _mark_gallery_dirty(mapper, connection, target)
+
+
+# The row is gone, so don't touch its (possibly unloaded) columns
+event.listen(Person, "after_delete", _mark_gallery_dirty)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_gallery_on_commit(session: Session) -> None:
+    """Drop the cached gallery once face changes are committed."""
+    if session.info.pop(_GALLERY_DIRTY_KEY, False) and _face_service is not None:
+        _face_service.invalidate_gallery()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_gallery_dirty(session: Session, previous_transaction) -> None:
+    """Rolled-back face changes never reached the database."""
+    session.info.pop(_GALLERY_DIRTY_KEY, None)
+
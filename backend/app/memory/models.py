@@ -3,17 +3,29 @@ SQLAlchemy models for People and Interactions.
 """
 
 import uuid
+import hashlib
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import Column, String, DateTime, Text, Float, ForeignKey, Boolean, JSON, LargeBinary
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy import Column, String, DateTime, Text, Float, ForeignKey, Boolean, JSON, LargeBinary, Index, select, func
+from sqlalchemy.orm import relationship, declarative_base, column_property
 
 Base = declarative_base()
 
 
 def generate_uuid() -> str:
-    """Generate a URL-safe UUID."""
-    return str(uuid.uuid4())
+    """Generate a URL-safe UUID (32 hex chars, no dashes; fits String(36))."""
+    return uuid.uuid4().hex
+
+
+def compute_transcript_hash(text: str) -> str:
+    """
+    Hex digest used to dedup transcripts (64 chars, fits transcript_hash).
+    
+    BLAKE2b-256 is 2-3x faster than SHA-256 in software and just as
+    collision-resistant for dedup. It is the same on every machine, so
+    hashes stay comparable across hosts.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=32).hexdigest()
 
 
 class Person(Base):
@@ -25,8 +37,10 @@ class Person(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     last_seen_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
-    # Recognition data (stored as pickled numpy arrays or null)
-    face_embedding = Column(LargeBinary, nullable=True)  # 128-d face encoding
+    # Recognition data (null when not captured)
+    # face_embedding is always an L2-normalized float32 512-d vector (Facenet512),
+    # so matching against it is a plain dot product with no norms at runtime
+    face_embedding = Column(LargeBinary, nullable=True)  # raw float32 bytes, shape (512,)
     speaker_embedding = Column(LargeBinary, nullable=True)  # For future speaker recognition
     
     # Metadata
@@ -37,8 +51,8 @@ class Person(Base):
     interactions = relationship("Interaction", back_populates="person", cascade="all, delete-orphan")
     
     @property
-    def interaction_count(self) -> int:
-        return len(self.interactions) if self.interactions else 0
+    def has_face(self) -> bool:
+        return self.face_embedding is not None or self.photo_path is not None
     
     def to_dict(self) -> dict:
         return {
@@ -46,7 +60,7 @@ class Person(Base):
             "name": self.name,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "last_seen_at": self.last_seen_at.isoformat() if self.last_seen_at else None,
-            "has_face": self.face_embedding is not None or self.photo_path is not None,
+            "has_face": self.has_face,
             "photo_path": self.photo_path,
             "notes": self.notes,
             "interaction_count": self.interaction_count,
@@ -56,6 +70,12 @@ class Person(Base):
 class Interaction(Base):
     """A recorded interaction/conversation with a person."""
     __tablename__ = "interactions"
+    __table_args__ = (
+        # A person's interactions, newest first (and the interaction_count subquery)
+        Index("ix_interactions_person_started", "person_id", "started_at"),
+        # Dedup lookups by transcript hash
+        Index("ix_interactions_transcript_hash", "transcript_hash"),
+    )
     
     id = Column(String(36), primary_key=True, default=generate_uuid)
     person_id = Column(String(36), ForeignKey("people.id"), nullable=False)
@@ -67,7 +87,7 @@ class Interaction(Base):
     
     # Content
     transcript = Column(Text, nullable=True)
-    transcript_hash = Column(String(64), nullable=True)  # SHA256 for dedup
+    transcript_hash = Column(String(64), nullable=True)  # BLAKE2b-256 hex for dedup (compute_transcript_hash)
     
     # Summary (JSON structure from Claude Haiku)
     summary_json = Column(JSON, nullable=True)
@@ -90,11 +110,15 @@ class Interaction(Base):
     # Relationship
     person = relationship("Person", back_populates="interactions")
     
+    @property
+    def person_name(self) -> Optional[str]:
+        return self.person.name if self.person else None
+    
     def to_dict(self) -> dict:
         return {
             "id": self.id,
             "person_id": self.person_id,
-            "person_name": self.person.name if self.person else None,
+            "person_name": self.person_name,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "ended_at": self.ended_at.isoformat() if self.ended_at else None,
             "duration_seconds": self.duration_seconds,
@@ -106,8 +130,18 @@ class Interaction(Base):
         }
 
 
+# Counted in SQL as part of the Person query, so listing people doesn't
+# lazy-load every interaction row just to take len()
+Person.interaction_count = column_property(
+    select(func.count(Interaction.id))
+    .where(Interaction.person_id == Person.id)
+    .correlate_except(Interaction)
+    .scalar_subquery()
+)
+
+
 # Pydantic models for API
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, model_validator
 from typing import Optional, List
 
 
@@ -122,10 +156,13 @@ class PersonUpdate(BaseModel):
 
 
 class PersonResponse(BaseModel):
+    """Built straight from a Person row (PersonResponse.model_validate(person))."""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
     name: str
-    created_at: Optional[str] = None
-    last_seen_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    last_seen_at: Optional[datetime] = None
     has_face: bool = False
     photo_path: Optional[str] = None
     notes: Optional[str] = None
@@ -140,17 +177,29 @@ class InteractionSummary(BaseModel):
 
 
 class InteractionResponse(BaseModel):
+    """Built straight from an Interaction row (InteractionResponse.model_validate(interaction))."""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
     person_id: str
     person_name: Optional[str] = None
-    started_at: Optional[str] = None
-    ended_at: Optional[str] = None
+    started_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
     duration_seconds: Optional[float] = None
     transcript: Optional[str] = None
-    summary: Optional[InteractionSummary] = None
+    summary: Optional[InteractionSummary] = Field(
+        default=None, validation_alias=AliasChoices("summary", "summary_json")
+    )
     audio_saved: bool = False
     audio_path: Optional[str] = None
     face_confidence: Optional[float] = None
+    
+    @model_validator(mode="after")
+    def _hide_unsaved_audio(self) -> "InteractionResponse":
+        # The path is only meaningful once the audio was actually kept
+        if not self.audio_saved:
+            self.audio_path = None
+        return self
 
 
 class InteractionStartRequest(BaseModel):
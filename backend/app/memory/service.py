@@ -2,8 +2,9 @@
 Memory Service - Orchestrates person recognition and interaction storage.
 """
 
-import hashlib
+import asyncio
 import logging
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -11,7 +12,9 @@ from typing import Dict, List, Optional, Any, Tuple
 
 from sqlalchemy.orm import Session
 
-from app.memory.models import Person, Interaction
+from app.memory.models import (
+    Person, Interaction, PersonResponse, InteractionResponse, compute_transcript_hash, generate_uuid
+)
 from app.memory.database import get_db_session, get_audio_path, get_face_path, AUDIO_DIR
 from app.memory.face_service import get_face_service, FaceService
 from app.memory.transcription import get_transcription_service, TranscriptionService
@@ -46,6 +49,10 @@ class MemoryService:
         
         # Active recording sessions
         self._active_sessions: Dict[str, ActiveSession] = {}
+        
+        # Identification runs in worker threads; serializes gallery
+        # match-then-create so one new face can't become two people
+        self._identify_lock = threading.Lock()
     
     # =========================================================================
     # Session Management
@@ -99,31 +106,21 @@ class MemoryService:
         
         logger.info(f"Stopping interaction {session_id}, duration: {duration:.1f}s")
         
-        # 1. Identify person from face
-        person_id, is_new_person, face_confidence = await self._identify_person(
-            face_image_base64, session
+        # 1-2. Identify person from face and get the transcript; they are
+        # independent, so face recognition overlaps server-side transcription
+        (person_id, is_new_person, face_confidence), transcript = await asyncio.gather(
+            self._identify_person(face_image_base64, session),
+            self._get_transcript(audio_data, browser_transcript),
         )
         
-        # 2. Get transcript - prefer browser's Web Speech API transcript
-        transcript = ""
-        if browser_transcript and browser_transcript.strip():
-            transcript = browser_transcript.strip()
-            logger.info(f"Using browser transcript: {len(transcript)} chars")
-        elif audio_data and len(audio_data) > 0:
-            # Fallback to server-side transcription (if Whisper is available)
-            transcript, _ = await self._transcribe_audio(audio_data)
-            logger.info(f"Server transcription result: {len(transcript) if transcript else 0} chars")
-        
-        if not transcript:
-            logger.warning("No transcript available from any source")
-        
         # 3. Generate summary
+        # Read the name once, in a short read-only session; no connection is
+        # held while the summary is generated
+        with get_db_session() as db:
+            person_name = db.query(Person.name).filter(Person.id == person_id).scalar() or "Unknown"
+        
         summary_dict = None
         if transcript:
-            with get_db_session() as db:
-                person = db.query(Person).filter(Person.id == person_id).first()
-                person_name = person.name if person else "Unknown"
-            
             summary_dict, _, _ = await self.summarization_service.summarize(
                 transcript,
                 context=f"Conversation with {person_name}"
@@ -138,7 +135,8 @@ class MemoryService:
             }
         
         # 4. Store interaction
-        interaction_id = str(uuid.uuid4())
+        # Same dashless hex ids as the model default; the audio filename uses it too
+        interaction_id = generate_uuid()
         audio_path = None
         
         if save_audio and audio_data:
@@ -146,14 +144,14 @@ class MemoryService:
             audio_path.write_bytes(audio_data)
             logger.info(f"Saved audio to {audio_path}")
         
+        # Hash before the write transaction so it isn't held open while hashing
+        transcript_hash = compute_transcript_hash(transcript) if transcript else None
+        
+        # One write transaction: bump last_seen_at and insert the interaction
         with get_db_session() as db:
-            # Update person's last_seen_at
-            person = db.query(Person).filter(Person.id == person_id).first()
-            if person:
-                person.last_seen_at = ended_at
-                person_name = person.name
-            else:
-                person_name = "Unknown"
+            db.query(Person).filter(Person.id == person_id).update(
+                {Person.last_seen_at: ended_at}, synchronize_session=False
+            )
             
             # Create interaction record
             interaction = Interaction(
@@ -163,7 +161,7 @@ class MemoryService:
                 ended_at=ended_at,
                 duration_seconds=duration,
                 transcript=transcript,
-                transcript_hash=hashlib.sha256(transcript.encode()).hexdigest() if transcript else None,
+                transcript_hash=transcript_hash,
                 summary_json=summary_dict,
                 audio_path=str(audio_path) if audio_path else None,
                 audio_saved=save_audio and audio_path is not None,
@@ -183,6 +181,25 @@ class MemoryService:
             "duration_seconds": duration,
         }
     
+    async def _get_transcript(
+        self,
+        audio_data: Optional[bytes],
+        browser_transcript: Optional[str]
+    ) -> str:
+        """Get the transcript, preferring the browser's Web Speech API transcript."""
+        transcript = ""
+        if browser_transcript and browser_transcript.strip():
+            transcript = browser_transcript.strip()
+            logger.info(f"Using browser transcript: {len(transcript)} chars")
+        elif audio_data and len(audio_data) > 0:
+            # Fallback to server-side transcription (if Whisper is available)
+            transcript, _ = await self._transcribe_audio(audio_data)
+            logger.info(f"Server transcription result: {len(transcript) if transcript else 0} chars")
+        
+        if not transcript:
+            logger.warning("No transcript available from any source")
+        return transcript
+    
     async def _identify_person(
         self,
         face_image_base64: Optional[str],
@@ -191,9 +208,20 @@ class MemoryService:
         """
         Identify person from face image.
         
+        Decoding, face detection and the DB lookup block, so they run in a
+        worker thread and can overlap transcription.
+        
         Returns:
             Tuple of (person_id, is_new_person, confidence)
         """
+        return await asyncio.to_thread(self._identify_person_sync, face_image_base64, session)
+    
+    def _identify_person_sync(
+        self,
+        face_image_base64: Optional[str],
+        session: ActiveSession
+    ) -> Tuple[str, bool, Optional[float]]:
+        """Blocking body of _identify_person."""
         if not face_image_base64:
             # No face image provided - create unknown person without photo
             return self._create_unknown_person(), True, None
@@ -204,41 +232,27 @@ class MemoryService:
             person_id = self._create_person_with_photo_only(face_image_base64)
             return person_id, True, None
         
-        # Get face encoding
-        face_encoding = self.face_service.get_face_encoding_from_base64(face_image_base64)
+        # Detect and encode the face in one detector pass
+        image = self.face_service.decode_image(face_image_base64)
+        face_encoding, face_location = self.face_service.enroll(image)
         if face_encoding is None:
             logger.warning("No face detected in image, saving photo anyway")
             # Still save the photo even if no face was detected
-            person_id = self._create_person_with_photo_only(face_image_base64)
+            person_id = self._create_person_with_photo_only(face_image_base64, image)
             return person_id, True, None
         
-        # Get all known face encodings
-        known_encodings = self._get_all_face_encodings()
-        
-        if known_encodings:
-            # Try to match
-            match = self.face_service.find_best_match(face_encoding, known_encodings)
+        with self._identify_lock:
+            # Match against the cached gallery; the DB is only read after a face changed
+            with get_db_session() as db:
+                match = self.face_service.find_best_match_db(db, face_encoding)
             if match:
                 person_id, confidence = match
                 logger.info(f"Matched face to person {person_id} with confidence {confidence:.2f}")
                 return person_id, False, confidence
-        
-        # No match - create new person with this face
-        person_id = self._create_person_with_face(face_encoding, face_image_base64)
-        return person_id, True, 1.0
-    
-    def _get_all_face_encodings(self) -> List[Tuple[str, Any]]:
-        """Get all stored face encodings."""
-        encodings = []
-        with get_db_session() as db:
-            people = db.query(Person).filter(Person.face_embedding.isnot(None)).all()
-            for person in people:
-                try:
-                    encoding = self.face_service.deserialize_encoding(person.face_embedding)
-                    encodings.append((person.id, encoding))
-                except Exception as e:
-                    logger.error(f"Failed to deserialize face for {person.id}: {e}")
-        return encodings
+            
+            # No match - create new person with this face
+            person_id = self._create_person_with_face(face_encoding, image, face_location)
+            return person_id, True, 1.0
     
     def _create_unknown_person(self) -> str:
         """Create a new unknown person."""
@@ -250,8 +264,13 @@ class MemoryService:
         logger.info(f"Created unknown person: {person_id}")
         return person_id
     
-    def _create_person_with_face(self, face_encoding, face_image_base64: str) -> str:
-        """Create a new person with face encoding."""
+    def _create_person_with_face(
+        self,
+        face_encoding,
+        image,
+        face_location: Optional[Tuple[int, int, int, int]] = None
+    ) -> str:
+        """Create a new person with face encoding, reusing the detected face region for the photo."""
         with get_db_session() as db:
             person = Person(
                 name="Unknown",
@@ -264,8 +283,7 @@ class MemoryService:
             # Save face image
             face_path = get_face_path(person_id)
             try:
-                image = self.face_service.decode_image(face_image_base64)
-                self.face_service.extract_and_save_face(image, face_path)
+                self.face_service.extract_and_save_face(image, face_path, face_location, detect=False)
                 person.photo_path = str(face_path)
             except Exception as e:
                 logger.error(f"Failed to save face image: {e}")
@@ -273,8 +291,8 @@ class MemoryService:
         logger.info(f"Created person with face: {person_id}")
         return person_id
     
-    def _create_person_with_photo_only(self, face_image_base64: str) -> str:
-        """Create a new person with just a photo (no face encoding)."""
+    def _create_person_with_photo_only(self, face_image_base64: str, image=None) -> str:
+        """Create a new person with just a photo (no face encoding), reusing the decoded image if given."""
         with get_db_session() as db:
             person = Person(name="Unknown")
             db.add(person)
@@ -284,7 +302,8 @@ class MemoryService:
             # Save face image
             face_path = get_face_path(person_id)
             try:
-                image = self.face_service.decode_image(face_image_base64)
+                if image is None:
+                    image = self.face_service.decode_image(face_image_base64)
                 if self.face_service.extract_and_save_face(image, face_path):
                     person.photo_path = str(face_path)
                     logger.info(f"Saved photo for person {person_id}")
@@ -297,26 +316,28 @@ class MemoryService:
         return person_id
     
     async def _transcribe_audio(self, audio_data: bytes) -> Tuple[str, float]:
-        """Transcribe audio bytes."""
-        return self.transcription_service.transcribe_bytes(audio_data, suffix=".webm")
+        """Transcribe audio bytes in a worker thread."""
+        return await asyncio.to_thread(
+            self.transcription_service.transcribe_bytes, audio_data, ".webm"
+        )
     
     # =========================================================================
     # People Management
     # =========================================================================
     
-    def get_all_people(self) -> List[Dict[str, Any]]:
+    def get_all_people(self) -> List[PersonResponse]:
         """Get all people with interaction counts."""
         with get_db_session() as db:
             people = db.query(Person).order_by(Person.last_seen_at.desc()).all()
-            return [p.to_dict() for p in people]
+            return [PersonResponse.model_validate(p) for p in people]
     
-    def get_person(self, person_id: str) -> Optional[Dict[str, Any]]:
+    def get_person(self, person_id: str) -> Optional[PersonResponse]:
         """Get a single person by ID."""
         with get_db_session() as db:
             person = db.query(Person).filter(Person.id == person_id).first()
-            return person.to_dict() if person else None
+            return PersonResponse.model_validate(person) if person else None
     
-    def get_person_interactions(self, person_id: str) -> List[Dict[str, Any]]:
+    def get_person_interactions(self, person_id: str) -> List[InteractionResponse]:
         """Get all interactions for a person."""
         with get_db_session() as db:
             interactions = (
@@ -325,9 +346,9 @@ class MemoryService:
                 .order_by(Interaction.started_at.desc())
                 .all()
             )
-            return [i.to_dict() for i in interactions]
+            return [InteractionResponse.model_validate(i) for i in interactions]
     
-    def rename_person(self, person_id: str, new_name: str) -> Optional[Dict[str, Any]]:
+    def rename_person(self, person_id: str, new_name: str) -> Optional[PersonResponse]:
         """Rename a person."""
         with get_db_session() as db:
             person = db.query(Person).filter(Person.id == person_id).first()
@@ -335,14 +356,14 @@ class MemoryService:
                 return None
             person.name = new_name
             db.flush()
-            return person.to_dict()
+            return PersonResponse.model_validate(person)
     
     def resolve_unknown(
         self, 
         unknown_person_id: str, 
         new_name: str,
         merge_with_person_id: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[PersonResponse]:
         """
         Resolve an unknown person to a name, optionally merging with existing.
         """
@@ -371,12 +392,15 @@ class MemoryService:
                 db.delete(unknown_person)
                 
                 logger.info(f"Merged {unknown_person_id} into {merge_with_person_id}")
-                return target_person.to_dict()
+                # interaction_count was loaded before the interactions moved
+                db.flush()
+                db.refresh(target_person, ["interaction_count"])
+                return PersonResponse.model_validate(target_person)
             else:
                 # Just rename
                 unknown_person.name = new_name
                 logger.info(f"Renamed {unknown_person_id} to {new_name}")
-                return unknown_person.to_dict()
+                return PersonResponse.model_validate(unknown_person)
     
     def delete_person(self, person_id: str) -> bool:
         """Delete a person and their interactions."""
@@ -403,11 +427,11 @@ class MemoryService:
             db.delete(person)
             return True
     
-    def get_interaction(self, interaction_id: str) -> Optional[Dict[str, Any]]:
+    def get_interaction(self, interaction_id: str) -> Optional[InteractionResponse]:
         """Get a single interaction by ID."""
         with get_db_session() as db:
             interaction = db.query(Interaction).filter(Interaction.id == interaction_id).first()
-            return interaction.to_dict() if interaction else None
+            return InteractionResponse.model_validate(interaction) if interaction else None
 
 
 # Singleton
@@ -8,6 +8,7 @@ import logging
 from typing import Dict, Any, Optional
 
 import httpx
+import orjson
 
 from app.config import get_settings
 
@@ -45,14 +46,21 @@ Rules:
 
     def __init__(self):
         settings = get_settings()
+        # Pool settings live on the transport since it replaces the default one
         self.client = httpx.AsyncClient(
             base_url=settings.keywords_ai_base_url,
             headers={
                 "Authorization": f"Bearer {settings.keywords_ai_api_key}",
                 "Content-Type": "application/json",
             },
-            timeout=30.0
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+            )
         )
+        # The system message never changes; build it once and share it
+        self._system_message = {"role": "system", "content": self.SYSTEM_PROMPT}
     
     async def summarize(
         self, 
@@ -87,7 +95,7 @@ Rules:
         payload = {
             "model": "claude-3-5-haiku-20241022",  # Claude Haiku for fast, cheap summaries
             "messages": [
-                {"role": "system", "content": self.SYSTEM_PROMPT},
+                self._system_message,
                 {"role": "user", "content": user_prompt}
             ],
             "max_tokens": 500,
@@ -108,15 +116,14 @@ Rules:
         }
         
         try:
-            response = await self.client.post("/chat/completions", json=payload)
+            # orjson is much faster than httpx's stdlib json encoder; the
+            # client already sends Content-Type: application/json
+            response = await self.client.post("/chat/completions", content=orjson.dumps(payload))
             response.raise_for_status()
             
-            result = response.json()
+            result = orjson.loads(response.content)
             content = result["choices"][0]["message"]["content"]
             
-            # Parse JSON from response
-            import json
-            
             # Try to extract JSON from the response
             try:
                 # Remove any markdown code blocks if present
@@ -125,8 +132,8 @@ Rules:
                 elif "```" in content:
                     content = content.split("```")[1].split("```")[0]
                 
-                summary = json.loads(content.strip())
-            except json.JSONDecodeError:
+                summary = orjson.loads(content.strip())
+            except orjson.JSONDecodeError:
                 # Fallback: create basic summary from raw text
                 summary = {
                     "summary": content[:200].strip(),
@@ -188,3 +195,11 @@ def get_summarization_service() -> SummarizationService:
     if _summarization_service is None:
         _summarization_service = SummarizationService()
     return _summarization_service
+
+
+async def close_summarization_service() -> None:
+    """Close the singleton's HTTP client, if it was ever created."""
+    global _summarization_service
+    if _summarization_service is not None:
+        await _summarization_service.close()
+        _summarization_service = None
@@ -1,20 +1,36 @@
 """
-Transcription Service using OpenAI Whisper.
+Transcription Service using Whisper.
 Converts audio to text for conversation memory.
 
-NOTE: Whisper requires Python <3.10 due to numba dependency.
-For Python 3.13, this provides a fallback placeholder.
-Install whisper separately: pip install openai-whisper (in Python 3.9 env)
+Backends, in order of preference:
+- faster-whisper (CTranslate2, int8 on CPU / float16 on GPU), from the
+  `accel` extra
+- openai-whisper (PyTorch, fp16 on GPU / fp32 on CPU), installed separately
+- neither: a placeholder transcript, so recording still works
 """
 
 import os
 import logging
 import tempfile
+from io import BytesIO
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple, Union
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Whisper's native sample rate; decoded audio is resampled to this
+WHISPER_SAMPLE_RATE = 16000
+
+# PyAV decodes the upload in-process; without it Whisper shells out to ffmpeg
+# on a temp file
+AV_AVAILABLE = False
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    pass
+
 # Try to import whisper
 WHISPER_AVAILABLE = False
 try:
@@ -26,11 +42,42 @@ except ImportError as e:
 except Exception as e:
     logger.warning(f"whisper failed to load: {e}. Transcription will use fallback mode.")
 
+# faster-whisper runs the same models on CTranslate2, ~4x faster on CPU
+FASTER_WHISPER_AVAILABLE = False
+try:
+    import ctranslate2
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+    logger.info("faster-whisper library loaded")
+except ImportError:
+    pass
+
+
+def decode_audio(audio_data: bytes) -> np.ndarray:
+    """Decode encoded audio (webm/opus, mp3, wav, ...) to mono float32 at 16 kHz."""
+    resampler = av.AudioResampler(format="flt", layout="mono", rate=WHISPER_SAMPLE_RATE)
+    chunks = []
+    with av.open(BytesIO(audio_data)) as container:
+        for frame in container.decode(audio=0):
+            for resampled in resampler.resample(frame):
+                chunks.append(resampled.to_ndarray().reshape(-1))
+        # Flush samples still buffered in the resampler
+        for resampled in resampler.resample(None):
+            chunks.append(resampled.to_ndarray().reshape(-1))
+    
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(chunks).astype(np.float32, copy=False)
+
 
 class TranscriptionService:
     """
     Speech-to-text transcription using OpenAI Whisper.
     
+    faster-whisper is used instead when installed, quantized to int8 on CPU
+    and float16 on GPU, with its VAD filter skipping silent stretches. The
+    reference implementation runs fp16 on GPU and fp32 on CPU.
+    
     Model choices:
     - tiny: fastest, ~1GB VRAM, okay accuracy
     - base: good balance, ~1GB VRAM
@@ -44,8 +91,10 @@ class TranscriptionService:
     
     def __init__(self):
         self.model = None
-        self.available = WHISPER_AVAILABLE
+        self.available = FASTER_WHISPER_AVAILABLE or WHISPER_AVAILABLE
         self._loaded = False
+        self._faster = False
+        self._fp16 = False
     
     def load(self):
         """Load Whisper model (lazy loading)."""
@@ -54,23 +103,35 @@ class TranscriptionService:
         
         logger.info(f"Loading Whisper model: {self.MODEL_NAME}")
         try:
-            self.model = whisper.load_model(self.MODEL_NAME)
+            if FASTER_WHISPER_AVAILABLE:
+                on_gpu = ctranslate2.get_cuda_device_count() > 0
+                self.model = WhisperModel(
+                    self.MODEL_NAME,
+                    device="cuda" if on_gpu else "cpu",
+                    compute_type="float16" if on_gpu else "int8",
+                )
+                self._faster = True
+            else:
+                self.model = whisper.load_model(self.MODEL_NAME)
+                # FP16 only on GPU; CPU kernels need FP32
+                self._fp16 = self.model.device.type == "cuda"
             self._loaded = True
-            logger.info("Whisper model loaded")
+            logger.info(f"Whisper model loaded ({'faster-whisper' if self._faster else 'openai-whisper'})")
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {e}")
             self.available = False
     
     def transcribe(
         self, 
-        audio_path: Path,
+        audio_path: Union[Path, np.ndarray],
         language: str = "en"
     ) -> Tuple[str, float]:
         """
         Transcribe audio file to text.
         
         Args:
-            audio_path: Path to audio file (webm, mp3, wav, etc.)
+            audio_path: Path to audio file (webm, mp3, wav, etc.), or
+                decoded mono float32 samples at 16 kHz
             language: Language code (e.g., 'en', 'es', 'fr')
             
         Returns:
@@ -86,23 +147,20 @@ class TranscriptionService:
             return self._fallback_transcribe(audio_path)
         
         try:
-            logger.info(f"Transcribing: {audio_path}")
-            
-            result = self.model.transcribe(
-                str(audio_path),
-                language=language,
-                fp16=False,  # Use FP32 for CPU compatibility
-            )
+            if isinstance(audio_path, np.ndarray):
+                audio = audio_path
+                logger.info(f"Transcribing {len(audio) / WHISPER_SAMPLE_RATE:.1f}s of decoded audio")
+            else:
+                audio = str(audio_path)
+                logger.info(f"Transcribing: {audio_path}")
             
-            transcript = result["text"].strip()
+            transcript, no_speech_probs = self._run_model(audio, language)
             
             # Calculate average confidence from segments
-            segments = result.get("segments", [])
-            if segments:
+            if no_speech_probs:
                 avg_confidence = sum(
-                    1.0 - seg.get("no_speech_prob", 0.0) 
-                    for seg in segments
-                ) / len(segments)
+                    1.0 - p for p in no_speech_probs
+                ) / len(no_speech_probs)
             else:
                 avg_confidence = 0.5
             
@@ -113,6 +171,34 @@ class TranscriptionService:
             logger.error(f"Transcription error: {e}")
             return "", 0.0
     
+    def _run_model(
+        self,
+        audio: Union[str, np.ndarray],
+        language: str
+    ) -> Tuple[str, List[float]]:
+        """
+        Run the loaded backend.
+        
+        Returns:
+            Tuple of (transcript, per-segment no-speech probabilities)
+        """
+        if self._faster:
+            # Segments are generated lazily; decoding happens while iterating
+            segments, _ = self.model.transcribe(audio, language=language, vad_filter=True)
+            segments = list(segments)
+            transcript = "".join(seg.text for seg in segments).strip()
+            return transcript, [seg.no_speech_prob for seg in segments]
+        
+        result = self.model.transcribe(
+            audio,
+            language=language,
+            fp16=self._fp16,
+        )
+        return (
+            result["text"].strip(),
+            [seg.get("no_speech_prob", 0.0) for seg in result.get("segments", [])],
+        )
+    
     def transcribe_bytes(
         self, 
         audio_data: bytes,
@@ -122,6 +208,9 @@ class TranscriptionService:
         """
         Transcribe audio from bytes.
         
+        With PyAV the bytes are decoded in-process, skipping the temp file
+        and the ffmpeg subprocess Whisper would otherwise spawn.
+        
         Args:
             audio_data: Raw audio bytes
             suffix: File extension (e.g., '.webm', '.mp3')
@@ -130,6 +219,14 @@ class TranscriptionService:
         Returns:
             Tuple of (transcript, confidence)
         """
+        if AV_AVAILABLE and self.available:
+            try:
+                audio = decode_audio(audio_data)
+            except Exception as e:
+                logger.warning(f"In-process audio decode failed, using ffmpeg: {e}")
+            else:
+                return self.transcribe(audio, language)
+        
         # Write to temp file
         with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
             f.write(audio_data)
@@ -148,7 +245,7 @@ class TranscriptionService:
         """Fallback when Whisper is not available."""
         logger.warning("Using fallback transcription (Whisper not available)")
         # Return a placeholder message that explains the situation
-        return "[Audio recorded - Transcription requires Whisper (Python 3.9 compatible)]", 0.3
+        return "[Audio recorded - Transcription requires faster-whisper or openai-whisper]", 0.3
 
 
 # Singleton
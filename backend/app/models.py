@@ -3,15 +3,27 @@ Pydantic models for API requests and responses.
 Defines the data contracts for the Aeye API.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Literal
-from enum import Enum
+import base64
+from pydantic import BaseModel, Field, TypeAdapter, computed_field, field_serializer
+from typing import Any, Dict, List, Optional, Literal
+import numpy as np
+from enum import Enum, IntFlag
 
 
 # ============================================================================
 # Detection Models
 # ============================================================================
 
+# Decimal places kept when serializing per-frame coordinates/scores; three is
+# well below a pixel at camera resolutions and keeps payloads small
+SERIALIZE_DECIMALS = 3
+
+
+def _round_float(value: Optional[float]) -> Optional[float]:
+    """Round a float for transport, passing None through."""
+    return None if value is None else round(value, SERIALIZE_DECIMALS)
+
+
 class BoundingBox(BaseModel):
     """Normalized bounding box [x1, y1, x2, y2] in range [0, 1]."""
     x1: float = Field(..., ge=0.0, le=1.0)
@@ -19,6 +31,10 @@ class BoundingBox(BaseModel):
     x2: float = Field(..., ge=0.0, le=1.0)
     y2: float = Field(..., ge=0.0, le=1.0)
     
+    @field_serializer("x1", "y1", "x2", "y2")
+    def _serialize_coord(self, value: float) -> float:
+        return _round_float(value)
+    
     @property
     def center_x(self) -> float:
         return (self.x1 + self.x2) / 2
@@ -65,6 +81,56 @@ class Detection(BaseModel):
     distance_bucket: Optional[Literal["near", "mid", "far"]] = None
     distance_est_m: Optional[float] = None
     distance_score: Optional[float] = None
+    
+    @field_serializer("confidence", "distance_est_m", "distance_score")
+    def _serialize_score(self, value: Optional[float]) -> Optional[float]:
+        return _round_float(value)
+
+
+# Serializes a whole detection list in one pydantic-core pass instead of
+# one model_dump() per detection
+_DETECTION_LIST = TypeAdapter(List[Detection])
+
+
+def dump_detections(detections: List[Detection]) -> List[dict]:
+    """Dump detections to plain dicts for a JSON response."""
+    return _DETECTION_LIST.dump_python(detections)
+
+
+# Column order of the packed detection matrix; track_id is -1 when unset and
+# label indexes the accompanying label list
+PACKED_COLUMNS = ("x1", "y1", "x2", "y2", "confidence", "track_id", "label")
+
+
+def pack_detections(detections: List[Detection]) -> Dict[str, Any]:
+    """
+    Pack detections into a base64 float32 matrix for overlay clients.
+    
+    One (N, 7) little-endian float32 array in PACKED_COLUMNS order plus the
+    label vocabulary; decodes to a Float32Array in the browser without
+    building a dict per detection on either side.
+    """
+    labels: List[str] = []
+    label_index: Dict[str, int] = {}
+    rows = np.empty((len(detections), len(PACKED_COLUMNS)), dtype="<f4")
+    
+    for row, det in zip(rows, detections):
+        idx = label_index.get(det.label)
+        if idx is None:
+            idx = label_index[det.label] = len(labels)
+            labels.append(det.label)
+        box = det.bbox
+        row[:] = (
+            box.x1, box.y1, box.x2, box.y2, det.confidence,
+            -1 if det.track_id is None else det.track_id, idx
+        )
+    
+    return {
+        "columns": PACKED_COLUMNS,
+        "labels": labels,
+        "count": len(detections),
+        "data": base64.b64encode(rows.tobytes()).decode("ascii")
+    }
 
 
 class DetectionRequest(BaseModel):
@@ -87,6 +153,10 @@ class DetectionResponse(BaseModel):
 class OCRRequest(BaseModel):
     """Request body for /ocr endpoint."""
     image_base64: str = Field(..., description="Base64 encoded image")
+    prefilter: bool = Field(
+        default=False,
+        description="Skip OCR on frames with no text-like edges (for live clients)"
+    )
 
 
 class OCRResponse(BaseModel):
@@ -151,12 +221,29 @@ class GateDecision(BaseModel):
     proximity_override: bool = False
 
 
+class ReasonFlag(IntFlag):
+    """Why an object scored as it did; names double as the trace reason strings."""
+    IN_PATH = 1 << 0
+    VERY_CLOSE = 1 << 1
+    CLOSE = 1 << 2
+    NEARBY = 1 << 3
+    APPROACHING = 1 << 4
+    MOVING = 1 << 5
+    NEW = 1 << 6
+
+
 class ScoredObject(BaseModel):
     """Object with priority score."""
     id: int
     label: str
     score: float
-    reasons: List[str]
+    reasons_mask: int = Field(default=0, exclude=True)
+    
+    @computed_field
+    @property
+    def reasons(self) -> List[str]:
+        """Reason names, only expanded from the mask when serialized."""
+        return [flag.name.lower() for flag in ReasonFlag if self.reasons_mask & flag]
 
 
 class AgentTrace(BaseModel):
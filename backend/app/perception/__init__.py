@@ -3,6 +3,7 @@
 from app.perception.detector import ObjectDetector, get_detector
 from app.perception.tracker import ObjectTracker, get_tracker
 from app.perception.ocr import OCREngine, get_ocr_engine
+from app.perception.batching import BatchingDetector
 
 __all__ = [
     "ObjectDetector",
@@ -11,4 +12,5 @@ __all__ = [
     "get_tracker",
     "OCREngine",
     "get_ocr_engine",
+    "BatchingDetector",
 ]
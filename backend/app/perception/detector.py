@@ -14,13 +14,14 @@ Design principles:
 - Restraint: only report what's useful, silence redundant data
 """
 
+import os
 import time
 import base64
 import logging
-from io import BytesIO
+import threading
 from typing import List, Tuple, Optional, Dict, Any
+import cv2
 import numpy as np
-from PIL import Image
 
 from ultralytics import YOLO
 
@@ -30,6 +31,43 @@ from app.models import Detection, BoundingBox
 
 logger = logging.getLogger(__name__)
 
+# Optional SIMD JPEG decoder (libjpeg-turbo); OpenCV decodes without it
+TURBOJPEG_AVAILABLE = False
+_turbojpeg = None
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbojpeg = TurboJPEG()
+    TURBOJPEG_AVAILABLE = True
+except (ImportError, OSError, RuntimeError):
+    # Package missing, or the libjpeg-turbo shared library isn't installed
+    pass
+
+
+def configure_inference_threads() -> int:
+    """
+    Pin the PyTorch thread count for this worker process.
+    
+    By default torch uses every core in each process; with several server
+    workers (or detection and OCR running at once) they oversubscribe the
+    CPU and thrash caches. OpenCV only decodes frames here, so it stays
+    single-threaded.
+    
+    Returns:
+        The torch thread count applied
+    """
+    settings = get_settings()
+    threads = settings.torch_threads or max(1, (os.cpu_count() or 1) // settings.workers)
+    
+    cv2.setNumThreads(1)
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+    
+    logger.info(f"Inference threads per worker: {threads}")
+    return threads
+
 
 # ============================================================================
 # COCO Classes - Curated for Assistive Vision
@@ -285,33 +323,51 @@ class ObjectDetector:
         self.model: Optional[YOLO] = None
         self.model_path = model_path
         self._loaded = False
+        # Detection runs on a thread pool; YOLO's predictor isn't thread-safe
+        self._lock = threading.Lock()
         
     def load(self) -> None:
         """Load YOLO model once at startup."""
-        if self._loaded:
-            return
-        
-        logger.info(f"Loading YOLO model: {self.model_path}")
-        start = time.time()
-        
-        self.model = YOLO(self.model_path)
-        
-        # Warm up model
-        dummy = np.zeros((640, 640, 3), dtype=np.uint8)
-        self.model.predict(dummy, verbose=False)
-        
-        load_time = (time.time() - start) * 1000
-        logger.info(f"YOLO model loaded in {load_time:.1f}ms")
-        self._loaded = True
+        with self._lock:
+            if self._loaded:
+                return
+            
+            logger.info(f"Loading YOLO model: {self.model_path}")
+            start = time.perf_counter()
+            
+            self.model = YOLO(self.model_path)
+            
+            # Warm up model
+            dummy = np.zeros((640, 640, 3), dtype=np.uint8)
+            self.model.predict(dummy, verbose=False)
+            
+            load_time = (time.perf_counter() - start) * 1000
+            logger.info(f"YOLO model loaded in {load_time:.1f}ms")
+            self._loaded = True
     
     def decode_image(self, base64_str: str) -> np.ndarray:
         """Decode base64 image to numpy array (RGB)."""
-        if "," in base64_str:
-            base64_str = base64_str.split(",")[1]
+        # A data URL's comma sits in the short header; don't scan the payload
+        comma = base64_str.find(",", 0, 64)
+        if comma != -1:
+            base64_str = base64_str[comma + 1:]
+        
+        return self.decode_bytes(base64.b64decode(base64_str))
+    
+    def decode_bytes(self, data: bytes) -> np.ndarray:
+        """Decode raw encoded image bytes (JPEG/PNG) to numpy array (RGB)."""
+        # Camera frames are JPEG; libjpeg-turbo decodes them straight to RGB
+        if TURBOJPEG_AVAILABLE and data[:2] == b"\xff\xd8":
+            try:
+                return _turbojpeg.decode(data, pixel_format=TJPF_RGB)
+            except Exception as e:
+                logger.debug(f"TurboJPEG decode failed, using OpenCV: {e}")
         
-        image_data = base64.b64decode(base64_str)
-        image = Image.open(BytesIO(image_data)).convert("RGB")
-        return np.array(image)
+        # frombuffer wraps the request body without copying it
+        image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if image is None:
+            raise ValueError("Could not decode image bytes")
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
     
     def detect(
         self,
@@ -337,20 +393,70 @@ class ObjectDetector:
         
         conf = confidence_threshold or self.settings.yolo_confidence_threshold
         
-        start = time.time()
-        results = self.model.predict(
-            image,
-            conf=conf,
-            verbose=False,
-            # Filter to TARGET_CLASSES only (reduces noise)
-            classes=list(TARGET_CLASSES.keys()),
+        start = time.perf_counter()
+        with self._lock:
+            results = self.model.predict(
+                image,
+                conf=conf,
+                verbose=False,
+                # Filter to TARGET_CLASSES only (reduces noise)
+                classes=list(TARGET_CLASSES.keys()),
+            )
+        inference_time = (time.perf_counter() - start) * 1000
+        
+        detections = self._parse_result(
+            results[0] if results else None, image, include_debug
         )
-        inference_time = (time.time() - start) * 1000
         
+        logger.debug(f"Detected {len(detections)} objects in {inference_time:.1f}ms")
+        return detections, inference_time
+    
+    def detect_batch(
+        self,
+        images: List[np.ndarray],
+        confidence_threshold: Optional[float] = None,
+    ) -> Tuple[List[List[Detection]], float]:
+        """
+        Detect objects in several images with one model forward pass.
+        
+        Images may differ in size (YOLO letterboxes each one).
+        
+        Returns:
+            Tuple of (detections per image, in input order; total inference ms)
+        """
+        if not self._loaded:
+            self.load()
+        
+        conf = confidence_threshold or self.settings.yolo_confidence_threshold
+        
+        start = time.perf_counter()
+        with self._lock:
+            results = self.model.predict(
+                images,
+                conf=conf,
+                verbose=False,
+                classes=list(TARGET_CLASSES.keys()),
+            )
+        inference_time = (time.perf_counter() - start) * 1000
+        
+        batch = [
+            self._parse_result(result, image, include_debug=False)
+            for result, image in zip(results, images)
+        ]
+        
+        logger.debug(f"Detected objects in a batch of {len(images)} in {inference_time:.1f}ms")
+        return batch, inference_time
+    
+    def _parse_result(
+        self,
+        result,
+        image: np.ndarray,
+        include_debug: bool,
+    ) -> List[Detection]:
+        """Convert one YOLO result into Detections, closest first."""
         detections = []
         
-        if results and len(results) > 0:
-            result = results[0]
+        if result is not None:
             boxes = result.boxes
             
             if boxes is not None:
@@ -417,9 +523,7 @@ class ObjectDetector:
         
         # Sort by distance (closest first - most dangerous/important)
         detections.sort(key=lambda d: d.distance_est_m)
-        
-        logger.debug(f"Detected {len(detections)} objects in {inference_time:.1f}ms")
-        return detections, inference_time
+        return detections
     
     def detect_from_base64(
         self,
@@ -430,6 +534,16 @@ class ObjectDetector:
         """Convenience method to detect from base64 encoded image."""
         image = self.decode_image(base64_str)
         return self.detect(image, confidence_threshold, include_debug)
+    
+    def detect_from_bytes(
+        self,
+        data: bytes,
+        confidence_threshold: Optional[float] = None,
+        include_debug: bool = False,
+    ) -> Tuple[List[Detection], float]:
+        """Detect from raw encoded image bytes, skipping the base64 round trip."""
+        image = self.decode_bytes(data)
+        return self.detect(image, confidence_threshold, include_debug)
 
 
 # Singleton instance
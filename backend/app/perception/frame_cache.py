@@ -0,0 +1,90 @@
+"""
+Short-lived Frame Cache
+Reuses the decoded frame and detections when the same image is posted to
+several endpoints back to back (e.g. /pipeline overlay + /live narration).
+"""
+
+import time
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
+import numpy as np
+
+from app.models import Detection
+
+logger = logging.getLogger(__name__)
+
+# Optional fast non-cryptographic hash for the frame keys
+XXHASH_AVAILABLE = False
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    pass
+
+
+# Frames kept; a live session only ever revisits the last few
+FRAME_CACHE_SIZE = 32
+
+# Seconds before a cached frame is considered stale
+FRAME_CACHE_TTL_SECONDS = 2.0
+
+
+def frame_key(image: Union[str, bytes]) -> Union[int, bytes]:
+    """Content hash of an encoded frame (base64 string or raw bytes)."""
+    raw = image.encode("ascii") if isinstance(image, str) else image
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(raw)
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+class FrameCache:
+    """
+    LRU of decoded frames and their detections with a TTL.
+    
+    Only touched from the event loop, so it needs no locking.
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = FRAME_CACHE_SIZE,
+        ttl: float = FRAME_CACHE_TTL_SECONDS
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Union[int, bytes], Tuple[float, np.ndarray, List[Detection]]]" = OrderedDict()
+    
+    def get(self, key: Union[int, bytes]) -> Optional[Tuple[np.ndarray, List[Detection]]]:
+        """
+        Return (frame, detections) for a fresh entry, else None.
+        
+        Detections are copies, so callers may set track IDs on them.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, frame, detections = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return frame, [d.model_copy() for d in detections]
+    
+    def put(
+        self,
+        key: Union[int, bytes],
+        frame: np.ndarray,
+        detections: List[Detection]
+    ) -> None:
+        """Store a decoded frame and copies of its detections."""
+        self._entries[key] = (time.monotonic(), frame, [d.model_copy() for d in detections])
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop every cached frame."""
+        self._entries.clear()
@@ -6,8 +6,10 @@ Uses EasyOCR for robust text detection and recognition.
 import time
 import base64
 import logging
+import threading
 from io import BytesIO
 from typing import List, Tuple, Optional
+import cv2
 import numpy as np
 from PIL import Image
 
@@ -18,6 +20,24 @@ from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Text pre-filter: glyph strokes make dense, strong horizontal gradients.
+# Frames with fewer strong-edge pixels than this fraction skip OCR entirely
+TEXT_EDGE_THRESHOLD = 60
+TEXT_EDGE_MIN_FRACTION = 0.005
+
+
+def has_text_edges(image: np.ndarray) -> bool:
+    """
+    Cheap check for text-like content (~1ms vs ~1s for a full OCR pass).
+    
+    Errs on the side of True: it only rules out flat, low-detail frames
+    (walls, sky, blurred motion), which are most live frames.
+    """
+    gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    sobel = cv2.Sobel(gray, cv2.CV_16S, 1, 0, ksize=3)
+    strong = np.count_nonzero(np.abs(sobel) > TEXT_EDGE_THRESHOLD)
+    return strong >= TEXT_EDGE_MIN_FRACTION * sobel.size
+
 
 class OCREngine:
     """
@@ -40,29 +60,46 @@ class OCREngine:
         self.languages = languages or self.settings.ocr_languages_list
         self.reader: Optional[easyocr.Reader] = None
         self._loaded = False
+        # Why the last load attempt failed; None while loading or once loaded
+        self.load_error: Optional[str] = None
+        # OCR runs on a thread pool; one reader call at a time
+        self._lock = threading.Lock()
+    
+    @property
+    def ready(self) -> bool:
+        """Whether the OCR model is loaded and can serve requests."""
+        return self._loaded
     
     def load(self) -> None:
-        """Load the OCR model. Called once at startup."""
-        if self._loaded:
-            return
-        
-        logger.info(f"Loading EasyOCR with languages: {self.languages}")
-        start = time.time()
-        
-        self.reader = easyocr.Reader(
-            self.languages,
-            gpu=False,  # CPU-only for hackathon portability
-            verbose=False
-        )
-        
-        load_time = (time.time() - start) * 1000
-        logger.info(f"EasyOCR loaded in {load_time:.1f}ms")
-        self._loaded = True
+        """Load the OCR model. Called once at startup; a failure is kept in load_error."""
+        with self._lock:
+            if self._loaded:
+                return
+            
+            logger.info(f"Loading EasyOCR with languages: {self.languages}")
+            start = time.perf_counter()
+            
+            try:
+                self.reader = easyocr.Reader(
+                    self.languages,
+                    gpu=False,  # CPU-only for hackathon portability
+                    verbose=False
+                )
+            except Exception as e:
+                self.load_error = str(e) or type(e).__name__
+                raise
+            
+            load_time = (time.perf_counter() - start) * 1000
+            logger.info(f"EasyOCR loaded in {load_time:.1f}ms")
+            self.load_error = None
+            self._loaded = True
     
     def decode_image(self, base64_str: str) -> np.ndarray:
         """Decode base64 image to numpy array (RGB)."""
-        if "," in base64_str:
-            base64_str = base64_str.split(",")[1]
+        # A data URL's comma sits in the short header; don't scan the payload
+        comma = base64_str.find(",", 0, 64)
+        if comma != -1:
+            base64_str = base64_str[comma + 1:]
         
         image_data = base64.b64decode(base64_str)
         image = Image.open(BytesIO(image_data)).convert("RGB")
@@ -71,7 +108,8 @@ class OCREngine:
     def read_text(
         self,
         image: np.ndarray,
-        min_confidence: float = 0.3
+        min_confidence: float = 0.3,
+        prefilter: bool = False
     ) -> Tuple[str, float, float]:
         """
         Extract text from an image.
@@ -79,6 +117,9 @@ class OCREngine:
         Args:
             image: RGB image as numpy array
             min_confidence: Minimum confidence for text blocks
+            prefilter: Skip the OCR model on frames with no text-like edges.
+                Only for automatic OCR; an explicit request should always
+                run the model, since low-contrast text can fail the check
             
         Returns:
             Tuple of (combined text, average confidence, inference time ms)
@@ -86,17 +127,21 @@ class OCREngine:
         if not self._loaded:
             self.load()
         
-        start = time.time()
+        start = time.perf_counter()
+        
+        if prefilter and not has_text_edges(image):
+            return "", 0.0, (time.perf_counter() - start) * 1000
         
         # Run OCR
-        results = self.reader.readtext(
-            image,
-            paragraph=True,  # Group text into paragraphs
-            min_size=10,
-            width_ths=0.7,
-        )
+        with self._lock:
+            results = self.reader.readtext(
+                image,
+                paragraph=True,  # Group text into paragraphs
+                min_size=10,
+                width_ths=0.7,
+            )
         
-        inference_time = (time.time() - start) * 1000
+        inference_time = (time.perf_counter() - start) * 1000
         
         # Filter and combine results
         texts = []
@@ -125,11 +170,12 @@ class OCREngine:
     def read_text_from_base64(
         self,
         base64_str: str,
-        min_confidence: float = 0.3
+        min_confidence: float = 0.3,
+        prefilter: bool = False
     ) -> Tuple[str, float, float]:
         """Convenience method to read text from base64 encoded image."""
         image = self.decode_image(base64_str)
-        return self.read_text(image, min_confidence)
+        return self.read_text(image, min_confidence, prefilter)
     
     def _normalize_text(self, text: str) -> str:
         """Clean and normalize OCR output."""
@@ -15,7 +15,7 @@ from app.models import Detection, BoundingBox, TrackedObject
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackState:
     """Internal state for a tracked object."""
     id: int
@@ -89,6 +89,35 @@ class TrackState:
         )
 
 
+@dataclass(slots=True)
+class TrackArrays:
+    """Structure-of-arrays view of tracked objects, in the same order, for vectorized scoring."""
+    ids: np.ndarray
+    labels: List[str]
+    cx: np.ndarray
+    area: np.ndarray
+    vx: np.ndarray
+    vy: np.ndarray
+    approaching: np.ndarray
+    
+    @classmethod
+    def from_objects(cls, objects: List[TrackedObject]) -> "TrackArrays":
+        """Build the arrays from a list of tracked objects."""
+        boxes = np.array(
+            [(o.bbox.x1, o.bbox.y1, o.bbox.x2, o.bbox.y2) for o in objects],
+            dtype=np.float64
+        ).reshape(-1, 4)
+        return cls(
+            ids=np.array([o.id for o in objects], dtype=np.int64),
+            labels=[o.label for o in objects],
+            cx=(boxes[:, 0] + boxes[:, 2]) / 2,
+            area=(boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1]),
+            vx=np.array([o.velocity_x for o in objects], dtype=np.float64),
+            vy=np.array([o.velocity_y for o in objects], dtype=np.float64),
+            approaching=np.array([o.is_approaching for o in objects], dtype=bool),
+        )
+
+
 def compute_iou(box1: BoundingBox, box2: BoundingBox) -> float:
     """Compute Intersection over Union between two bounding boxes."""
     # Intersection
@@ -106,6 +135,37 @@ def compute_iou(box1: BoundingBox, box2: BoundingBox) -> float:
     return intersection / union if union > 0 else 0.0
 
 
+def iou_matrix(
+    track_boxes: np.ndarray,
+    det_boxes: np.ndarray,
+    same_label: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized IOU between every track and every detection.
+    
+    Args:
+        track_boxes: (T, 4) array of x1, y1, x2, y2
+        det_boxes: (D, 4) array of x1, y1, x2, y2
+        same_label: (T, D) mask; pairs of different classes get 0
+    
+    Returns:
+        (T, D) IOU matrix, matching compute_iou pairwise
+    """
+    t = track_boxes[:, None, :]
+    d = det_boxes[None, :, :]
+    
+    iw = np.minimum(t[..., 2], d[..., 2]) - np.maximum(t[..., 0], d[..., 0])
+    ih = np.minimum(t[..., 3], d[..., 3]) - np.maximum(t[..., 1], d[..., 1])
+    intersection = iw * ih
+    
+    track_area = (t[..., 2] - t[..., 0]) * (t[..., 3] - t[..., 1])
+    det_area = (d[..., 2] - d[..., 0]) * (d[..., 3] - d[..., 1])
+    union = track_area + det_area - intersection
+    
+    valid = same_label & (iw > 0) & (ih > 0) & (union > 0)
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=valid)
+
+
 class ObjectTracker:
     """
     Simple IOU-based multi-object tracker.
@@ -135,11 +195,19 @@ class ObjectTracker:
         
         self.tracks: Dict[int, TrackState] = {}
         self.next_id = 1
+        
+        # SoA view of the objects returned by the last update()
+        self.arrays = TrackArrays.from_objects([])
+        
+        # Track ID assigned to each input detection of the last update(), by index
+        self.assignments: List[Optional[int]] = []
     
     def reset(self) -> None:
         """Reset all tracks."""
         self.tracks.clear()
         self.next_id = 1
+        self.arrays = TrackArrays.from_objects([])
+        self.assignments = []
     
     def update(
         self,
@@ -152,7 +220,7 @@ class ObjectTracker:
         Args:
             detections: List of detections from current frame
             timestamp: Current frame timestamp
-            
+        
         Returns:
             List of tracked objects with persistent IDs
         """
@@ -161,6 +229,8 @@ class ObjectTracker:
             for track in self.tracks.values():
                 track.frames_missing += 1
             self._prune_tracks()
+            self.arrays = TrackArrays.from_objects([])
+            self.assignments = []
             return []
         
         # Build cost matrix (negative IOU for assignment)
@@ -170,16 +240,24 @@ class ObjectTracker:
         
         if n_tracks == 0:
             # All detections become new tracks
-            return self._create_tracks(detections, timestamp)
+            result = self._create_tracks(detections, timestamp)
+            self.arrays = TrackArrays.from_objects(result)
+            self.assignments = [obj.id for obj in result]
+            return result
         
-        # Compute IOU matrix
-        iou_matrix = np.zeros((n_tracks, n_dets))
-        for i, tid in enumerate(track_ids):
-            track = self.tracks[tid]
-            for j, det in enumerate(detections):
-                # Only match same class
-                if track.label == det.label:
-                    iou_matrix[i, j] = compute_iou(track.bbox, det.bbox)
+        # Compute IOU matrix in one pass, only matching same class
+        tracks = [self.tracks[tid] for tid in track_ids]
+        track_boxes = np.array(
+            [(t.bbox.x1, t.bbox.y1, t.bbox.x2, t.bbox.y2) for t in tracks],
+            dtype=np.float64
+        )
+        det_boxes = np.array(
+            [(d.bbox.x1, d.bbox.y1, d.bbox.x2, d.bbox.y2) for d in detections],
+            dtype=np.float64
+        )
+        track_labels = np.array([t.label for t in tracks], dtype=object)
+        det_labels = np.array([d.label for d in detections], dtype=object)
+        ious = iou_matrix(track_boxes, det_boxes, track_labels[:, None] == det_labels[None, :])
         
         # Greedy matching
         matched_tracks = set()
@@ -188,22 +266,26 @@ class ObjectTracker:
         
         # Sort by IOU descending
         indices = np.dstack(np.unravel_index(
-            np.argsort(iou_matrix.ravel())[::-1], 
-            iou_matrix.shape
+            np.argsort(ious.ravel())[::-1], 
+            ious.shape
         ))[0]
         
         for i, j in indices:
+            # Everything after the first pair below threshold is too
+            if ious[i, j] < self.iou_threshold:
+                break
             if i in matched_tracks or j in matched_dets:
                 continue
-            if iou_matrix[i, j] < self.iou_threshold:
-                continue
             
             matches.append((track_ids[i], j))
             matched_tracks.add(i)
             matched_dets.add(j)
         
+        assignments: List[Optional[int]] = [None] * n_dets
+        
         # Update matched tracks
         for track_id, det_idx in matches:
+            assignments[det_idx] = track_id
             det = detections[det_idx]
             track = self.tracks[track_id]
             track.update_bbox(det.bbox, timestamp)
@@ -217,11 +299,16 @@ class ObjectTracker:
         # Create new tracks for unmatched detections
         for j, det in enumerate(detections):
             if j not in matched_dets:
-                self._create_track(det, timestamp)
+                assignments[j] = self._create_track(det, timestamp).id
         
         # Prune old tracks
         self._prune_tracks()
         
+        # A new track can evict an older one when max_tracks is reached
+        self.assignments = [
+            tid if tid in self.tracks else None for tid in assignments
+        ]
+        
         # Return all active tracks
         result = []
         for track in self.tracks.values():
@@ -229,6 +316,7 @@ class ObjectTracker:
             # Attach track_id to original detection for reference
             result.append(tracked)
         
+        self.arrays = TrackArrays.from_objects(result)
         return result
     
     def _create_track(self, detection: Detection, timestamp: float) -> TrackState:
@@ -0,0 +1,138 @@
+"""
+Frame Pipeline - Shared Decode → Detect → Track Path
+Every per-frame endpoint goes through here, so thread-pool offload, the
+batch coalescer and the frame cache are wired up in exactly one place.
+"""
+
+import time
+import asyncio
+import logging
+from concurrent.futures import Executor
+from typing import List, NamedTuple, Optional, Tuple, Union
+import numpy as np
+
+from app.models import Detection, TrackedObject
+from app.perception.batching import BatchingDetector
+from app.perception.detector import ObjectDetector
+from app.perception.frame_cache import FrameCache, frame_key
+from app.perception.tracker import ObjectTracker
+
+
+logger = logging.getLogger(__name__)
+
+
+class FrameResult(NamedTuple):
+    """One frame after detection and tracking."""
+    frame: np.ndarray
+    detections: List[Detection]
+    tracked: List[TrackedObject]
+    detect_time: float
+    timestamp: float
+
+
+class FramePipeline:
+    """
+    Decode, detect and track frames for the API endpoints.
+    
+    Design rationale:
+    - Decoding and detection block for ~100ms+, so they run on a bounded
+      executor and leave the event loop free
+    - Detection goes through the batcher so concurrent requests share
+      one YOLO forward pass
+    - The same frame is often posted to several endpoints back to back
+      (overlay + narration), so recent results come from the frame cache
+    """
+    
+    def __init__(
+        self,
+        detector: ObjectDetector,
+        tracker: ObjectTracker,
+        batcher: BatchingDetector,
+        executor: Optional[Executor] = None,
+        frame_cache: Optional[FrameCache] = None
+    ):
+        self.detector = detector
+        self.tracker = tracker
+        self.batcher = batcher
+        self.executor = executor
+        self.frame_cache = frame_cache or FrameCache()
+    
+    async def run_inference(self, fn, *args):
+        """Run a blocking decode/detection/OCR call on the inference executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, fn, *args)
+    
+    async def decode(self, image_base64: str) -> np.ndarray:
+        """Decode a base64 frame to an RGB array, off the event loop."""
+        return await self.run_inference(self.detector.decode_image, image_base64)
+    
+    async def decode_bytes(self, data: bytes) -> np.ndarray:
+        """Decode raw JPEG/PNG bytes to an RGB array, off the event loop."""
+        return await self.run_inference(self.detector.decode_bytes, data)
+    
+    async def detect(self, frame: np.ndarray) -> Tuple[List[Detection], float]:
+        """Run detection through the batcher, sharing a forward pass with concurrent requests."""
+        return await self.batcher.submit(frame)
+    
+    async def decode_and_detect(self, image: Union[str, bytes]) -> Tuple[np.ndarray, List[Detection], float]:
+        """
+        Decode and detect a frame given as base64 or raw JPEG/PNG bytes.
+        
+        A frame cache hit reports 0ms detection time.
+        """
+        key = frame_key(image)
+        cached = self.frame_cache.get(key)
+        if cached is not None:
+            frame, detections = cached
+            return frame, detections, 0.0
+        
+        if isinstance(image, bytes):
+            frame = await self.decode_bytes(image)
+        else:
+            frame = await self.decode(image)
+        detections, detect_time = await self.detect(frame)
+        self.frame_cache.put(key, frame, detections)
+        return frame, detections, detect_time
+    
+    def track(
+        self,
+        detections: List[Detection],
+        timestamp: float,
+        assign_ids: bool = False
+    ) -> List[TrackedObject]:
+        """
+        Update the tracker with one frame's detections.
+        
+        Args:
+            detections: Detections of the frame
+            timestamp: Frame timestamp
+            assign_ids: Also set track_id on each detection (overlay endpoints)
+        
+        Returns:
+            All active tracked objects
+        """
+        tracked = self.tracker.update(detections, timestamp)
+        if assign_ids:
+            for det, track_id in zip(detections, self.tracker.assignments):
+                det.track_id = track_id
+        return tracked
+    
+    async def detect_and_track(
+        self,
+        image: Union[str, bytes],
+        timestamp: Optional[float] = None,
+        assign_ids: bool = False
+    ) -> FrameResult:
+        """
+        Full per-frame path: decode, detect (cached/batched), track.
+        
+        Args:
+            image: Base64 encoded frame, or the raw JPEG/PNG bytes
+            timestamp: Frame timestamp; defaults to the time detection finished
+            assign_ids: Also set track_id on each detection
+        """
+        frame, detections, detect_time = await self.decode_and_detect(image)
+        if timestamp is None:
+            timestamp = time.time()
+        tracked = self.track(detections, timestamp, assign_ids)
+        return FrameResult(frame, detections, tracked, detect_time, timestamp)
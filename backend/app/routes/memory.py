@@ -228,18 +228,20 @@ async def get_person_photo(
     if not person:
         raise HTTPException(status_code=404, detail="Person not found")
     
-    if not person.get("has_face") or not person.get("photo_path"):
+    if not person.has_face or not person.photo_path:
         raise HTTPException(status_code=404, detail="No photo available for this person")
     
     from pathlib import Path
-    photo_path = Path(person["photo_path"])
+    photo_path = Path(person.photo_path)
     if not photo_path.exists():
         raise HTTPException(status_code=404, detail="Photo file not found")
     
+    # Reference photos are JPEG unless saved as WebP
+    is_webp = photo_path.suffix == ".webp"
     return FileResponse(
         photo_path,
-        media_type="image/jpeg",
-        filename=f"person_{person_id}.jpg"
+        media_type="image/webp" if is_webp else "image/jpeg",
+        filename=f"person_{person_id}{'.webp' if is_webp else '.jpg'}"
     )
 
 
@@ -271,11 +273,11 @@ async def get_interaction_audio(
     if not interaction:
         raise HTTPException(status_code=404, detail="Interaction not found")
     
-    if not interaction.get("audio_saved") or not interaction.get("audio_path"):
+    if not interaction.audio_saved or not interaction.audio_path:
         raise HTTPException(status_code=404, detail="Audio not saved for this interaction")
     
     from pathlib import Path
-    audio_path = Path(interaction["audio_path"])
+    audio_path = Path(interaction.audio_path)
     if not audio_path.exists():
         raise HTTPException(status_code=404, detail="Audio file not found")
     
@@ -16,7 +16,15 @@ def main():
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        # Ignored by uvicorn when reloading
+        workers=settings.workers,
         log_level=settings.log_level.lower(),
+        # uvicorn[standard] ships uvloop and httptools; "auto" picks them
+        # where available and falls back to asyncio/h11 (e.g. on Windows)
+        loop="auto",
+        http="auto",
+        # One log line per frame request adds up at live frame rates
+        access_log=settings.debug,
     )
 
 
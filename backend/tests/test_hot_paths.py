@@ -0,0 +1,280 @@
+"""
+Tests for the numeric kernels and request-path helpers whose regressions
+would be silent: scoring and gallery kernels against their fallbacks, LSH
+recall, int8 error, detection batching and the frame cache.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.agent import reasoning
+from app.memory import _kernel
+from app.memory.face_service import (
+    EMBEDDING_DIM,
+    LSH_MAX_HAMMING,
+    FaceGallery,
+    hamming_distances,
+    quantize_int8,
+    sign_hash,
+)
+from app.models import BoundingBox, Detection
+from app.perception import frame_cache
+from app.perception.batching import BatchingDetector
+from app.perception.frame_cache import FrameCache, frame_key
+
+
+def _unit_rows(rng: np.random.Generator, n: int) -> np.ndarray:
+    rows = rng.standard_normal((n, EMBEDDING_DIM)).astype(np.float32)
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+def _detection(label: str) -> Detection:
+    return Detection(
+        label=label,
+        confidence=0.9,
+        bbox=BoundingBox(x1=0.1, y1=0.1, x2=0.3, y2=0.5)
+    )
+
+
+# ============================================================================
+# Agent scoring kernel
+# ============================================================================
+
+def _scoring_inputs(n: int = 500):
+    """Random objects plus every threshold value the kernel branches on."""
+    rng = np.random.default_rng(0)
+    label_idx = rng.integers(0, reasoning.DEFAULT_LABEL_IDX + 1, n).astype(np.intp)
+    cx = rng.uniform(0.0, 1.0, n)
+    area = rng.uniform(0.0, 0.5, n)
+    vx = rng.normal(0.0, 0.05, n)
+    vy = rng.normal(0.0, 0.05, n)
+    approaching = rng.random(n) < 0.3
+    is_new = rng.random(n) < 0.3
+
+    edges = [0.35, 0.65, 0.30, 0.15, 0.05, 0.03]
+    cx[:len(edges)] = edges
+    area[:len(edges)] = edges
+    vx[:len(edges)] = edges
+    vy[:len(edges)] = [-e for e in edges]
+    return label_idx, cx, area, vx, vy, approaching, is_new, reasoning.CLASS_WEIGHT_LUT
+
+
+def test_score_numpy_matches_reference_loop():
+    inputs = _scoring_inputs()
+    loop_scores, loop_masks = reasoning._score_loop(*inputs)
+    np_scores, np_masks = reasoning._score_numpy(*inputs)
+
+    np.testing.assert_allclose(np_scores, loop_scores)
+    np.testing.assert_array_equal(np_masks, loop_masks)
+    assert np_masks.dtype == np.int64
+
+
+@pytest.mark.skipif(not reasoning.NUMBA_AVAILABLE, reason="numba not installed")
+def test_score_numba_matches_numpy():
+    inputs = _scoring_inputs()
+    nb_scores, nb_masks = reasoning._score_kernel(*inputs)
+    np_scores, np_masks = reasoning._score_numpy(*inputs)
+
+    np.testing.assert_allclose(nb_scores, np_scores)
+    np.testing.assert_array_equal(nb_masks, np_masks)
+
+
+def test_score_kernel_handles_empty_frame():
+    floats = np.empty(0, dtype=np.float64)
+    flags = np.empty(0, dtype=bool)
+    scores, masks = reasoning._score_kernel(
+        np.empty(0, dtype=np.intp), floats, floats, floats, floats,
+        flags, flags, reasoning.CLASS_WEIGHT_LUT
+    )
+    assert scores.shape == (0,)
+    assert masks.shape == (0,)
+
+
+# ============================================================================
+# Face gallery kernels
+# ============================================================================
+
+def test_best_match_matches_numpy_fallback():
+    rng = np.random.default_rng(1)
+    gallery = _unit_rows(rng, 300)
+    for unknown in _unit_rows(rng, 5):
+        idx, distance = _kernel.best_match(gallery, unknown)
+        ref_idx, ref_distance = _kernel._best_match_numpy(gallery, unknown)
+        assert int(idx) == ref_idx
+        assert float(distance) == pytest.approx(float(ref_distance), abs=1e-5)
+
+
+def test_best_match_loop_matches_numpy_fallback():
+    rng = np.random.default_rng(2)
+    gallery = _unit_rows(rng, 20)
+    unknown = gallery[13]
+    idx, distance = _kernel._best_match_loop(gallery, unknown)
+    assert idx == 13
+    assert float(distance) == pytest.approx(0.0, abs=1e-5)
+
+
+def test_int8_dots_match_numpy_fallback_at_extremes():
+    rng = np.random.default_rng(3)
+    codes = rng.integers(-128, 128, (64, EMBEDDING_DIM)).astype(np.int8)
+    codes[0] = -128
+    query = rng.integers(-128, 128, EMBEDDING_DIM).astype(np.int8)
+    query[:] = -128
+
+    expected = codes.astype(np.int64) @ query.astype(np.int64)
+    np.testing.assert_array_equal(_kernel.int8_dots(codes, query), expected)
+    np.testing.assert_array_equal(_kernel._int8_dots_numpy(codes, query), expected)
+    np.testing.assert_array_equal(_kernel._int8_dots_loop(codes[:4], query), expected[:4])
+
+
+# ============================================================================
+# Gallery approximations
+# ============================================================================
+
+def test_lsh_keeps_matches_at_the_match_threshold():
+    # Cosine similarity 0.6 is the 0.40 match threshold, the hardest case
+    rng = np.random.default_rng(4)
+    n = 2000
+    base = _unit_rows(rng, n)
+    noise = _unit_rows(rng, n)
+    noise -= (noise * base).sum(axis=1, keepdims=True) * base
+    noise /= np.linalg.norm(noise, axis=1, keepdims=True)
+    queries = 0.6 * base + 0.8 * noise
+
+    base_hashes = sign_hash(base)
+    query_hashes = sign_hash(queries)
+    distances = np.array([
+        hamming_distances(query_hashes[i], base_hashes[i:i + 1])[0] for i in range(n)
+    ])
+    assert (distances <= LSH_MAX_HAMMING).mean() >= 0.98
+
+
+def test_int8_similarities_track_float32():
+    rng = np.random.default_rng(5)
+    matrix = _unit_rows(rng, 4096)
+    codes, scales = quantize_int8(matrix)
+    gallery = FaceGallery(list(range(len(matrix))), None, codes, scales, None)
+
+    for unknown in _unit_rows(rng, 3):
+        error = np.abs(gallery.similarities(unknown) - matrix @ unknown)
+        assert error.max() < 5e-3
+
+    rows = np.array([5, 17, 4000])
+    np.testing.assert_allclose(
+        gallery.similarities(matrix[17], rows), matrix[rows] @ matrix[17], atol=5e-3
+    )
+
+
+# ============================================================================
+# Detection batching
+# ============================================================================
+
+class _FakeDetector:
+    """Labels each frame's detection with the frame's value; records batch sizes."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.batch_sizes = []
+
+    def detect_batch(self, images):
+        self.batch_sizes.append(len(images))
+        if self.fail:
+            raise ValueError("inference failed")
+        return [[_detection(str(int(image[0])))] for image in images], 1.0
+
+
+@pytest.mark.asyncio
+async def test_batching_detector_returns_results_in_submit_order():
+    detector = _FakeDetector()
+    batcher = BatchingDetector(detector, max_batch_size=4, max_wait_ms=20)
+    batcher.start()
+    try:
+        frames = [np.array([i]) for i in range(10)]
+        results = await asyncio.gather(*(batcher.submit(frame) for frame in frames))
+    finally:
+        await batcher.stop()
+
+    assert [detections[0].label for detections, _ in results] == [str(i) for i in range(10)]
+    assert sum(detector.batch_sizes) == 10
+    assert max(detector.batch_sizes) <= 4
+    assert len(detector.batch_sizes) < 10
+
+
+@pytest.mark.asyncio
+async def test_batching_detector_propagates_errors_and_recovers():
+    detector = _FakeDetector(fail=True)
+    batcher = BatchingDetector(detector, max_wait_ms=20)
+    batcher.start()
+    try:
+        results = await asyncio.gather(
+            *(batcher.submit(np.array([i])) for i in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+        detector.fail = False
+        detections, _ = await batcher.submit(np.array([7]))
+        assert detections[0].label == "7"
+    finally:
+        await batcher.stop()
+
+
+# ============================================================================
+# Frame cache
+# ============================================================================
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(frame_cache, "time", fake)
+    return fake
+
+
+def test_frame_cache_expires_entries_after_ttl(clock):
+    cache = FrameCache(maxsize=4, ttl=2.0)
+    frame = np.zeros((2, 2, 3), dtype=np.uint8)
+    cache.put("a", frame, [_detection("car")])
+
+    clock.now += 1.5
+    hit = cache.get("a")
+    assert hit is not None and hit[0] is frame
+
+    clock.now += 1.0
+    assert cache.get("a") is None
+    assert len(cache._entries) == 0
+
+
+def test_frame_cache_evicts_least_recently_used(clock):
+    cache = FrameCache(maxsize=2, ttl=10.0)
+    frame = np.zeros((2, 2, 3), dtype=np.uint8)
+    cache.put("a", frame, [])
+    cache.put("b", frame, [])
+    assert cache.get("a") is not None
+    cache.put("c", frame, [])
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_frame_cache_returns_copies(clock):
+    cache = FrameCache()
+    cache.put("a", np.zeros(1), [_detection("car")])
+    _, detections = cache.get("a")
+    detections[0].track_id = 5
+
+    _, detections = cache.get("a")
+    assert detections[0].track_id is None
+
+
+def test_frame_key_matches_for_str_and_bytes():
+    assert frame_key("aGVsbG8=") == frame_key(b"aGVsbG8=")
+    assert frame_key("aGVsbG8=") != frame_key("aGVsbG9=")